@@ -0,0 +1,4 @@
+"""
+Benchmarks del intérprete Gamer.
+Se ejecutan como módulos: python -m benchmarks.<nombre>
+"""
@@ -0,0 +1,46 @@
+"""
+Benchmark del arranque con la caché de compilación en disco.
+Compara compilar el script desde el texto con cargarlo de la caché.
+
+Uso:
+    python -m benchmarks.bench_cache [--lines 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import tempfile
+
+from benchmarks.bench_profiling import best_of
+from benchmarks.generator import generate_program
+from interprete.interpreter import Interpreter
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--lines", type=int, default=100000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.gamer")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(generate_program(args.lines, seed=0)) + "\n")
+        Interpreter().compile_file(path, optimize=False)  # Llena la caché.
+
+        cold, warm = best_of([
+            lambda: Interpreter().compile_file(path, optimize=False, use_cache=False),
+            lambda: Interpreter().compile_file(path, optimize=False),
+        ], args.repeat)
+        size = os.path.getsize(path)
+        cached = sum(os.path.getsize(os.path.join(root, name))
+                     for root, _, names in os.walk(os.path.join(tmp, "__gamercache__"))
+                     for name in names)
+
+    print(f"script          : {size / 1e6:8.2f} MB, {args.lines} líneas")
+    print(f"caché           : {cached / 1e6:8.2f} MB")
+    print(f"sin caché (frío): {cold * 1e3:8.2f} ms")
+    print(f"con caché       : {warm * 1e3:8.2f} ms ({cold / warm:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
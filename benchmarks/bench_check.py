@@ -0,0 +1,43 @@
+"""
+Benchmark de la verificación en paralelo (python -m interprete check).
+Mide el rendimiento de check_file con distinto número de procesos.
+
+Uso:
+    python -m benchmarks.bench_check [--mb 64] [--jobs 1 2 4 8]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.bench_lexer import make_script
+from interprete.check import check_file
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--mb", type=float, default=64)
+    ap.add_argument("--jobs", type=int, nargs="+",
+                    default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    ap.add_argument("--chunk-mb", type=float, default=8)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.gamer")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(make_script(int(args.mb * 1e6), seed=0)) + "\n")
+        size = os.path.getsize(path)
+
+        base = None
+        for jobs in args.jobs:
+            start = time.perf_counter()
+            errors = sum(1 for _ in check_file(path, jobs, int(args.chunk_mb * (1 << 20))))
+            elapsed = time.perf_counter() - start
+            base = base or elapsed
+            print(f"{jobs:3d} procesos: {elapsed:7.2f} s, {size / 1e6 / elapsed:7.1f} MB/s, "
+                  f"aceleración {base / elapsed:4.2f}x ({errors} errores)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark del motor "python" (interprete.codegen) frente al de referencia.
+Mide la traducción (una vez por programa) y las ejecuciones repetidas.
+
+Uso:
+    python -m benchmarks.bench_codegen [--lines 20000] [--repeat 10]
+"""
+
+import argparse
+from time import perf_counter
+
+from benchmarks.bench_profiling import best_of
+from benchmarks.generator import generate_program
+from interprete.interpreter import Interpreter
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--lines", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=10)
+    args = ap.parse_args()
+
+    source = "\n".join(generate_program(args.lines, seed=0))
+    reference = Interpreter()
+    python = Interpreter(backend="python")
+    reference_program = reference.compile(source)
+    python_program = python.compile(source)
+
+    start = perf_counter()
+    python.run(python_program, mode="quiet")
+    python.run(python_program, mode="result")
+    first = perf_counter() - start
+
+    for mode in ("quiet", "result"):
+        ref, gen = best_of([lambda: reference.run(reference_program, mode=mode),
+                            lambda: python.run(python_program, mode=mode)], args.repeat)
+        print(f"run {mode:<6}, referencia: {ref * 1e3:8.2f} ms")
+        print(f"run {mode:<6}, python    : {gen * 1e3:8.2f} ms ({ref / gen:.2f}x)")
+    print(f"traducción (ambos modos) : {first * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark de Interpreter.fork() frente a reconstruir cada variante.
+Parte de un estado base con N variables y crea variantes que cambian unas
+pocas: con fork(), con un intérprete nuevo que repite los `crear` y copiando
+el diccionario de variables.
+
+Uso:
+    python -m benchmarks.bench_fork [--variables 20000] [--variants 50] [--repeat 3]
+"""
+
+import argparse
+import tracemalloc
+
+from benchmarks.bench_profiling import best_of
+from interprete.interpreter import Interpreter
+
+WHAT_IF = "crear v1 = 500\ncrear v2 = 3\nmultiplicar v1 v2\njefe v1 v2 v3\n"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--variables", type=int, default=20000)
+    ap.add_argument("--variants", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    setup = "\n".join(f"crear v{i} = {i}" for i in range(args.variables))
+    base = Interpreter()
+    setup_program = base.compile(setup, optimize=False)
+    base.run(setup_program, "quiet")
+    what_if = base.compile(WHAT_IF)
+
+    def with_fork():
+        for _ in range(args.variants):
+            base.fork().run(what_if, "quiet")
+
+    def with_replay():
+        for _ in range(args.variants):
+            interp = Interpreter()
+            interp.run(setup_program, "quiet")
+            interp.run(what_if, "quiet")
+
+    def with_copy():
+        state = dict(base.variables)
+        for _ in range(args.variants):
+            interp = Interpreter()
+            interp.variables = state
+            interp.run(what_if, "quiet")
+
+    fork_time, replay_time, copy_time = best_of(
+        [with_fork, with_replay, with_copy], args.repeat)
+
+    tracemalloc.start()
+    children = [base.fork() for _ in range(args.variants)]
+    for child in children:
+        child.run(what_if, "quiet")
+    fork_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    per_variant = 1e3 / args.variants
+    print(f"variantes              : {args.variants} sobre {args.variables:,} variables")
+    print(f"fork()                 : {fork_time * per_variant:10.3f} ms/variante")
+    print(f"intérprete + crear     : {replay_time * per_variant:10.3f} ms/variante "
+          f"({replay_time / fork_time:,.0f}x)")
+    print(f"intérprete + variables : {copy_time * per_variant:10.3f} ms/variante "
+          f"({copy_time / fork_time:,.0f}x)")
+    print(f"memoria, fork()        : {fork_memory / args.variants / 1024:10.1f} KiB/variante")
+
+
+if __name__ == "__main__":
+    main()
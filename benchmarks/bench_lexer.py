@@ -0,0 +1,97 @@
+"""
+Benchmark del lexer: tokens por segundo sobre un script de varios megabytes.
+Compara el lexer de una sola pasada con la implementación anterior.
+
+Uso:
+    python -m benchmarks.bench_lexer [--mb 4]
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import List, Tuple
+
+from interprete.keywords import KEYWORDS
+from interprete.lexer import Lexer
+
+
+class LegacyLexer:
+    """
+    Copia del lexer anterior (findall + varios fullmatch por palabra).
+    Solo se conserva como referencia para medir.
+    """
+
+    def tokenize(self, instruction: str) -> List[Tuple[str, str]]:
+        tokens = []
+        words = re.findall(r'"[^"]*"|\S+', instruction)
+        for word in words:
+            w = word.lower()
+            if w == "=":
+                tokens.append(("IGUAL", "="))
+            elif re.fullmatch(r'-?\d+', w):
+                tokens.append(("NUMERO", w))
+            elif re.fullmatch(r'-?\d+\.\d+', w):
+                tokens.append(("DECIMAL", w))
+            elif w in KEYWORDS:
+                tokens.append(("KEYWORD", w))
+            elif re.fullmatch(r'"[^"]*"', word):
+                tokens.append(("CADENA", word.strip('"')))
+            elif w.isidentifier():
+                tokens.append(("IDENTIFICADOR", w))
+            else:
+                tokens.append(("DESCONOCIDO", w))
+        return tokens
+
+
+def make_script(size_bytes: int, seed: int = 1234) -> List[str]:
+    """
+    Genera líneas Gamer variadas hasta alcanzar aproximadamente size_bytes.
+    """
+    rng = random.Random(seed)
+    names = [f"var{i}" for i in range(200)]
+    lines = []
+    total = 0
+    while total < size_bytes:
+        kind = rng.randrange(5)
+        if kind == 0:
+            line = f"crear {rng.choice(names)} = {rng.randint(-1000, 1000)}"
+        elif kind == 1:
+            line = f"crear {rng.choice(names)} = {rng.uniform(-100, 100):.3f}"
+        elif kind == 2:
+            line = f'crear {rng.choice(names)} = "jugador {rng.randint(0, 99)}"'
+        elif kind == 3:
+            line = f"curar {rng.choice(names)} {rng.choice(names)}"
+        else:
+            line = "jefe " + " ".join(rng.choice(names) for _ in range(rng.randint(2, 12)))
+        lines.append(line)
+        total += len(line) + 1
+    return lines
+
+
+def measure(tokenize, lines: List[str]) -> Tuple[int, float]:
+    start = time.perf_counter()
+    count = 0
+    for line in lines:
+        count += len(tokenize(line))
+    return count, time.perf_counter() - start
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--mb", type=float, default=4.0, help="Tamaño del script en MB")
+    args = ap.parse_args()
+
+    lines = make_script(int(args.mb * 1024 * 1024))
+    lexers = [("anterior", LegacyLexer().tokenize), ("una pasada", Lexer().tokenize)]
+    results = {}
+    for name, tokenize in lexers:
+        count, elapsed = measure(tokenize, lines)
+        results[name] = count / elapsed
+        print(f"{name:>12}: {count} tokens en {elapsed:.3f} s "
+              f"({results[name]:,.0f} tokens/s)")
+    print(f"Aceleración: {results['una pasada'] / results['anterior']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
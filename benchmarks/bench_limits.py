@@ -0,0 +1,41 @@
+"""
+Benchmark del costo de los límites de recursos en Interpreter.run.
+Compara un intérprete sin límites con el mismo intérprete y programa
+aplicando todos los límites (con dos intérpretes y dos programas, la
+diferencia de memoria entre ambos ya mueve el resultado varios puntos).
+
+Uso:
+    python -m benchmarks.bench_limits [--lines 20000] [--repeat 15]
+"""
+
+import argparse
+
+from benchmarks.bench_profiling import best_of
+from benchmarks.generator import generate_program
+from interprete.interpreter import Interpreter
+from interprete.limits import Limits
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--lines", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=15)
+    args = ap.parse_args()
+
+    limits = Limits(max_instructions=10 * args.lines, max_bits=1 << 20,
+                    max_string=1 << 16, timeout=60.0)
+    interp = Interpreter()
+    program = interp.compile("\n".join(generate_program(args.lines, seed=0)))
+
+    def run(active):
+        interp.limits = active
+        interp.run(program, mode="quiet")
+
+    off, on = best_of([lambda: run(None), lambda: run(limits)], args.repeat)
+
+    print(f"run, sin límites : {off * 1e3:8.2f} ms")
+    print(f"run, con límites : {on * 1e3:8.2f} ms ({(on / off - 1) * 100:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark de los bucles repetir ... fin frente al mismo script desenrollado.
+Compara el tamaño del script, la compilación y la ejecución de ambas formas.
+
+Uso:
+    python -m benchmarks.bench_loops [--count 100000] [--repeat 5]
+"""
+
+import argparse
+
+from benchmarks.bench_profiling import best_of
+from interprete.interpreter import Interpreter
+
+BODY = [
+    "crear x = 7",
+    "multiplicar x 3",
+    "curar x 1",
+    "xp x",
+]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--count", type=int, default=100000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    unrolled = "\n".join(BODY * args.count)
+    looped = "\n".join([f"repetir {args.count}", *BODY, "fin"])
+
+    interp = Interpreter()
+    compile_unrolled, compile_looped = best_of(
+        [lambda: interp.compile(unrolled), lambda: interp.compile(looped)], args.repeat)
+    unrolled_program = interp.compile(unrolled)
+    looped_program = interp.compile(looped)
+    run_unrolled, run_looped = best_of(
+        [lambda: interp.run(unrolled_program, mode="quiet"),
+         lambda: interp.run(looped_program, mode="quiet")], args.repeat)
+
+    print(f"tamaño, desenrollado : {len(unrolled.encode()):>12,} bytes")
+    print(f"tamaño, repetir      : {len(looped.encode()):>12,} bytes")
+    print(f"compile, desenrollado: {compile_unrolled * 1e3:10.2f} ms")
+    print(f"compile, repetir     : {compile_looped * 1e3:10.2f} ms "
+          f"({compile_unrolled / compile_looped:,.0f}x)")
+    print(f"run, desenrollado    : {run_unrolled * 1e3:10.2f} ms")
+    print(f"run, repetir         : {run_looped * 1e3:10.2f} ms "
+          f"({run_unrolled / run_looped:.2f}x)")
+    total_unrolled = compile_unrolled + run_unrolled
+    total_looped = compile_looped + run_looped
+    print(f"total (compile + run): {total_unrolled / total_looped:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark del costo de llamar a una misión frente al mismo código en línea.
+Ejecuta N veces un cuerpo corto, dentro de una misión (con `llamar`) y
+escrito directamente en el bucle, y muestra el costo extra por llamada.
+
+Uso:
+    python -m benchmarks.bench_missions [--count 100000] [--repeat 5]
+"""
+
+import argparse
+
+from benchmarks.bench_profiling import best_of
+from interprete.interpreter import Interpreter
+
+BODY = [
+    "crear r = v",
+    "curar r 1",
+    "xp r",
+]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--count", type=int, default=100000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    inline = "\n".join(["crear v = 7", f"repetir {args.count}", *BODY, "fin"])
+    called = "\n".join(["mision paso v", *BODY, "regresar r", "fin",
+                        "crear v = 7", f"repetir {args.count}",
+                        "crear y = llamar paso v", "fin"])
+
+    interp = Interpreter()
+    inline_program = interp.compile(inline)
+    called_program = interp.compile(called)
+    run_inline, run_called = best_of(
+        [lambda: interp.run(inline_program, mode="quiet"),
+         lambda: interp.run(called_program, mode="quiet")], args.repeat)
+
+    overhead = (run_called - run_inline) / args.count
+    print(f"run, en línea   : {run_inline * 1e3:10.2f} ms")
+    print(f"run, con llamar : {run_called * 1e3:10.2f} ms ({run_called / run_inline:.2f}x)")
+    print(f"costo por llamada: {overhead * 1e9:9.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark de memoria de la carga de scripts con mmap (interprete.loader).
+Ejecuta un script grande línea a línea y muestrea la memoria residente (RSS):
+debe mantenerse plana aunque el archivo sea mayor que la RAM disponible.
+
+Uso:
+    python -m benchmarks.bench_mmap [--mb 1024] [--path script.gamer] [--keep]
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+from benchmarks.generator import generate_program
+from interprete.cli import run_stream
+from interprete.interpreter import Interpreter
+from interprete.loader import mmap_lines
+
+# Cada cuántas líneas se mide la memoria residente.
+SAMPLE_EVERY = 100_000
+
+
+def rss_bytes() -> int:
+    """
+    Memoria residente actual del proceso (Linux); si no hay /proc, el pico.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def write_script(path: str, size_bytes: int) -> None:
+    # El archivo se escribe repitiendo un bloque, sin tenerlo entero en memoria.
+    block = ("\n".join(generate_program(50_000, seed=0)) + "\n").encode("utf-8")
+    with open(path, "wb") as f:
+        written = 0
+        while written < size_bytes:
+            f.write(block)
+            written += len(block)
+
+
+def sampled(lines, samples):
+    for count, line in enumerate(lines, start=1):
+        if not count % SAMPLE_EVERY:
+            samples.append(rss_bytes())
+        yield line
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--mb", type=float, default=1024, help="Tamaño del script generado.")
+    ap.add_argument("--path", default=None, help="Script existente (no se genera ninguno).")
+    ap.add_argument("--keep", action="store_true", help="No borra el script generado.")
+    args = ap.parse_args()
+
+    path = args.path
+    if path is None:
+        fd, path = tempfile.mkstemp(suffix=".gamer")
+        os.close(fd)
+        write_script(path, int(args.mb * 1e6))
+    try:
+        size = os.path.getsize(path)
+        samples = [rss_bytes()]
+        start = time.perf_counter()
+        with open(os.devnull, "w") as null:
+            errors = run_stream(sampled(mmap_lines(path), samples), Interpreter(),
+                                null, null, quiet=True)
+        elapsed = time.perf_counter() - start
+        samples.append(rss_bytes())
+    finally:
+        if args.path is None and not args.keep:
+            os.remove(path)
+
+    mb = 1 << 20
+    print(f"script       : {size / mb:10.1f} MiB ({errors} líneas con error)")
+    print(f"tiempo       : {elapsed:10.2f} s ({size / mb / elapsed:.1f} MiB/s)")
+    print(f"RSS inicial  : {samples[0] / mb:10.1f} MiB")
+    print(f"RSS máxima   : {max(samples) / mb:10.1f} MiB")
+    print(f"RSS final    : {samples[-1] / mb:10.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
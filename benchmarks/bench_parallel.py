@@ -0,0 +1,57 @@
+"""
+Benchmark de la ejecución en paralelo (interprete.parallel.ParallelRunner).
+Compara Interpreter.run con ParallelRunner sobre un script con potencias
+grandes independientes entre asignaciones baratas, y mide el costo añadido
+en un script sin instrucciones costosas.
+
+Uso:
+    python -m benchmarks.bench_parallel [--powers 16] [--exponent 400000] [--jobs 1 2 4]
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.bench_profiling import best_of
+from interprete.interpreter import Interpreter
+from interprete.parallel import ParallelRunner
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--powers", type=int, default=16)
+    ap.add_argument("--exponent", type=int, default=400000)
+    ap.add_argument("--cheap", type=int, default=20000,
+                    help="Instrucciones del script sin instrucciones costosas.")
+    ap.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    heavy = "\n".join(f"crear b{i} = {i + 3}\nmultiplicar b{i} 2\npoder b{i} {args.exponent}"
+                      for i in range(args.powers))
+    cheap = "\n".join(f"crear c{i % 50} = {i}\ncurar c{i % 50} 1" for i in range(args.cheap // 2))
+
+    interp = Interpreter()
+    heavy_program = interp.compile(heavy)
+    cheap_program = interp.compile(cheap)
+    serial_heavy, serial_cheap = best_of(
+        [lambda: interp.run(heavy_program, "quiet"), lambda: interp.run(cheap_program, "quiet")],
+        args.repeat)
+
+    print(f"potencias               : {args.powers} x {args.exponent:,} de exponente")
+    print(f"Interpreter.run         : {serial_heavy * 1e3:10.1f} ms")
+    for jobs in args.jobs:
+        with ProcessPoolExecutor(jobs) as pool:
+            runner = ParallelRunner(interp, pool, max_pending=2 * jobs)
+            runner.run(heavy_program, "quiet")  # Arranque de los procesos.
+            (parallel,) = best_of([lambda: runner.run(heavy_program, "quiet")], args.repeat)
+        print(f"ParallelRunner, {jobs:2} proc.: {parallel * 1e3:10.1f} ms "
+              f"({serial_heavy / parallel:.2f}x)")
+
+    with ParallelRunner(interp) as runner:
+        (inline,) = best_of([lambda: runner.run(cheap_program, "quiet")], args.repeat)
+    print(f"sin costosas ({args.cheap:,} instr.): {serial_cheap * 1e3:.1f} ms en serie, "
+          f"{inline * 1e3:.1f} ms con ParallelRunner")
+
+
+if __name__ == "__main__":
+    main()
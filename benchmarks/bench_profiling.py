@@ -0,0 +1,74 @@
+"""
+Benchmark del costo del perfilado en Interpreter.run y eval_instruction.
+Compara el perfilado desactivado con un bucle de referencia sin instrumentar.
+
+Uso:
+    python -m benchmarks.bench_profiling [--lines 20000] [--repeat 15]
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from benchmarks.generator import generate_program
+from interprete.interpreter import Interpreter
+
+
+def best_of(funcs: List[Callable[[], object]], repeat: int) -> List[float]:
+    """
+    Mejor tiempo de cada función; se alternan para repartir el ruido.
+    """
+    best = [float("inf")] * len(funcs)
+    for _ in range(repeat):
+        for i, func in enumerate(funcs):
+            start = time.perf_counter()
+            func()
+            best[i] = min(best[i], time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--lines", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=15)
+    args = ap.parse_args()
+
+    lines = generate_program(args.lines, seed=0)
+    interp = Interpreter()
+    program = interp.compile("\n".join(lines))
+
+    def reference() -> None:
+        # Bucle mínimo: el mismo trabajo que run(program, "result") sin
+        # ninguna comprobación. Las ejecuciones medidas tampoco formatean
+        # los resultados como texto.
+        results = []
+        for instr in program.instructions:
+            results.append(instr.handler(interp, instr.operands))
+
+    def eval_all() -> None:
+        for line in lines:
+            interp.eval_instruction(line)
+
+    def run_profiled() -> None:
+        interp.enable_profiling()
+        interp.run(program, "result")
+        interp.disable_profiling()
+
+    def eval_profiled() -> None:
+        interp.enable_profiling()
+        eval_all()
+        interp.disable_profiling()
+
+    ref, off, on = best_of([reference, lambda: interp.run(program, "result"), run_profiled],
+                           args.repeat)
+    eval_off, eval_on = best_of([eval_all, eval_profiled], args.repeat)
+
+    print(f"run, bucle de referencia : {ref * 1e3:8.2f} ms")
+    print(f"run, perfilado apagado   : {off * 1e3:8.2f} ms ({(off / ref - 1) * 100:+.1f}%)")
+    print(f"run, perfilado activo    : {on * 1e3:8.2f} ms ({(on / ref - 1) * 100:+.1f}%)")
+    print(f"eval, perfilado apagado  : {eval_off * 1e3:8.2f} ms")
+    print(f"eval, perfilado activo   : {eval_on * 1e3:8.2f} ms ({(eval_on / eval_off - 1) * 100:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Prueba de carga del servidor de sesiones en localhost.
+Abre muchas sesiones concurrentes, cada una con un script corto enviado
+instrucción a instrucción, y reporta sesiones por segundo y la latencia p99.
+
+Uso:
+    python -m benchmarks.bench_server [--sessions 2000] [--concurrency 100]
+        [--lines 20] [--pipeline] [--host H --port P]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List, Optional
+
+from benchmarks.generator import generate_program
+from interprete.server import SessionServer
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_session(host: str, port: int, lines: List[str], pipeline: bool,
+                      latencies: List[float]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        if pipeline:
+            # Todo el script de una vez; la latencia es hasta cada respuesta.
+            start = time.perf_counter()
+            writer.write("".join(line + "\n" for line in lines).encode("utf-8"))
+            for _ in lines:
+                await reader.readline()
+                latencies.append(time.perf_counter() - start)
+        else:
+            for line in lines:
+                start = time.perf_counter()
+                writer.write(line.encode("utf-8") + b"\n")
+                await reader.readline()
+                latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def load_test(host: str, port: int, sessions: int, concurrency: int,
+                    lines: int, pipeline: bool) -> dict:
+    """
+    Ejecuta la prueba de carga y devuelve las métricas.
+    """
+    scripts = [generate_program(lines, seed=i, max_list=10) for i in range(min(sessions, 64))]
+    latencies: List[float] = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with gate:
+            await run_session(host, port, scripts[i % len(scripts)], pipeline, latencies)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+    return {
+        "sessions": sessions,
+        "seconds": elapsed,
+        "sessions_per_second": sessions / elapsed,
+        "instructions_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+    }
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    server: Optional[SessionServer] = None
+    host, port = args.host, args.port
+    if port is None:
+        # Sin dirección se levanta un servidor en este mismo proceso.
+        server = SessionServer()
+        listener = await server.start_tcp(host, 0)
+        port = listener.sockets[0].getsockname()[1]
+    try:
+        return await load_test(host, port, args.sessions, args.concurrency,
+                               args.lines, args.pipeline)
+    finally:
+        if server is not None:
+            await server.close()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sessions", type=int, default=2000)
+    ap.add_argument("--concurrency", type=int, default=100)
+    ap.add_argument("--lines", type=int, default=20)
+    ap.add_argument("--pipeline", action="store_true",
+                    help="Envía cada script completo sin esperar respuestas.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=None,
+                    help="Puerto de un servidor ya iniciado (python -m interprete serve).")
+    args = ap.parse_args()
+
+    report = asyncio.run(_main(args))
+    print(f"sesiones          : {report['sessions']} en {report['seconds']:.2f} s")
+    print(f"sesiones/s        : {report['sessions_per_second']:10.1f}")
+    print(f"instrucciones/s   : {report['instructions_per_second']:10.1f}")
+    print(f"latencia p50      : {report['p50_ms']:8.3f} ms")
+    print(f"latencia p99      : {report['p99_ms']:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark de las instantáneas de sesión (interprete.snapshot).
+Guarda un estado con N variables (enteros, decimales y algunos enteros
+grandes) y mide el tamaño del archivo, el tiempo de guardar y el de
+restaurar, frente a pickle del diccionario de variables y a reconstruir el
+estado repitiendo los `crear`.
+
+Uso:
+    python -m benchmarks.bench_snapshot [--variables 100000] [--repeat 3]
+"""
+
+import argparse
+import os
+import pickle
+import tempfile
+
+from benchmarks.bench_profiling import best_of
+from interprete.interpreter import Interpreter
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--variables", type=int, default=100000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    def value(i):
+        if i % 100 == 0:
+            return 3 ** 200 + i
+        return i if i % 2 else i / 4
+
+    state = {f"v{i}": value(i) for i in range(args.variables)}
+    setup = Interpreter().compile(
+        "\n".join(f"crear {name} = {number}" for name, number in state.items()),
+        optimize=False)
+    interp = Interpreter()
+    interp.variables = state
+
+    with tempfile.TemporaryDirectory() as tmp:
+        image = os.path.join(tmp, "estado.gms")
+        pickled = os.path.join(tmp, "estado.pkl")
+
+        def save_snapshot():
+            interp.snapshot(image)
+
+        def save_pickle():
+            with open(pickled, "wb") as f:
+                pickle.dump(dict(interp.variables), f, pickle.HIGHEST_PROTOCOL)
+
+        def restore_snapshot():
+            Interpreter().restore(image)
+
+        def restore_pickle():
+            with open(pickled, "rb") as f:
+                Interpreter().variables = pickle.load(f)
+
+        def replay():
+            Interpreter().run(setup, "quiet")
+
+        save_time, pickle_save = best_of([save_snapshot, save_pickle], args.repeat)
+        restore_time, pickle_restore, replay_time = best_of(
+            [restore_snapshot, restore_pickle, replay], args.repeat)
+        image_size, pickle_size = os.path.getsize(image), os.path.getsize(pickled)
+
+    print(f"variables               : {args.variables:,}")
+    print(f"tamaño instantánea      : {image_size / 1024:10.1f} KiB "
+          f"(pickle: {pickle_size / 1024:.1f} KiB)")
+    print(f"guardar                 : {save_time * 1e3:10.1f} ms "
+          f"(pickle: {pickle_save * 1e3:.1f} ms)")
+    print(f"restaurar               : {restore_time * 1e3:10.1f} ms")
+    print(f"pickle + variables      : {pickle_restore * 1e3:10.1f} ms "
+          f"({pickle_restore / restore_time:.1f}x)")
+    print(f"repetir los crear       : {replay_time * 1e3:10.1f} ms "
+          f"({replay_time / restore_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
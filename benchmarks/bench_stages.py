@@ -0,0 +1,126 @@
+"""
+Benchmark por etapas: lexer, parser, semántico, eval_instruction y compile/run.
+Reporta rendimiento, percentiles de latencia y memoria pico en JSON.
+
+Uso:
+    python -m benchmarks.bench_stages --lines 20000 --seed 1 --output base.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from benchmarks.generator import generate_program
+from interprete.interpreter import Interpreter
+from interprete.lexer import Lexer
+from interprete.parser import Parser
+from interprete.semantic import SemanticAnalyzer
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def measure_stage(func: Callable, inputs: List) -> Dict[str, float]:
+    """
+    Ejecuta func sobre cada entrada, midiendo latencia por llamada y memoria pico.
+    """
+    latencies = []
+    clock = time.perf_counter
+    start = clock()
+    for item in inputs:
+        t0 = clock()
+        func(item)
+        latencies.append(clock() - t0)
+    total = clock() - start
+
+    # La memoria se mide en una segunda pasada: tracemalloc altera los tiempos.
+    tracemalloc.start()
+    for item in inputs:
+        func(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "items": len(inputs),
+        "seconds": total,
+        "items_per_second": len(inputs) / total if total else 0.0,
+        "p50_us": percentile(latencies, 50) * 1e6,
+        "p90_us": percentile(latencies, 90) * 1e6,
+        "p99_us": percentile(latencies, 99) * 1e6,
+        "max_us": latencies[-1] * 1e6 if latencies else 0.0,
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_benchmarks(program: List[str], repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    lexer = Lexer()
+    parser = Parser()
+    semantic = SemanticAnalyzer()
+    tokens = [lexer.tokenize(line) for line in program]
+
+    results = {
+        "lexer": measure_stage(lexer.tokenize, program),
+        "parser": measure_stage(parser.parse, tokens),
+        "semantic": measure_stage(semantic.analyze, tokens),
+    }
+
+    interp = Interpreter()
+    results["eval_instruction"] = measure_stage(interp.eval_instruction, program)
+
+    # Programa completo: compilar una vez y ejecutar varias veces. Aquí cada
+    # elemento es el programa entero; lines_per_second lo normaliza por línea.
+    source = "\n".join(program)
+    compiled = Interpreter().compile(source)
+    results["compile"] = measure_stage(lambda s: Interpreter().compile(s), [source] * repeat)
+    results["run"] = measure_stage(Interpreter().run, [compiled] * repeat)
+    for stage in ("compile", "run"):
+        results[stage]["lines_per_second"] = results[stage]["items_per_second"] * len(program)
+    return results
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--lines", type=int, default=20000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--identifiers", type=int, default=100)
+    ap.add_argument("--string-ratio", type=float, default=0.1)
+    ap.add_argument("--max-list", type=int, default=8,
+                    help="Máximo de argumentos en jefe/esbirro")
+    ap.add_argument("--mix", type=json.loads, default=None,
+                    help='Pesos por comando en JSON, p. ej. \'{"crear": 1, "poder": 3}\'')
+    ap.add_argument("--repeat", type=int, default=5,
+                    help="Repeticiones del programa completo en compile/run")
+    ap.add_argument("--output", help="Archivo JSON de salida (por defecto, stdout)")
+    args = ap.parse_args()
+
+    params = {
+        "lines": args.lines, "seed": args.seed, "mix": args.mix,
+        "identifiers": args.identifiers, "string_ratio": args.string_ratio,
+        "max_list": args.max_list,
+    }
+    program = generate_program(**params)
+    report = {
+        "params": params,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "stages": run_benchmarks(program, args.repeat),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
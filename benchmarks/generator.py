@@ -0,0 +1,94 @@
+"""
+Generador reproducible de programas Gamer sintéticos para benchmarks.
+Con la misma semilla y parámetros siempre produce el mismo programa.
+"""
+
+import random
+from typing import Dict, List, Optional
+
+# Mezcla de comandos por defecto (pesos relativos).
+DEFAULT_MIX: Dict[str, float] = {
+    "crear": 30,
+    "curar": 10,
+    "golpear": 10,
+    "multiplicar": 8,
+    "dividir": 6,
+    "poder": 4,
+    "revivir": 4,
+    "xp": 4,
+    "jefe": 6,
+    "esbirro": 6,
+    "decir": 12,
+}
+
+
+def generate_program(lines: int = 1000, seed: int = 0,
+                     mix: Optional[Dict[str, float]] = None,
+                     identifiers: int = 100, string_ratio: float = 0.1,
+                     max_list: int = 8) -> List[str]:
+    """
+    Genera un programa válido de `lines` líneas.
+
+    Args:
+        lines: Número de instrucciones.
+        seed: Semilla del generador.
+        mix: Pesos relativos por comando (por defecto DEFAULT_MIX).
+        identifiers: Número de identificadores distintos.
+        string_ratio: Proporción de `crear` que asignan una cadena.
+        max_list: Máximo de argumentos en `jefe`/`esbirro`.
+
+    Las variables se crean antes de usarse y las operaciones numéricas solo
+    reciben variables numéricas, así que el programa se ejecuta sin errores.
+    """
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    commands = list(mix)
+    weights = [mix[c] for c in commands]
+    names = [f"v{i}" for i in range(identifiers)]
+    numeric: List[str] = []
+    numeric_set = set()
+    strings: List[str] = []
+
+    def define() -> str:
+        name = rng.choice(names)
+        if rng.random() < string_ratio:
+            if name in numeric_set:
+                numeric_set.discard(name)
+                numeric.remove(name)
+            strings.append(name)
+            return f'crear {name} = "jugador {rng.randint(0, 999)}"'
+        if name not in numeric_set:
+            numeric_set.add(name)
+            numeric.append(name)
+        if rng.random() < 0.5:
+            return f"crear {name} = {rng.randint(1, 1000)}"
+        return f"crear {name} = {rng.uniform(1, 1000):.3f}"
+
+    def value() -> str:
+        if rng.random() < 0.3:
+            return str(rng.randint(1, 100))
+        return rng.choice(numeric)
+
+    program = []
+    while len(program) < lines:
+        cmd = rng.choices(commands, weights)[0]
+        if cmd == "crear" or not numeric:
+            program.append(define())
+        elif cmd in ("curar", "golpear", "multiplicar"):
+            program.append(f"{cmd} {value()} {value()}")
+        elif cmd == "dividir":
+            program.append(f"dividir {value()} {rng.randint(1, 100)}")
+        elif cmd == "poder":
+            program.append(f"poder {value()} {rng.randint(0, 3)}")
+        elif cmd == "revivir":
+            # Solo valores positivos: todos los crear numéricos generan >= 1.
+            program.append(f"revivir {rng.choice(numeric)}")
+        elif cmd == "xp":
+            program.append(f"xp {rng.choice(numeric)}")
+        elif cmd in ("jefe", "esbirro"):
+            count = rng.randint(1, max(1, max_list))
+            args = " ".join(rng.choice(numeric) for _ in range(count))
+            program.append(f"{cmd} {args}")
+        else:
+            program.append(f"decir {rng.choice(numeric + strings)}")
+    return program
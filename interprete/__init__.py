@@ -0,0 +1,2 @@
+# Versión del intérprete; forma parte de la clave de la caché de compilación.
+__version__ = "1.0.0"
@@ -0,0 +1,10 @@
+"""
+Permite ejecutar el paquete como módulo: python -m interprete run script.gamer
+"""
+
+import sys
+
+from interprete.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
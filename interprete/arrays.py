@@ -0,0 +1,112 @@
+"""
+Módulo de arreglos para el intérprete Gamer.
+Soporte opcional de variables tipo arreglo respaldadas por NumPy.
+"""
+
+import operator
+import re
+from typing import Any, Callable, List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él solo hay valores escalares.
+    np = None
+
+# Tipos considerados arreglo; vacío si NumPy no está instalado.
+ARRAY_TYPES: tuple = (np.ndarray,) if np is not None else ()
+
+_SEPARATOR = re.compile(r'[\s,]+')
+
+
+def parse_array(text: str) -> Any:
+    """
+    Convierte un literal de lista como "[1, 2, 3]" en un arreglo de NumPy.
+
+    Raises:
+        ValueError si NumPy no está disponible o algún elemento no es número.
+    """
+    if np is None:
+        raise ValueError("Los arreglos requieren tener NumPy instalado.")
+    items = [item for item in _SEPARATOR.split(text[1:-1].strip()) if item]
+    values: List[Any] = []
+    for item in items:
+        try:
+            values.append(int(item))
+        except ValueError:
+            try:
+                values.append(float(item))
+            except ValueError:
+                raise ValueError(f"Elemento de lista no válido: {item}")
+    try:
+        if values and all(isinstance(v, int) for v in values):
+            return np.array(values, dtype=np.int64)
+        return np.array(values, dtype=np.float64)
+    except OverflowError:
+        raise ValueError("Elemento de lista fuera de rango.")
+
+
+def is_numeric_array(value: Any) -> bool:
+    return isinstance(value, ARRAY_TYPES) and value.dtype.kind in "iuf"
+
+
+def power(a: Any, b: Any) -> Any:
+    """
+    Potencia elemento a elemento. Los exponentes enteros negativos pasan a
+    flotante, igual que con enteros de Python (2 ** -1 == 0.5).
+    """
+    exponent = np.asarray(b)
+    if exponent.dtype.kind in "iu" and (exponent < 0).any():
+        a = np.asarray(a, dtype=np.float64)
+    return np.power(a, b)
+
+
+def elementwise(function: Callable[..., Any], *operands: Any) -> Any:
+    """
+    Aplica una operación de Python que sirve con arreglos y con números
+    (operator.add, operator.sub, operator.mul, operator.pow o abs) a
+    operandos entre los que hay algún arreglo.
+
+    NumPy da la vuelta en silencio con los enteros de 64 bits; aquí se
+    estima cada elemento con flotantes y solo los que quedan cerca del
+    límite se recalculan con enteros de Python para comprobarlos.
+
+    Raises:
+        ValueError si las formas de los arreglos no son compatibles;
+        OverflowError si un operando o algún elemento del resultado no cabe
+        en el tipo entero del arreglo.
+    """
+    value = power(*operands) if function is operator.pow else function(*operands)
+    if value.dtype.kind not in "iu":
+        return value
+    with np.errstate(all="ignore"):
+        estimate = function(*(np.asarray(operand, dtype=np.float64) for operand in operands))
+    # Los NaN y los infinitos también son sospechosos.
+    suspect = ~(np.abs(estimate) < 2.0 ** (value.dtype.itemsize * 8 - 2))
+    if suspect.any():
+        info = np.iinfo(value.dtype)
+        columns = [column[suspect].tolist() for column in np.broadcast_arrays(*operands)]
+        for items in zip(*columns):
+            # Sin calcular potencias enormes: con |base| > 1, un exponente
+            # de 64 o más siempre se desborda.
+            if function is operator.pow and abs(items[0]) > 1 and items[1] >= 64:
+                raise OverflowError(items)
+            if not info.min <= function(*items) <= info.max:
+                raise OverflowError(items)
+    return value
+
+
+def reduce(values: List[Any], largest: bool) -> Any:
+    """
+    Máximo (largest=True) o mínimo sobre escalares y elementos de arreglos.
+
+    Raises:
+        ValueError si algún arreglo está vacío.
+    """
+    reduced = []
+    for value in values:
+        if isinstance(value, ARRAY_TYPES):
+            if value.size == 0:
+                raise ValueError("No se puede reducir un arreglo vacío.")
+            value = (value.max() if largest else value.min()).item()
+        reduced.append(value)
+    return max(reduced) if largest else min(reduced)
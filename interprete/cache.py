@@ -0,0 +1,271 @@
+"""
+Módulo de caché de compilación para el intérprete Gamer.
+Guarda programas compilados en un archivo binario junto al script (al estilo
+de los .pyc), indexado por el contenido del script, la versión del
+intérprete y la gramática de interprete/keywords.py.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from typing import Any, List, Optional, Tuple
+
+from interprete import __version__
+from interprete import keywords
+from interprete.arrays import ARRAY_TYPES, np
+
+MAGIC = b"GMRC"
+FORMAT_VERSION = 2
+CACHE_DIR = "__gamercache__"
+SUFFIX = ".gmc"
+
+# Cabecera: magia, versión del formato y clave SHA-256 de 32 bytes.
+_HEADER = struct.Struct("<4sH32s")
+_COUNT = struct.Struct("<I")
+
+# Formato por columnas: cada campo de las instrucciones y de los operandos
+# se guarda como un bloque contiguo que se carga con array.frombytes en
+# lugar de decodificarse elemento a elemento.
+#   nombres (texto separado por "\n"), fuentes (ídem),
+#   líneas (uint32), comandos y manejador rápido (un byte cada uno),
+#   aridad (uint32: jefe, esbirro o llamar pueden tener cientos de operandos),
+#   etiquetas de operando (un byte), enteros (int64), flotantes (float64)
+#   y, aparte, los operandos raros: cadenas, enteros grandes y arreglos.
+_VAR, _INT, _FLOAT, _EXTRA = b"v"[0], b"i"[0], b"f"[0], b"x"[0]
+_INT_MIN, _INT_MAX = -(1 << 63), (1 << 63) - 1
+
+_COMMANDS = keywords.KEYWORDS
+_COMMAND_INDEX = {cmd: idx for idx, cmd in enumerate(_COMMANDS)}
+
+# (línea, comando, manejador rápido, operandos, texto fuente)
+Record = Tuple[int, str, bool, Tuple[Any, ...], str]
+
+_grammar_digest: Optional[bytes] = None
+
+
+def grammar_digest() -> bytes:
+    """
+    Hash del archivo de gramática; si keywords.py cambia, las entradas
+    anteriores de la caché dejan de ser válidas.
+    """
+    global _grammar_digest
+    if _grammar_digest is None:
+        with open(keywords.__file__, "rb") as f:
+            _grammar_digest = hashlib.sha256(f.read()).digest()
+    return _grammar_digest
+
+
+def source_key(source: bytes) -> bytes:
+    digest = hashlib.sha256()
+    digest.update(__version__.encode("ascii"))
+    digest.update(grammar_digest())
+    digest.update(source)
+    return digest.digest()
+
+
+def cache_path(script: str, cache_dir: Optional[str] = None) -> str:
+    """
+    Ruta del archivo de caché de un script. Por defecto, en un directorio
+    __gamercache__ junto al script.
+    """
+    directory = cache_dir or os.path.join(os.path.dirname(os.path.abspath(script)), CACHE_DIR)
+    return os.path.join(directory, os.path.basename(script) + SUFFIX)
+
+
+def dump(path: str, key: bytes, names: List[str], records: List[Record]) -> None:
+    """
+    Escribe el programa de forma atómica (archivo temporal + rename), así un
+    lector concurrente nunca ve un archivo a medias.
+    """
+    write_atomic(path, encode(key, names, records))
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """
+    Escribe un archivo completo en uno temporal y lo renombra al destino.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def encode(key: bytes, names: List[str], records: List[Record]) -> bytes:
+    """
+    Codifica un programa (nombres e instrucciones) en el formato de la caché.
+    """
+    lines, arity = array("I"), array("I")
+    commands, fast, tags = bytearray(), bytearray(), bytearray()
+    ints, floats = array("q"), array("d")
+    extras = bytearray()
+    for line, command, is_fast, operands, _ in records:
+        lines.append(line)
+        commands.append(_COMMAND_INDEX[command])
+        fast.append(is_fast)
+        arity.append(len(operands))
+        for is_var, value in operands:
+            if is_var:
+                tags.append(_VAR)
+                ints.append(value)
+            elif isinstance(value, int) and _INT_MIN <= value <= _INT_MAX:
+                tags.append(_INT)
+                ints.append(value)
+            elif isinstance(value, float):
+                tags.append(_FLOAT)
+                floats.append(value)
+            else:
+                tags.append(_EXTRA)
+                _put_extra(extras, value)
+
+    out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, key))
+    for block in ("\n".join(names).encode("utf-8"),
+                  "\n".join(record[4] for record in records).encode("utf-8"),
+                  lines.tobytes(), commands, fast, arity.tobytes(), tags,
+                  ints.tobytes(), floats.tobytes(), extras):
+        out += _COUNT.pack(len(block))
+        out += block
+    return bytes(out)
+
+
+def load(path: str, key: bytes) -> Optional[Tuple[List[str], List[Record]]]:
+    """
+    Lee un programa de la caché mediante mmap.
+
+    Returns:
+        (nombres, instrucciones), o None si el archivo no existe, es de otra
+        versión, otra clave o está dañado.
+    """
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return decode(data, key)
+    except (OSError, ValueError):
+        return None
+
+
+def decode(data, key: bytes) -> Optional[Tuple[List[str], List[Record]]]:
+    """
+    Decodifica un programa codificado con encode().
+
+    Returns:
+        (nombres, instrucciones), o None si es de otra versión, otra clave o
+        está dañado.
+    """
+    try:
+        magic, version, stored = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or stored != key:
+            return None
+        pos = _HEADER.size
+        blocks = []
+        for _ in range(10):
+            (size,) = _COUNT.unpack_from(data, pos)
+            start = pos + _COUNT.size
+            pos = start + size
+            if pos > len(data):
+                return None
+            blocks.append(data[start:pos])
+        if pos != len(data):
+            return None
+        (names_raw, sources_raw, lines_raw, commands, fast, arity_raw, tags,
+         ints_raw, floats_raw, extras) = blocks
+
+        names = names_raw.decode("utf-8").split("\n") if names_raw else []
+        sources = sources_raw.decode("utf-8").split("\n") if sources_raw else []
+        lines = array("I")
+        lines.frombytes(lines_raw)
+        arity = array("I")
+        arity.frombytes(arity_raw)
+        ints = array("q")
+        ints.frombytes(ints_raw)
+        floats = array("d")
+        floats.frombytes(floats_raw)
+        count = len(lines)
+        if not (len(commands) == len(fast) == len(arity) == len(sources) == count
+                and sum(arity) == len(tags)):
+            return None
+
+        # Operandos decodificados en una sola pasada; los (True, slot) se
+        # comparten. Los slots del cuerpo de una misión son de su propia
+        # tabla y pueden pasar del número de nombres.
+        variables = [(True, slot) for slot in range(len(names))]
+        shared = len(variables)
+        next_int, next_float = iter(ints).__next__, iter(floats).__next__
+        operands: List[Tuple[bool, Any]] = []
+        append = operands.append
+        pos = 0
+        for tag in tags:
+            if tag == _VAR:
+                slot = next_int()
+                append(variables[slot] if slot < shared else (True, slot))
+            elif tag == _INT:
+                append((False, next_int()))
+            elif tag == _FLOAT:
+                append((False, next_float()))
+            elif tag == _EXTRA:
+                value, pos = _get_extra(extras, pos)
+                append((False, value))
+            else:
+                return None
+
+        records: List[Record] = []
+        k = 0
+        for i in range(count):
+            n = arity[i]
+            records.append((lines[i], _COMMANDS[commands[i]], bool(fast[i]),
+                            tuple(operands[k:k + n]), sources[i]))
+            k += n
+        return names, records
+    except (struct.error, IndexError, ValueError, UnicodeDecodeError, StopIteration):
+        return None
+
+
+def _put_extra(out: bytearray, value: Any) -> None:
+    if isinstance(value, int):
+        # Enteros fuera de int64: bytes en complemento a dos.
+        out += b"i"
+        _put_bytes(out, value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True))
+    elif isinstance(value, str):
+        out += b"s"
+        _put_bytes(out, value.encode("utf-8"))
+    elif isinstance(value, ARRAY_TYPES):
+        if value.dtype.kind in "iu":
+            out += b"q"
+            _put_bytes(out, value.astype("<i8").tobytes())
+        else:
+            out += b"d"
+            _put_bytes(out, value.astype("<f8").tobytes())
+    else:
+        raise TypeError(f"Operando no serializable: {value!r}")
+
+
+def _put_bytes(out: bytearray, raw: bytes) -> None:
+    out += _COUNT.pack(len(raw))
+    out += raw
+
+
+def _get_extra(data: bytes, pos: int) -> Tuple[Any, int]:
+    tag = data[pos:pos + 1]
+    (size,) = _COUNT.unpack_from(data, pos + 1)
+    start = pos + 1 + _COUNT.size
+    end = start + size
+    if end > len(data):
+        raise IndexError(pos)
+    raw = data[start:end]
+    if tag == b"i":
+        return int.from_bytes(raw, "little", signed=True), end
+    if tag == b"s":
+        return raw.decode("utf-8"), end
+    if tag in (b"q", b"d") and np is not None:
+        stored, kind = ("<i8", np.int64) if tag == b"q" else ("<f8", np.float64)
+        return np.frombuffer(raw, dtype=stored).astype(kind), end
+    raise IndexError(pos)
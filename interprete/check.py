@@ -0,0 +1,246 @@
+"""
+Módulo de verificación en paralelo para el intérprete Gamer.
+Analiza y valida scripts muy grandes repartiendo bloques de líneas entre
+varios procesos, sin ejecutar nada.
+
+El análisis léxico y la validación no dependen de otras líneas, así que cada
+bloque se verifica por separado. Los diagnósticos se numeran relativos a su
+bloque y se combinan, en orden, sumando las líneas de los bloques anteriores.
+
+La estructura de los bloques `repetir`/`mision ... fin` sí cruza las líneas
+(y los cortes entre bloques del archivo): cada bloque del archivo empareja
+sus propios `fin` y devuelve las líneas que dependen de los bloques abiertos
+antes (un `fin` de más, una `mision` o un `regresar` fuera de sus propios
+bloques) y los bloques que deja abiertos (Structure); al combinar se siguen
+los bloques abiertos en todo el archivo.
+"""
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from interprete.arrays import parse_array
+from interprete.keywords import BLOCK_END, BLOCK_OPENERS
+from interprete.lexer import Lexer
+from interprete.tokens import TokenKind
+from interprete.validator import validate, ValidationError
+
+# Tamaño aproximado de cada bloque de un archivo, en bytes.
+CHUNK_SIZE = 8 << 20
+
+# (línea, mensaje)
+Diagnostic = Tuple[int, str]
+
+# Mismos mensajes que Interpreter.compile.
+UNOPENED_END = f"Error de sintaxis: '{BLOCK_END}' sin bloque abierto."
+UNCLOSED_BLOCK = f"Error de sintaxis: Falta '{BLOCK_END}' para el bloque '{{}}'."
+NESTED_MISSION = "Error de sintaxis: Una misión no se puede definir dentro de otro bloque."
+RETURN_OUTSIDE = "Error de sintaxis: 'regresar' solo se puede usar dentro de una misión."
+
+_lexer = Lexer()
+
+
+def check_line(text: str) -> Optional[str]:
+    """
+    Verifica una línea ya sin espacios en los extremos.
+
+    Returns:
+        El mensaje de error, con el mismo texto que Interpreter.compile, o
+        None si la línea es válida.
+    """
+    tokens = _lexer.tokenize(text)
+    try:
+        validate(tokens)
+        if tokens[0].value == "mision":
+            params = [token.value for token in tokens[2:]]
+            if len(set(params)) != len(params):
+                raise ValidationError(
+                    f"La misión '{tokens[1].value}' tiene parámetros repetidos.")
+        for token in tokens:
+            if token.kind is TokenKind.LISTA:
+                try:
+                    parse_array(token.value)
+                except ValueError as e:
+                    raise ValidationError(str(e))
+    except ValidationError as e:
+        return f"Error de sintaxis: {e}"
+    return None
+
+
+class Structure:
+    """
+    Bloques de un trozo de script que dependen de las líneas anteriores.
+
+    Attributes:
+        events: (línea, comando, informar) de cada línea cuya validez
+            depende de los bloques abiertos antes del trozo, en orden: los
+            `fin` que no cierran un bloque del propio trozo, las `mision`
+            fuera de sus bloques y los `regresar` fuera de sus misiones.
+            `informar` es False si la línea ya tiene un error de sintaxis.
+        unclosed: (línea, comando) de los bloques que quedan abiertos al final.
+    """
+
+    __slots__ = ("events", "unclosed")
+
+    def __init__(self, events: List[Tuple[int, str, bool]],
+                 unclosed: List[Tuple[int, str]]) -> None:
+        self.events = events
+        self.unclosed = unclosed
+
+
+# (número de líneas, diagnósticos, estructura) de un trozo verificado.
+Checked = Tuple[int, List[Diagnostic], Structure]
+
+
+def check_lines(lines: Iterable[str]) -> Checked:
+    """
+    Verifica líneas consecutivas; las vacías se ignoran.
+
+    Returns:
+        (número de líneas, diagnósticos con la línea relativa a la primera,
+        estructura de bloques con las líneas también relativas).
+    """
+    diagnostics = []
+    events: List[Tuple[int, str, bool]] = []
+    blocks: List[Tuple[int, str]] = []
+    missions = 0  # Misiones abiertas en `blocks`.
+    count = 0
+    for count, text in enumerate(lines, start=1):
+        text = text.strip()
+        if not text:
+            continue
+        message = check_line(text)
+        if message is not None:
+            diagnostics.append((count, message))
+        # Los bloques se siguen por la primera palabra, como group_blocks,
+        # aunque la línea tenga un error de sintaxis.
+        word = text.split(None, 1)[0].lower()
+        if word in BLOCK_OPENERS:
+            if word == "mision":
+                if not blocks:
+                    events.append((count, word, message is None))
+                elif message is None:
+                    diagnostics.append((count, NESTED_MISSION))
+                missions += 1
+            blocks.append((count, word))
+        elif word == BLOCK_END:
+            if blocks:
+                missions -= blocks.pop()[1] == "mision"
+            else:
+                events.append((count, word, message is None))
+        elif word == "regresar" and not missions:
+            events.append((count, word, message is None))
+    return count, diagnostics, Structure(events, blocks)
+
+
+def _check_text(text: str) -> Checked:
+    lines = text.split("\n")
+    if text.endswith("\n"):
+        lines.pop()  # El salto final cierra la última línea del bloque.
+    return check_lines(lines)
+
+
+def _check_range(path: str, start: int, end: int) -> Checked:
+    # Se ejecuta en un proceso del pool: lee y verifica un bloque del archivo.
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return _check_text(data.decode("utf-8"))
+
+
+def split_file(path: str, chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """
+    Divide un archivo en rangos de bytes [inicio, fin) que terminan justo
+    después de un salto de línea. Solo se lee alrededor de cada corte.
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, "rb") as f:
+        while start < size:
+            end = start + chunk_size
+            if end >= size:
+                end = size
+            else:
+                f.seek(end)
+                while True:
+                    block = f.read(1 << 16)
+                    if not block:
+                        end = size
+                        break
+                    newline = block.find(b"\n")
+                    if newline != -1:
+                        end += newline + 1
+                        break
+                    end += len(block)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _merge(results: Iterable[Checked]) -> Iterator[Diagnostic]:
+    # Combina los trozos en orden siguiendo los bloques abiertos; los que
+    # quedan sin cerrar se informan al final, con la línea donde se abren.
+    offset = 0
+    blocks: List[Tuple[int, str]] = []
+    missions = 0
+    for count, diagnostics, structure in results:
+        found = []
+        for line, word, report in structure.events:
+            if word == BLOCK_END:
+                if blocks:
+                    missions -= blocks.pop()[1] == "mision"
+                elif report:
+                    found.append((line, UNOPENED_END))
+            elif word == "mision":
+                if blocks and report:
+                    found.append((line, NESTED_MISSION))
+            elif not missions and report:
+                found.append((line, RETURN_OUTSIDE))
+        for line, message in heapq.merge(diagnostics, found):
+            yield (offset + line, message)
+        for line, word in structure.unclosed:
+            blocks.append((offset + line, word))
+            missions += word == "mision"
+        offset += count
+    for line, word in blocks:
+        yield (line, UNCLOSED_BLOCK.format(word))
+
+
+def check_file(path: str, workers: Optional[int] = None,
+               chunk_size: int = CHUNK_SIZE) -> Iterator[Diagnostic]:
+    """
+    Verifica un archivo en paralelo y genera sus diagnósticos en orden de línea
+    a medida que terminan los bloques; los de bloques `repetir`/`mision` sin
+    `fin` se generan al final.
+
+    Args:
+        path: Ruta del script.
+        workers: Procesos del pool; por defecto, uno por núcleo. Con 1 (o un
+            solo bloque) se verifica en este mismo proceso.
+        chunk_size: Tamaño aproximado de cada bloque en bytes.
+    """
+    ranges = split_file(path, chunk_size)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(ranges) <= 1:
+        yield from _merge(_check_range(path, start, end) for start, end in ranges)
+        return
+    with ProcessPoolExecutor(min(workers, len(ranges))) as pool:
+        yield from _merge(pool.map(_check_range, [path] * len(ranges),
+                                   [start for start, _ in ranges],
+                                   [end for _, end in ranges]))
+
+
+def check_source(source: str, workers: Optional[int] = None,
+                 chunk_lines: int = 100_000) -> List[Diagnostic]:
+    """
+    Verifica un script en memoria, en bloques de `chunk_lines` líneas.
+    """
+    lines = source.split("\n")
+    chunks = [lines[i:i + chunk_lines] for i in range(0, len(lines), chunk_lines)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) <= 1:
+        return list(_merge(check_lines(chunk) for chunk in chunks))
+    with ProcessPoolExecutor(min(workers, len(chunks))) as pool:
+        return list(_merge(pool.map(check_lines, chunks)))
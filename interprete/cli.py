@@ -0,0 +1,315 @@
+"""
+Interfaz de línea de comandos del intérprete Gamer.
+Permite ejecutar scripts sin interfaz gráfica: python -m interprete run script.gamer
+"""
+
+import argparse
+import io
+import os
+import sys
+from typing import Any, Callable, Iterable, List, Optional, TextIO
+
+from interprete.compiler import Program, group_blocks
+from interprete.interpreter import Interpreter, InterpreterError
+from interprete.loader import mmap_lines
+
+# Tamaño del búfer de salida; los resultados se escriben por bloques.
+OUTPUT_BUFFER = 1 << 16
+
+
+def run_stream(lines: Iterable[str], interpreter: Interpreter, out: TextIO,
+               err: TextIO, name: str = "<stdin>", fail_fast: bool = False,
+               quiet: bool = False, tick: Optional[Callable[[], Any]] = None) -> int:
+    """
+    Ejecuta las líneas de un script a medida que se leen.
+
+    Args:
+        lines: Iterable de líneas (por ejemplo, un archivo abierto).
+        interpreter: Intérprete compartido entre scripts.
+        out: Flujo donde se escriben los resultados.
+        err: Flujo donde se escriben los errores.
+        name: Nombre del script para los mensajes de error.
+        fail_fast: Si es True, se detiene en el primer error.
+        quiet: Si es True, los resultados se descartan sin formatearse.
+        tick: Función que se llama tras cada línea o bloque ejecutado (por
+            ejemplo, AutoSnapshot.tick).
+
+    Los bloques `repetir ... fin` se leen completos y se compilan una vez
+    antes de ejecutarse.
+
+    Returns:
+        Número de líneas con error.
+    """
+    errors = 0
+    write = out.write
+    sink = None if quiet else (lambda result: write(result.text() + "\n"))
+    for idx, line, block in group_blocks(lines):
+        try:
+            if block:
+                program = interpreter.compile(line, optimize=False, first_line=idx)
+                for instr in program.instructions:
+                    result = interpreter.execute(instr, sink)
+            else:
+                result = interpreter.evaluate(line)
+            if not quiet:
+                write(result.text() + "\n")
+        except Exception as e:
+            errors += 1
+            _report(err, name, idx, e)
+            if fail_fast:
+                break
+        finally:
+            if tick is not None:
+                tick()
+    return errors
+
+
+def run_program(program: Program, interpreter: Interpreter, out: TextIO,
+                err: TextIO, name: str = "<stdin>", fail_fast: bool = False,
+                quiet: bool = False, tick: Optional[Callable[[], Any]] = None) -> int:
+    """
+    Ejecuta un programa ya compilado con la misma salida que run_stream:
+    un error se informa con su línea y la ejecución continúa. `tick` se
+    llama tras cada instrucción de primer nivel.
+
+    Returns:
+        Número de instrucciones con error.
+    """
+    errors = 0
+    write = out.write
+    execute = interpreter.execute
+    sink = None if quiet else (lambda result: write(result.text() + "\n"))
+    for instr in program.instructions:
+        try:
+            result = execute(instr, sink)
+            if not quiet:
+                write(result.text() + "\n")
+        except Exception as e:
+            errors += 1
+            _report(err, name, instr.line, e)
+            if fail_fast:
+                break
+        finally:
+            if tick is not None:
+                tick()
+    return errors
+
+
+def _report(err: TextIO, name: str, line: int, error: Exception) -> None:
+    # Los errores de Python (división por cero, desbordamiento, enteros
+    # demasiado grandes para mostrarse) se informan igual y no detienen
+    # la ejecución.
+    if isinstance(error, InterpreterError):
+        err.write(f"{name}: Línea {error.line or line} - Error: {error}\n")
+    else:
+        err.write(f"{name}: Línea {line} - Error inesperado: {error}\n")
+
+
+def _run_script(path: str, interpreter: Interpreter, out: TextIO,
+                args: argparse.Namespace, tick: Optional[Callable[[], Any]] = None) -> int:
+    if args.cache:
+        # Sin optimizar: tras un error la ejecución continúa y no puede
+        # depender de resultados reutilizados de instrucciones anteriores.
+        try:
+            program = interpreter.compile_file(path, optimize=False,
+                                               cache_dir=args.cache_dir)
+        except InterpreterError:
+            pass  # Se ejecuta línea a línea para informar de cada error.
+        else:
+            return run_program(program, interpreter, out, sys.stderr, name=path,
+                               fail_fast=args.fail_fast, quiet=args.quiet, tick=tick)
+    return run_stream(mmap_lines(path), interpreter, out, sys.stderr, name=path,
+                      fail_fast=args.fail_fast, quiet=args.quiet, tick=tick)
+
+
+def _open_output() -> TextIO:
+    # La salida estándar se reabre con un búfer grande y sin cerrar el descriptor.
+    try:
+        fileno = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return sys.stdout
+    return open(fileno, "w", buffering=OUTPUT_BUFFER, encoding="utf-8", closefd=False)
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    interpreter = Interpreter()
+    if args.restore:
+        try:
+            interpreter.restore(args.restore)
+        except (OSError, ValueError) as e:
+            sys.stderr.write(f"{args.restore}: Error: {e}\n")
+            return 1
+    saver = tick = None
+    if args.snapshot:
+        from interprete.snapshot import AutoSnapshot
+        saver = AutoSnapshot(interpreter, args.snapshot, args.snapshot_interval)
+        tick = saver.tick
+    out = _open_output()
+    errors = 0
+    try:
+        for path in args.scripts or ["-"]:
+            if path == "-":
+                errors += run_stream(sys.stdin, interpreter, out, sys.stderr,
+                                     fail_fast=args.fail_fast, quiet=args.quiet, tick=tick)
+            else:
+                errors += _run_script(path, interpreter, out, args, tick)
+            if errors and args.fail_fast:
+                break
+    finally:
+        out.flush()
+        if saver is not None:
+            saver.save()
+    return 1 if errors else 0
+
+
+def cmd_check(args: argparse.Namespace) -> int:
+    from interprete.check import check_file, check_source
+
+    out = _open_output()
+    errors = 0
+    try:
+        for path in args.scripts or ["-"]:
+            if path == "-":
+                name = "<stdin>"
+                diagnostics = iter(check_source(sys.stdin.read(), args.jobs))
+            else:
+                name = path
+                diagnostics = check_file(path, args.jobs)
+            for line, message in diagnostics:
+                errors += 1
+                out.write(f"{name}: Línea {line} - Error: {message}\n")
+    finally:
+        out.flush()
+    return 1 if errors else 0
+
+
+def cmd_sweep(args: argparse.Namespace) -> int:
+    from interprete.sweep import read_bindings, sweep, write_csv, write_jsonl
+
+    fmt = args.input_format
+    if fmt is None:
+        fmt = os.path.splitext(args.inputs)[1].lstrip(".").lower() or "csv"
+    source = sys.stdin.read() if args.script == "-" else _read_text(args.script)
+    inputs = sys.stdin if args.inputs == "-" else open(args.inputs, encoding="utf-8", newline="")
+    out = _open_output() if args.output is None else open(
+        args.output, "w", encoding="utf-8", newline="")
+    write = write_jsonl if args.output_format == "jsonl" else write_csv
+    try:
+        batches = sweep(source, read_bindings(inputs, fmt), args.var, args.decir or (),
+                        args.jobs, args.batch, backend=args.backend)
+        errors = write(batches, out)
+    except InterpreterError as e:
+        sys.stderr.write(f"{args.script}: Línea {e.line} - Error: {e}\n")
+        return 1
+    except ValueError as e:
+        sys.stderr.write(f"{args.inputs}: Error: {e}\n")
+        return 1
+    finally:
+        out.flush()
+        if args.output is not None:
+            out.close()
+        if inputs is not sys.stdin:
+            inputs.close()
+    return 1 if errors else 0
+
+
+def _read_text(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    import asyncio
+    from interprete.limits import Limits
+    from interprete.server import serve
+
+    limits = None
+    if args.max_bits or args.max_string:
+        limits = Limits(max_bits=args.max_bits, max_string=args.max_string)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, limits=limits,
+                          idle_timeout=args.idle_timeout, max_sessions=args.max_sessions,
+                          snapshot_dir=args.snapshot_dir,
+                          snapshot_interval=args.snapshot_interval))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m interprete",
+                                     description="Intérprete del lenguaje Gamer.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Ejecuta scripts Gamer sin interfaz gráfica.")
+    run.add_argument("scripts", nargs="*",
+                     help="Archivos a ejecutar; '-' o ninguno lee de la entrada estándar.")
+    run.add_argument("--fail-fast", action="store_true",
+                     help="Detiene la ejecución en el primer error.")
+    run.add_argument("--quiet", action="store_true",
+                     help="No escribe resultados (solo errores); no formatea valores.")
+    run.add_argument("--cache", action="store_true",
+                     help="Guarda y reutiliza los scripts compilados en disco.")
+    run.add_argument("--cache-dir", default=None,
+                     help="Directorio de la caché (por defecto, __gamercache__ junto al script).")
+    run.add_argument("--restore", default=None,
+                     help="Empieza con el estado de una instantánea guardada con --snapshot.")
+    run.add_argument("--snapshot", default=None,
+                     help="Guarda periódicamente y al terminar una instantánea del estado.")
+    run.add_argument("--snapshot-interval", type=float, default=60.0,
+                     help="Segundos entre instantáneas (por defecto, 60).")
+    run.set_defaults(func=cmd_run)
+
+    check = sub.add_parser("check", help="Verifica la sintaxis de scripts en paralelo, sin ejecutarlos.")
+    check.add_argument("scripts", nargs="*",
+                       help="Archivos a verificar; '-' o ninguno lee de la entrada estándar.")
+    check.add_argument("-j", "--jobs", type=int, default=None,
+                       help="Procesos a usar (por defecto, uno por núcleo).")
+    check.set_defaults(func=cmd_check)
+
+    sweep = sub.add_parser("sweep", help="Ejecuta un script con muchos conjuntos de valores iniciales, en paralelo.")
+    sweep.add_argument("script", help="Script a ejecutar; '-' lo lee de la entrada estándar.")
+    sweep.add_argument("inputs", help="Valores iniciales: CSV con cabecera, JSON (lista de objetos) "
+                                      "o JSON Lines; '-' lee de la entrada estándar.")
+    sweep.add_argument("--input-format", choices=("csv", "json", "jsonl"), default=None,
+                       help="Formato de la entrada (por defecto, según la extensión).")
+    sweep.add_argument("--var", action="append", default=None,
+                       help="Variable cuyo valor final se guarda (se puede repetir); "
+                            "por defecto, todas las que asigna el script.")
+    sweep.add_argument("--decir", action="append", default=None,
+                       help="Variable de la que se guarda el último valor mostrado con decir.")
+    sweep.add_argument("-o", "--output", default=None,
+                       help="Archivo de resultados (por defecto, la salida estándar).")
+    sweep.add_argument("--output-format", choices=("csv", "jsonl"), default="csv")
+    sweep.add_argument("-j", "--jobs", type=int, default=None,
+                       help="Procesos a usar (por defecto, uno por núcleo).")
+    sweep.add_argument("--batch", type=int, default=256, help="Filas por lote enviado a cada proceso.")
+    sweep.add_argument("--backend", choices=("reference", "python"), default="reference",
+                       help="Motor de ejecución.")
+    sweep.set_defaults(func=cmd_sweep)
+
+    serve = sub.add_parser("serve", help="Servidor de sesiones por socket (una línea por instrucción).")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=7777)
+    serve.add_argument("--unix", default=None, help="Escucha en un socket Unix en lugar de TCP.")
+    serve.add_argument("--idle-timeout", type=float, default=300.0,
+                       help="Segundos de inactividad tras los que se cierra una sesión.")
+    serve.add_argument("--max-sessions", type=int, default=1024)
+    serve.add_argument("--max-bits", type=int, default=None,
+                       help="Tamaño máximo en bits de los resultados de poder/multiplicar.")
+    serve.add_argument("--max-string", type=int, default=None,
+                       help="Longitud máxima de las cadenas.")
+    serve.add_argument("--snapshot-dir", default=None,
+                       help="Directorio donde se guardan las sesiones con nombre (:sesion).")
+    serve.add_argument("--snapshot-interval", type=float, default=60.0,
+                       help="Segundos entre instantáneas de las sesiones (por defecto, 60).")
+    serve.set_defaults(func=cmd_serve)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos. Devuelve el código de salida.
+    """
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,274 @@
+"""
+Módulo de generación de código para el intérprete Gamer.
+Traduce un programa compilado a código fuente Python, lo compila una sola
+vez con compile() y lo ejecuta como un objeto código.
+
+Las variables se leen y escriben directamente en los slots del intérprete
+(`interp._values`) y cada comando se traduce a su operación de Python
+(`curar` a `+`, `revivir` a `math.sqrt`, etc.). Las comprobaciones se
+reducen a una prueba de tipo en línea: si los operandos no son int/float
+(arreglos, cadenas, variables indefinidas) o la operación fallaría
+(división por cero, raíz de un negativo), esa instrucción se ejecuta con su
+manejador de referencia, que produce el resultado o el error de siempre.
+Las instrucciones con tipos probados por el análisis semántico no llevan
+ni esa prueba.
+"""
+
+import math
+from itertools import count, repeat
+from typing import Any, Callable, Dict, List, Optional
+
+from interprete.compiler import Instruction, Program
+from interprete.keywords import BLOCK_COMMANDS, KEYWORD_ACTIONS
+from interprete.optimizer import folded
+from interprete.results import Result
+from interprete.symbols import UNDEFINED
+
+# Instrucciones de primer nivel por función generada: compile() es más
+# lento con funciones muy largas.
+CHUNK_SIZE = 1000
+
+# Operador de Python de cada comando binario.
+BINARY_OPERATORS = {
+    "curar": "+",
+    "golpear": "-",
+    "multiplicar": "*",
+    "dividir": "/",
+    "poder": "**",
+}
+
+# Comandos de cálculo que se traducen a Python. Los demás (misiones y
+# llamadas) se ejecutan siempre con su manejador de referencia.
+INLINE_COMMANDS = frozenset(BINARY_OPERATORS) | {"revivir", "xp", "jefe", "esbirro"}
+
+# Nombres que las funciones generadas reciben como argumentos por defecto
+# (variables locales, más rápidas que las globales).
+_LOCALS = {
+    "_R": Result,
+    "_S": frozenset({int, float}),
+    "_U": UNDEFINED,
+    "_sqrt": math.sqrt,
+    "_repeat": repeat,
+    "abs": abs,
+    "max": max,
+    "min": min,
+}
+
+_filenames = count()
+
+
+class PythonProgram:
+    """
+    Programa traducido a Python: una o más funciones generadas que se
+    ejecutan en orden con `run`.
+
+    Attributes:
+        source: Código Python generado.
+        filename: Nombre con el que se compiló (aparece en las trazas).
+        lines: Línea Gamer de cada línea de `source` (índice desde 1).
+    """
+
+    __slots__ = ("source", "filename", "lines", "_parts")
+
+    def __init__(self, source: str, filename: str, lines: List[Optional[int]],
+                 parts: List[Callable]) -> None:
+        self.source = source
+        self.filename = filename
+        self.lines = lines
+        self._parts = parts
+
+    def run(self, interp, append: Optional[Callable[[Result], Any]]) -> None:
+        """
+        Ejecuta el programa sobre las variables de `interp`. Los resultados
+        se pasan a `append`; si la traducción se hizo sin resultados,
+        `append` se ignora.
+        """
+        values = interp._values
+        for part in self._parts:
+            part(interp, values, append)
+
+    def line_at(self, traceback) -> Optional[int]:
+        """
+        Línea Gamer de la instrucción en ejecución cuando se produjo una
+        excepción, a partir de su traza.
+        """
+        line = None
+        while traceback is not None:
+            if traceback.tb_frame.f_code.co_filename == self.filename:
+                line = self.lines[traceback.tb_lineno]
+            traceback = traceback.tb_next
+        return line
+
+
+def translate(program: Program, handlers: Dict[str, Callable],
+              fast_handlers: Dict[str, Callable], keep: bool = True) -> PythonProgram:
+    """
+    Traduce y compila un programa ya enlazado a la tabla de símbolos del
+    intérprete que lo va a ejecutar.
+
+    Args:
+        program: Programa compilado (con o sin optimizar).
+        handlers: Manejadores de referencia por acción
+            (interprete.interpreter.HANDLERS).
+        fast_handlers: Manejadores rápidos por acción; una instrucción
+            enlazada a uno tiene tipos int/float probados.
+        keep: Si es False, el código no construye los Result.
+    """
+    writer = _Writer(program.symbols.names, handlers, fast_handlers, keep)
+    instructions = program.instructions
+    names = []
+    for start in range(0, max(len(instructions), 1), CHUNK_SIZE):
+        name = f"_part{len(names)}"
+        names.append(name)
+        defaults = ", ".join(f"{local}={local}" for local in _LOCALS)
+        writer.line(0, f"def {name}(interp, V, append, {defaults}):", None)
+        writer.block(instructions[start:start + CHUNK_SIZE], 1)
+    source = "\n".join(writer.out) + "\n"
+    filename = f"<gamer-{next(_filenames)}>"
+    namespace: Dict[str, Any] = dict(_LOCALS)
+    namespace.update(writer.constants)
+    exec(compile(source, filename, "exec"), namespace)
+    return PythonProgram(source, filename, writer.lines,
+                         [namespace[name] for name in names])
+
+
+class _Writer:
+    # Genera el código de las instrucciones, con su línea Gamer por línea.
+
+    def __init__(self, names: List[str], handlers: Dict[str, Callable],
+                 fast_handlers: Dict[str, Callable], keep: bool) -> None:
+        self.names = names
+        self.handlers = handlers
+        self.fast_handlers = fast_handlers
+        self.keep = keep
+        self.out: List[str] = []
+        self.lines: List[Optional[int]] = [None]
+        self.constants: Dict[str, Any] = {}
+
+    def line(self, depth: int, text: str, line: Optional[int]) -> None:
+        self.out.append("    " * depth + text)
+        self.lines.append(line)
+
+    def constant(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def literal(self, value: Any) -> str:
+        if type(value) in (int, float, str):
+            return repr(value)
+        return self.constant(value)
+
+    def block(self, instructions: List[Instruction], depth: int) -> None:
+        if not instructions:
+            self.line(depth, "pass", None)
+        for instr in instructions:
+            self.instruction(instr, depth)
+
+    def fallback(self, instr: Instruction) -> str:
+        # Manejador de referencia de la instrucción, con sus operandos (el
+        # enlazado puede ser rápido o del optimizador).
+        handler = self.constant(self.handlers[KEYWORD_ACTIONS[instr.command]])
+        operands = self.constant(instr.operands)
+        call = f"{handler}(interp, {operands})"
+        return f"append({call})" if self.keep else call
+
+    def emit(self, command: str, args: str, value: str) -> str:
+        if self.keep:
+            return f"append(_R({command!r}, {args}, {value}))"
+        return value
+
+    def load(self, operands, depth: int, line: int) -> List[str]:
+        # Deja cada operando en un temporal x0, x1...
+        temps = []
+        for idx, (is_var, value) in enumerate(operands):
+            temp = f"x{idx}"
+            source = f"V[{value}]" if is_var else self.literal(value)
+            self.line(depth, f"{temp} = {source}", line)
+            temps.append(temp)
+        return temps
+
+    def instruction(self, instr: Instruction, depth: int) -> None:
+        line = instr.line
+        command = instr.command
+        if folded(instr):
+            # Plegada por el optimizador: el Result ya está calculado.
+            if self.keep:
+                self.line(depth, f"append({self.constant(instr.operands[0][1])})", line)
+            else:
+                self.line(depth, "pass", line)
+            return
+        if command in BLOCK_COMMANDS:
+            self.repetir(instr, depth)
+            return
+        if command == "crear":
+            self.crear(instr, depth)
+            return
+        if command == "decir":
+            (_, slot), = instr.operands
+            self.line(depth, f"x0 = V[{slot}]", line)
+            self.line(depth, "if x0 is _U:", line)
+            self.line(depth + 1, self.fallback(instr), line)
+            if self.keep:
+                self.line(depth, self.emit("decir", repr((self.names[slot],)), "x0"), line)
+            return
+        if command not in INLINE_COMMANDS:
+            self.line(depth, self.fallback(instr), line)
+            return
+
+        temps = self.load(instr.operands, depth, line)
+        # Con tipos probados (manejador rápido) no hace falta la prueba de tipo.
+        proven = instr.handler is self.fast_handlers.get(KEYWORD_ACTIONS[command])
+        checks = [] if proven else [f"{temp}.__class__ in _S" for temp in temps]
+        args = f"({', '.join(temps)},)"
+        if command in BINARY_OPERATORS:
+            a, b = temps
+            value = f"{a} {BINARY_OPERATORS[command]} {b}"
+            if command == "dividir":
+                checks.append(b)
+        elif command == "revivir":
+            value = f"_sqrt({temps[0]})"
+            checks.append(f"{temps[0]} >= 0")
+        elif command == "xp":
+            value = f"abs({temps[0]})"
+        else:
+            self.line(depth, f"t = {args}", line)
+            args = "t"
+            value = f"{'max' if command == 'jefe' else 'min'}(t)"
+        if not checks:
+            self.line(depth, self.emit(command, args, value), line)
+            return
+        self.line(depth, f"if {' and '.join(checks)}:", line)
+        self.line(depth + 1, self.emit(command, args, value), line)
+        self.line(depth, "else:", line)
+        self.line(depth + 1, self.fallback(instr), line)
+
+    def crear(self, instr: Instruction, depth: int) -> None:
+        line = instr.line
+        (_, slot), (is_var, rhs) = instr.operands
+        if is_var:
+            self.line(depth, f"x0 = V[{rhs}]", line)
+            self.line(depth, "if x0 is _U:", line)
+            # Variable indefinida: se toma su nombre como texto.
+            self.line(depth + 1, f"x0 = {self.names[rhs]!r}", line)
+            value = "x0"
+        else:
+            value = self.literal(rhs)
+        self.line(depth, f"V[{slot}] = {value}", line)
+        if self.keep:
+            self.line(depth, self.emit("crear", repr((self.names[slot],)), value), line)
+
+    def repetir(self, instr: Instruction, depth: int) -> None:
+        line = instr.line
+        (is_var, count), (_, body) = instr.operands
+        # Cada nivel de anidamiento guarda su cuenta en su propio temporal.
+        n = f"n{depth}"
+        self.line(depth, f"{n} = {f'V[{count}]' if is_var else self.literal(count)}", line)
+        if is_var:
+            # Con una cuenta no válida, el manejador de referencia informa del error.
+            self.line(depth, f"if {n}.__class__ is not int or {n} < 0:", line)
+            self.line(depth + 1, self.fallback(instr), line)
+        self.line(depth, f"for _ in _repeat(None, {n}):", line)
+        self.block(body.instructions, depth + 1)
+        if self.keep:
+            self.line(depth, self.emit(instr.command, f"({n},)", n), line)
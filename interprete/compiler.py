@@ -0,0 +1,332 @@
+"""
+Módulo de compilación para el intérprete Gamer.
+Convierte un script completo en una lista de instrucciones ya resueltas.
+"""
+
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from interprete.lexer import Lexer
+from interprete.validator import validate, ValidationError
+from interprete.keywords import BLOCK_COMMANDS, BLOCK_END, BLOCK_OPENERS, KEYWORD_ACTIONS
+from interprete.symbols import SymbolTable, UNDEFINED
+from interprete.arrays import parse_array
+from interprete.tokens import Token, TokenKind, as_tokens
+
+# (es_variable, valor): si es variable, el valor es su slot en la tabla de símbolos.
+Operand = Tuple[bool, Union[int, float, str]]
+
+# Segundo operando de `llamar` cuando el valor de regreso no se guarda; con
+# `crear x = llamar ...` es (True, slot de x).
+NO_TARGET: Operand = (False, "")
+
+
+class Instruction:
+    """
+    Instrucción compilada: comando, manejador y operandos ya resueltos.
+    """
+
+    __slots__ = ("line", "command", "handler", "operands", "source")
+
+    def __init__(self, line: int, command: str, handler: Callable,
+                 operands: Tuple[Any, ...], source: str) -> None:
+        self.line = line
+        self.command = command
+        self.handler = handler
+        self.operands = operands
+        self.source = source
+
+    def __repr__(self) -> str:
+        return f"Instruction({self.line}, {self.command!r}, {self.operands!r})"
+
+
+class Program:
+    """
+    Programa Gamer compilado, listo para ejecutarse con Interpreter.run.
+    Los identificadores ya están resueltos a slots de `symbols`.
+    Si el programa pasó por el optimizador, `report` describe los cambios.
+    """
+
+    __slots__ = ("instructions", "symbols", "report", "__weakref__")
+
+    def __init__(self, instructions: List[Instruction], symbols: SymbolTable) -> None:
+        self.instructions = instructions
+        self.symbols = symbols
+        self.report = None
+
+    def __len__(self) -> int:
+        return len(self.instructions)
+
+    def __iter__(self):
+        return iter(self.instructions)
+
+    def walk(self) -> Iterator[Instruction]:
+        """
+        Recorre las instrucciones en orden de aparición en el script,
+        entrando en el cuerpo de cada bloque tras la instrucción que lo abre.
+        """
+        for instr in self.instructions:
+            yield instr
+            if instr.command in BLOCK_COMMANDS:
+                yield from instr.operands[1][1].walk()
+            elif instr.command == "mision":
+                yield from instr.operands[0][1].body.walk()
+
+    def relink(self, symbols: SymbolTable) -> "Program":
+        """
+        Devuelve una copia del programa con los slots traducidos a otra tabla.
+        """
+        return self._relink(symbols, [symbols.intern(name) for name in self.symbols.names])
+
+    def _relink(self, symbols: SymbolTable, mapping: List[int]) -> "Program":
+        instructions = [
+            Instruction(i.line, i.command, i.handler,
+                        tuple((True, mapping[v]) if is_var
+                              else (False, v._relink(symbols, mapping) if type(v) is Program else v)
+                              for is_var, v in i.operands),
+                        i.source)
+            for i in self.instructions
+        ]
+        program = Program(instructions, symbols)
+        program.report = self.report
+        return program
+
+
+class Mission:
+    """
+    Misión (procedimiento) compilada por `mision <nombre> <parámetros> ... fin`.
+
+    El cuerpo tiene su propia tabla de símbolos: los parámetros ocupan los
+    primeros slots y el resto son variables locales, así cada llamada usa
+    un marco de `size` valores y no ve las variables del script. Si el
+    cuerpo termina en `regresar`, esa última instrucción (`tail`) no se
+    ejecuta como tal: la llamada lee su valor directamente.
+    """
+
+    __slots__ = ("name", "params", "body", "steps", "tail", "size", "blank")
+
+    def __init__(self, name: str, params: List[str], body: Program) -> None:
+        self.name = name
+        self.params = params
+        self.body = body
+        instructions = body.instructions
+        if instructions and instructions[-1].command == "regresar":
+            self.steps = instructions[:-1]
+            self.tail: Optional[Instruction] = instructions[-1]
+        else:
+            self.steps = instructions
+            self.tail = None
+        self.size = len(body.symbols)
+        # Valores iniciales de las variables locales (tras los parámetros).
+        self.blank = (UNDEFINED,) * (self.size - len(params))
+
+    def __repr__(self) -> str:
+        return f"Mission({self.name!r}, {self.params!r})"
+
+
+class CompileError(Exception):
+    """Error de compilación asociado a una línea del script."""
+
+    def __init__(self, line: int, message: str) -> None:
+        super().__init__(message)
+        self.line = line
+
+
+class Compiler:
+    """
+    Compilador Gamer: el lexer y la validación se ejecutan una sola vez
+    por línea y cada instrucción queda enlazada a su manejador.
+    """
+
+    def __init__(self, handlers: Dict[str, Callable],
+                 symbols: Optional[SymbolTable] = None) -> None:
+        self.handlers = handlers
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self.lexer = Lexer()
+        # Perfilador opcional (interprete.profiler.Profiler); None = sin medición.
+        self.profiler = None
+
+    def compile_tokens(self, tokens: List[Token], line: int = 0,
+                       source: str = "") -> Instruction:
+        """
+        Resuelve una instrucción ya validada en un objeto Instruction.
+        """
+        tokens = as_tokens(tokens)
+        cmd = tokens[0].value
+        if cmd == BLOCK_END:
+            raise ValidationError(f"'{BLOCK_END}' sin bloque abierto.")
+        if cmd in BLOCK_OPENERS:
+            raise ValidationError(f"'{cmd}' solo se puede usar en un script completo.")
+        if cmd == "regresar":
+            raise ValidationError("'regresar' solo se puede usar dentro de una misión.")
+        action = KEYWORD_ACTIONS[cmd]
+        if action == "definir_variable":
+            if len(tokens) > 4:
+                # crear <nombre> = llamar <misión> <argumentos...>
+                return Instruction(line, "llamar", self.handlers[KEYWORD_ACTIONS["llamar"]],
+                                   self._call_operands(tokens[4:], self._operand(tokens[1])),
+                                   source)
+            operands = (self._operand(tokens[1]), self._operand(tokens[3]))
+        elif action == "llamar":
+            operands = self._call_operands(tokens[1:], NO_TARGET)
+        else:
+            operands = tuple(self._operand(t) for t in tokens[1:])
+        return Instruction(line, cmd, self.handlers[action], operands, source)
+
+    def compile_line(self, source: str, line: int = 0) -> Instruction:
+        """
+        Compila una sola línea. Propaga ValidationError.
+        """
+        if self.profiler is not None:
+            return self._compile_line_profiled(source, line)
+        tokens = self.lexer.tokenize(source)
+        validate(tokens)
+        return self.compile_tokens(tokens, line, source)
+
+    def _compile_line_profiled(self, source: str, line: int) -> Instruction:
+        tokens = self._parse_profiled(source)
+        t0 = perf_counter()
+        instr = self.compile_tokens(tokens, line, source)
+        self.profiler.record_stage("compile", perf_counter() - t0)
+        return instr
+
+    def _parse_profiled(self, source: str) -> List[Token]:
+        profiler = self.profiler
+        t0 = perf_counter()
+        tokens = self.lexer.tokenize(source)
+        t1 = perf_counter()
+        profiler.record_stage("lex", t1 - t0)
+        validate(tokens)
+        profiler.record_stage("parse", perf_counter() - t1)
+        return tokens
+
+    def compile(self, source: str, first_line: int = 1) -> Program:
+        """
+        Compila un script completo; las líneas vacías se ignoran.
+
+        El cuerpo de cada bloque `repetir <n> ... fin` se compila una sola
+        vez como un Program que queda como segundo operando de la instrucción
+        `repetir`.
+
+        Args:
+            source: Texto del script.
+            first_line: Número de la primera línea de `source` (para
+                compilar un fragmento de un script mayor).
+
+        Raises:
+            CompileError con el número de línea del primer error.
+        """
+        instructions: List[Instruction] = []
+        # Bloques abiertos: (línea, texto, comando, cabecera, instrucciones
+        # de fuera del bloque). La cabecera es el operando de la cuenta de
+        # un bucle o (nombre, parámetros) de una misión.
+        open_blocks: List[Tuple[int, str, str, Any, List[Instruction]]] = []
+        # El cuerpo de una misión se compila con su propia tabla de símbolos.
+        symbols = self.symbols
+        try:
+            for idx, text in enumerate(source.split("\n"), start=first_line):
+                text = text.strip()
+                if not text:
+                    continue
+                try:
+                    if self.profiler is not None:
+                        tokens = self._parse_profiled(text)
+                    else:
+                        tokens = self.lexer.tokenize(text)
+                        validate(tokens)
+                    cmd = tokens[0].value
+                    if cmd in BLOCK_COMMANDS:
+                        open_blocks.append((idx, text, cmd, self._operand(tokens[1]),
+                                            instructions))
+                        instructions = []
+                    elif cmd == "mision":
+                        if open_blocks:
+                            raise ValidationError(
+                                "Una misión no se puede definir dentro de otro bloque.")
+                        name, params = tokens[1].value, [t.value for t in tokens[2:]]
+                        if len(set(params)) != len(params):
+                            raise ValidationError(
+                                f"La misión '{name}' tiene parámetros repetidos.")
+                        self.symbols = SymbolTable()
+                        for param in params:
+                            self.symbols.intern(param)
+                        open_blocks.append((idx, text, cmd, (name, params), instructions))
+                        instructions = []
+                    elif cmd == BLOCK_END and open_blocks:
+                        line, head, block, header, outer = open_blocks.pop()
+                        body = Program(instructions, self.symbols)
+                        if block == "mision":
+                            operands: Tuple[Any, ...] = ((False, Mission(*header, body)),)
+                            self.symbols = symbols
+                        else:
+                            operands = (header, (False, body))
+                        outer.append(Instruction(line, block, self.handlers[KEYWORD_ACTIONS[block]],
+                                                 operands, head))
+                        instructions = outer
+                    elif cmd == "regresar" and self.symbols is not symbols:
+                        instructions.append(Instruction(idx, cmd, self.handlers[KEYWORD_ACTIONS[cmd]],
+                                                        (self._operand(tokens[1]),), text))
+                    else:
+                        instructions.append(self.compile_tokens(tokens, idx, text))
+                except ValidationError as e:
+                    raise CompileError(idx, f"Error de sintaxis: {e}") from e
+        finally:
+            self.symbols = symbols
+        if open_blocks:
+            line, _, block, _, _ = open_blocks[-1]
+            raise CompileError(line, f"Error de sintaxis: Falta '{BLOCK_END}' para el bloque '{block}'.")
+        return Program(instructions, self.symbols)
+
+    def _call_operands(self, tokens: List[Token], target: Operand) -> Tuple[Operand, ...]:
+        # (nombre de la misión, destino del valor de regreso, argumentos...)
+        return ((False, tokens[0].value), target) + tuple(self._operand(t) for t in tokens[1:])
+
+    def _operand(self, token: Token) -> Operand:
+        """
+        Devuelve (es_variable, valor). Los números ya vienen convertidos del
+        lexer y los identificadores se resuelven a su slot.
+        """
+        kind = token.kind
+        if kind is TokenKind.IDENTIFICADOR:
+            return (True, self.symbols.intern(token.value))
+        if token.number is not None:
+            return (False, token.number)
+        if kind is TokenKind.LISTA:
+            try:
+                return (False, parse_array(token.value))
+            except ValueError as e:
+                raise ValidationError(str(e))
+        return (False, token.value)
+
+
+def group_blocks(lines: Iterable[str], first_line: int = 1) -> Iterator[Tuple[int, str, bool]]:
+    """
+    Agrupa las líneas de un script que se ejecuta línea a línea: cada bloque
+    `repetir ... fin` o `mision ... fin` completo se entrega junto, para
+    compilarlo con Compiler.compile.
+
+    Genera (número de línea, texto, es_bloque). El texto de un bloque
+    conserva sus líneas vacías, así su línea i es la `número + i`. Un bloque
+    sin cerrar al final se entrega igualmente (su compilación informa del
+    error).
+    """
+    block: List[str] = []
+    start = depth = 0
+    for idx, line in enumerate(lines, start=first_line):
+        line = line.strip()
+        word = line.split(None, 1)[0].lower() if line else ""
+        if depth:
+            block.append(line)
+            if word in BLOCK_OPENERS:
+                depth += 1
+            elif word == BLOCK_END:
+                depth -= 1
+                if not depth:
+                    yield (start, "\n".join(block), True)
+                    block = []
+        elif word in BLOCK_OPENERS:
+            start, depth, block = idx, 1, [line]
+        elif line:
+            yield (idx, line, False)
+    if depth:
+        yield (start, "\n".join(block), True)
@@ -3,12 +3,16 @@ Módulo de interfaz gráfica para el intérprete Gamer.
 Incluye área de texto, botones de compilar/ejecutar y consola de resultados.
 """
 
+import io
+import queue
+import threading
 import tkinter as tk
 from tkinter import scrolledtext, messagebox
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+from interprete.compiler import group_blocks
 from interprete.interpreter import Interpreter, InterpreterError
-from interprete.lexer import Lexer
-from interprete.parser import Parser, ParserError
 from interprete.keywords import KEYWORDS
+from interprete.tokens import as_tuples
 
 EXAMPLE = (
     "crear a = 10\n"
@@ -25,13 +29,110 @@ EXAMPLE = (
     "decir a\n"
 )
 
+# Líneas máximas que conserva la consola; las más antiguas se descartan.
+MAX_CONSOLE_LINES = 5000
+# Cada cuántos milisegundos se vuelca la cola de resultados en la consola.
+FLUSH_INTERVAL_MS = 50
+# Líneas que el hilo de trabajo agrupa antes de enviarlas por la cola.
+BATCH_SIZE = 200
+
+ConsoleLine = Tuple[str, Optional[str]]
+
+
+def iter_console_lines(text: str, interpreter: Interpreter, execute: bool,
+                       stop: Optional[threading.Event] = None) -> Iterator[ConsoleLine]:
+    """
+    Procesa un script y devuelve todas sus líneas de consola (texto, etiqueta).
+    Para recibirlas a medida que se generan, usar write_console_lines.
+    """
+    lines: List[ConsoleLine] = []
+    write_console_lines(text, interpreter, execute, lines.append, stop)
+    return iter(lines)
+
+
+def write_console_lines(text: str, interpreter: Interpreter, execute: bool,
+                        emit: Callable[[ConsoleLine], Any],
+                        stop: Optional[threading.Event] = None) -> None:
+    """
+    Procesa un script línea a línea y pasa cada línea de consola (texto,
+    etiqueta) a `emit` en cuanto se genera.
+    Cada línea se tokeniza una sola vez; los tokens se reutilizan para compilar.
+    Los bloques `repetir ... fin` se compilan completos y sus resultados se
+    emiten uno a uno durante la ejecución; `stop` se comprueba antes de cada
+    línea y tras cada resultado, así que también detiene un bucle largo.
+    """
+    for idx, line, block in group_blocks(io.StringIO(text)):
+        if stop is not None and stop.is_set():
+            emit(("Ejecución detenida.", "error"))
+            return
+        if block:
+            if _write_block(line, idx, interpreter, execute, emit, stop):
+                emit(("Ejecución detenida.", "error"))
+                return
+            continue
+        try:
+            tokens = interpreter.lexer.tokenize(line)
+            emit((f"Línea {idx} - Tokens: {as_tuples(tokens)}", None))
+            try:
+                instr = interpreter.compile_tokens(tokens, idx, line)
+            except InterpreterError as e:
+                emit((f"Línea {idx} - {e}", "error"))
+                continue
+            emit((f"Línea {idx} - Sintaxis: válida", None))
+            if not execute:
+                continue
+            result = interpreter.execute(instr)
+            emit((f"Línea {idx} - Compilado correctamente.", None))
+            emit((f"Línea {idx} - {result}", None))
+        except InterpreterError as e:
+            emit((f"Línea {idx} - Error: {e}", "error"))
+        except Exception as e:
+            emit((f"Línea {idx} - Error inesperado: {e}", "error"))
+
+
+class _Stopped(Exception):
+    # Interrumpe la ejecución de un bloque desde el receptor de resultados.
+    pass
+
+
+def _write_block(text: str, idx: int, interpreter: Interpreter, execute: bool,
+                 emit: Callable[[ConsoleLine], Any],
+                 stop: Optional[threading.Event]) -> bool:
+    # Devuelve True si la ejecución se detuvo a mitad del bloque.
+    try:
+        program = interpreter.compile(text, optimize=False, first_line=idx)
+    except InterpreterError as e:
+        emit((f"Línea {e.line} - {e}", "error"))
+        return False
+    emit((f"Línea {idx} - Bloque compilado: {len(list(program.walk()))} instrucciones.", None))
+    if not execute:
+        return False
+
+    def sink(result):
+        emit((f"Línea {idx} - {result}", None))
+        if stop is not None and stop.is_set():
+            raise _Stopped
+
+    try:
+        for instr in program.instructions:
+            sink(interpreter.execute(instr, sink))
+    except _Stopped:
+        return True
+    except InterpreterError as e:
+        emit((f"Línea {e.line} - Error: {e}", "error"))
+    except Exception as e:
+        emit((f"Línea {idx} - Error inesperado: {e}", "error"))
+    return False
+
+
 def run_gui() -> None:
     """
     Inicia la interfaz gráfica del intérprete Gamer.
     """
     interpreter = Interpreter()
-    lexer = Lexer()
-    parser = Parser()
+    results: "queue.Queue" = queue.Queue()
+    stop = threading.Event()
+    worker: Optional[threading.Thread] = None
 
     def show_help():
         msg = (
@@ -41,54 +142,88 @@ def run_gui() -> None:
         )
         messagebox.showinfo("Ayuda - Intérprete Gamer", msg)
 
-    def insert_line(text, color=None):
-        console_area.config(state=tk.NORMAL)
-        if color:
-            console_area.insert(tk.END, text + "\n", color)
+    def work(text, execute):
+        # Hilo de trabajo: no toca Tk, solo envía lotes de líneas por la cola.
+        # El último lote y el fin se envían aunque el hilo falle: si no, la
+        # interfaz quedaría esperando con los botones desactivados.
+        batch = []
+
+        def emit(item):
+            nonlocal batch
+            batch.append(item)
+            if len(batch) >= BATCH_SIZE:
+                results.put(batch)
+                batch = []
+
+        try:
+            write_console_lines(text, interpreter, execute, emit, stop)
+        finally:
+            results.put(batch)
+            results.put(None)
+
+    def start(execute):
+        nonlocal worker
+        if worker is not None:
+            return
+        clear_console()
+        stop.clear()
+        set_running(True)
+        text = text_area.get("1.0", tk.END)
+        worker = threading.Thread(target=work, args=(text, execute), daemon=True)
+        worker.start()
+        root.after(FLUSH_INTERVAL_MS, flush)
+
+    def flush():
+        # Vuelca en la consola todo lo acumulado con un solo cambio de estado.
+        nonlocal worker
+        finished = False
+        chunks = []
+        try:
+            while True:
+                batch = results.get_nowait()
+                if batch is None:
+                    finished = True
+                    break
+                chunks.extend(batch)
+        except queue.Empty:
+            pass
+        if chunks:
+            write_lines(chunks)
+        if finished:
+            worker = None
+            set_running(False)
         else:
-            console_area.insert(tk.END, text + "\n")
-        console_area.config(state=tk.DISABLED)
+            root.after(FLUSH_INTERVAL_MS, flush)
 
-    def compile_only():
+    def write_lines(lines):
         console_area.config(state=tk.NORMAL)
-        console_area.delete("1.0", tk.END)
-        for idx, line in enumerate(text_area.get("1.0", tk.END).strip().split('\n'), start=1):
-            line = line.strip()
-            if not line:
-                continue
-            tokens = lexer.tokenize(line)
-            insert_line(f"Línea {idx} - Tokens: {tokens}")
-            try:
-                parser.parse(tokens)
-                insert_line(f"Línea {idx} - Sintaxis: válida")
-            except ParserError as pe:
-                insert_line(f"Línea {idx} - Error de sintaxis: {pe}", "error")
+        # Agrupa líneas consecutivas con la misma etiqueta en una sola inserción.
+        pending, tag = [], None
+        for text, line_tag in lines:
+            if line_tag != tag and pending:
+                console_area.insert(tk.END, "".join(pending), tag or ())
+                pending = []
+            tag = line_tag
+            pending.append(text + "\n")
+        if pending:
+            console_area.insert(tk.END, "".join(pending), tag or ())
+        excess = int(console_area.index("end-1c").split(".")[0]) - MAX_CONSOLE_LINES
+        if excess > 0:
+            console_area.delete("1.0", f"{excess + 1}.0")
+        console_area.see(tk.END)
         console_area.config(state=tk.DISABLED)
 
+    def set_running(running):
+        state = tk.DISABLED if running else tk.NORMAL
+        compile_btn.config(state=state)
+        run_btn.config(state=state)
+        stop_btn.config(state=tk.NORMAL if running else tk.DISABLED)
+
+    def compile_only():
+        start(execute=False)
+
     def compile_and_execute():
-        console_area.config(state=tk.NORMAL)
-        console_area.delete("1.0", tk.END)
-        for idx, line in enumerate(text_area.get("1.0", tk.END).strip().split('\n'), start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                tokens = lexer.tokenize(line)
-                insert_line(f"Línea {idx} - Tokens: {tokens}")
-                try:
-                    parser.parse(tokens)
-                    insert_line(f"Línea {idx} - Sintaxis: válida")
-                except ParserError as pe:
-                    insert_line(f"Línea {idx} - Error de sintaxis: {pe}", "error")
-                    continue
-                result = interpreter.eval_instruction(line)
-                insert_line(f"Línea {idx} - Compilado correctamente.")
-                insert_line(f"Línea {idx} - {result}")
-            except InterpreterError as e:
-                insert_line(f"Línea {idx} - Error: {e}", "error")
-            except Exception as e:
-                insert_line(f"Línea {idx} - Error inesperado: {e}", "error")
-        console_area.config(state=tk.DISABLED)
+        start(execute=True)
 
     def clear_console():
         console_area.config(state=tk.NORMAL)
@@ -112,6 +247,8 @@ def run_gui() -> None:
     compile_btn.pack(side=tk.LEFT, padx=8)
     run_btn = tk.Button(button_frame, text="Compilar y Ejecutar", command=compile_and_execute, bg="#00FF00", fg="black", font=("Arial", 10, "bold"), width=18)
     run_btn.pack(side=tk.LEFT, padx=8)
+    stop_btn = tk.Button(button_frame, text="Detener", command=stop.set, bg="#B50000", fg="white", font=("Arial", 10, "bold"), width=10, state=tk.DISABLED)
+    stop_btn.pack(side=tk.LEFT, padx=8)
     clear_btn = tk.Button(button_frame, text="Limpiar consola", command=clear_console, bg="#393E46", fg="white", font=("Arial", 10, "bold"), width=15)
     clear_btn.pack(side=tk.LEFT, padx=8)
     help_btn = tk.Button(button_frame, text="Ayuda", command=show_help, bg="#222831", fg="#00ADB5", font=("Arial", 10, "bold"), width=10)
@@ -124,4 +261,4 @@ def run_gui() -> None:
     console_area.pack(padx=8, pady=8)
     console_area.tag_config("error", foreground="red", font=("Courier New", 11, "bold"))
 
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
@@ -3,17 +3,65 @@ Módulo principal del intérprete Gamer.
 Integra análisis léxico, sintáctico y semántico para procesar instrucciones.
 """
 
-from typing import Any, Dict, Union, List, Tuple
+from typing import Any, Callable, Dict, Optional, Union, List, Tuple
 import math
+import operator
+import weakref
+from itertools import repeat
+from time import perf_counter
 
-from interprete.lexer import Lexer
-from interprete.parser import Parser, ParserError
-from interprete.semantic import SemanticAnalyzer, SemanticError
-from interprete.keywords import KEYWORD_ACTIONS
+from interprete.parser import Parser
+from interprete.semantic import SemanticAnalyzer, ARITY_ERROR, COUNT_ERROR
+from interprete.validator import validate, ValidationError
+from interprete.keywords import BLOCK_COMMANDS, BLOCK_END, BLOCK_OPENERS, KEYWORD_ACTIONS
+from interprete.compiler import Compiler, CompileError, Instruction, Mission, Operand, Program
+from interprete.symbols import SharedValues, SymbolTable, VariablesView, UNDEFINED
+from interprete.profiler import Profiler
+from interprete.limits import Limits, DEADLINE_CHECK_INTERVAL, MAX_CALL_DEPTH
+from interprete.results import Result
+from interprete import codegen
+from interprete import optimizer
+from interprete import cache as script_cache
+from interprete import arrays
+from interprete.arrays import ARRAY_TYPES
+from interprete.tokens import Token, TokenKind, as_tokens
+
+SHAPE_ERROR = "Los arreglos no tienen formas compatibles."
+OVERFLOW_ERROR = "El resultado no cabe en un arreglo de enteros."
+RUN_MODES = ("text", "result", "quiet")
+# Instrucciones que ejecutan otras (y consumen presupuesto por ellas).
+NESTED_COMMANDS = BLOCK_COMMANDS | {"llamar"}
+# Motores de ejecución de run(): los manejadores de referencia o el código
+# Python generado por interprete.codegen.
+BACKENDS = ("reference", "python")
 
 class InterpreterError(Exception):
     """Excepción personalizada para errores del intérprete."""
-    pass
+
+    def __init__(self, message: str = "", line: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.line = line
+
+class ResourceLimitError(InterpreterError):
+    """
+    Se superó un límite de recursos (interprete.limits.Limits). `limit` es el
+    nombre del límite: "max_instructions", "max_bits", "max_string",
+    "timeout", "max_depth" o "max_calls".
+    """
+
+    def __init__(self, message: str, limit: str, line: Optional[int] = None) -> None:
+        super().__init__(message, line)
+        self.limit = limit
+
+    def __reduce__(self):
+        # Se reconstruye con todos sus argumentos al volver de otro proceso.
+        return (type(self), (str(self), self.limit, self.line))
+
+class _Return(Exception):
+    # `regresar` en medio del cuerpo de una misión: lleva el valor a la llamada.
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
 
 class Interpreter:
     """
@@ -21,153 +69,1036 @@ class Interpreter:
     Integra lexer, parser y semantic.
     """
 
-    def __init__(self) -> None:
-        self.variables: Dict[str, Union[int, float, str]] = {}
-        self.lexer = Lexer()
+    # Tamaño máximo de la caché de líneas compiladas de eval_instruction.
+    LINE_CACHE_SIZE = 1024
+
+    def __init__(self, limits: Optional[Limits] = None, backend: str = "reference") -> None:
+        # Cada variable ocupa un slot fijo: los manejadores acceden por índice.
+        self.symbols = SymbolTable()
+        self._values: List[Any] = []
+        self._variables = VariablesView(self.symbols, self._values, self._before_write)
+        self.compiler = Compiler(HANDLERS, self.symbols)
+        self.lexer = self.compiler.lexer
         self.parser = Parser()
         self.semantic = SemanticAnalyzer()
+        self._line_cache: Dict[str, Instruction] = {}
+        self._linked: "weakref.WeakKeyDictionary[Program, Program]" = weakref.WeakKeyDictionary()
+        # Perfilador activo; None mientras el perfilado está desactivado.
+        self.profiler: Optional[Profiler] = None
+        self._profile_data: Optional[Profiler] = None
+        # Resultados guardados por instrucciones que el optimizador reutiliza.
+        self._registers: Dict[int, Result] = {}
+        # Límites de recursos; None = sin comprobaciones.
+        self.limits = limits
+        self.backend = backend
+        # Traducciones a Python de cada programa enlazado: {keep: PythonProgram}.
+        self._generated: "weakref.WeakKeyDictionary[Program, Dict[bool, codegen.PythonProgram]]" = \
+            weakref.WeakKeyDictionary()
+        # Posiciones (+1) de los `repetir`/`llamar` de primer nivel de cada
+        # programa, donde termina un bloque de _run_governed con presupuesto.
+        self._nested: "weakref.WeakKeyDictionary[Program, List[int]]" = \
+            weakref.WeakKeyDictionary()
+        # Estado de la ejecución en curso que consultan los bucles: destino
+        # de los resultados del cuerpo, instrucciones que quedan del
+        # presupuesto y hora límite. Todo None fuera de run().
+        self._sink: Optional[Callable[[Result], Any]] = None
+        self._remaining: Optional[int] = None
+        self._deadline: Optional[float] = None
+        self._calls_left: Optional[int] = None
+        # Misiones definidas y marcos de llamada, uno por nivel de
+        # profundidad, que se reutilizan de una llamada a otra.
+        self._missions: Dict[str, Mission] = {}
+        self._frames: List[List[Any]] = []
+        self._depth = 0
+        # True si self._values es la base de algún fork(): antes de escribir
+        # en él hay que copiarlo (_unshare).
+        self._shared = False
+
+    @property
+    def limits(self) -> Optional[Limits]:
+        """
+        Límites de recursos activos (interprete.limits.Limits) o None.
+        Los topes se leen al asignar: para cambiarlos se asigna de nuevo.
+        """
+        return self._limits
+
+    @limits.setter
+    def limits(self, limits: Optional[Limits]) -> None:
+        self._limits = limits
+        # Copias planas para que los manejadores hagan una sola comprobación.
+        self._max_bits = limits.max_bits if limits is not None else None
+        self._max_string = limits.max_string if limits is not None else None
+        self._max_depth = MAX_CALL_DEPTH
+        if limits is not None and limits.max_depth is not None:
+            self._max_depth = limits.max_depth
+
+    @property
+    def backend(self) -> str:
+        """
+        Motor de run(): "reference" ejecuta cada instrucción con su manejador;
+        "python" traduce el programa a código Python (interprete.codegen) la
+        primera vez que se ejecuta y después corre ese código. Con límites de
+        recursos o perfilado activos, run() usa siempre el motor de referencia.
+        """
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend: str) -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Motor de ejecución desconocido: {backend}")
+        self._backend = backend
+
+    @property
+    def variables(self) -> VariablesView:
+        """
+        Vista tipo diccionario (nombre -> valor) de las variables definidas.
+        Leerla no copia el estado compartido con los fork(); escribir, sí.
+        """
+        return self._variables
+
+    @variables.setter
+    def variables(self, mapping: Dict[str, Union[int, float, str]]) -> None:
+        if self._shared:
+            self._unshare()
+        self._variables.clear()
+        self._variables.update(mapping)
+
+    def fork(self) -> "Interpreter":
+        """
+        Crea una sesión hija que parte del estado actual sin copiarlo: las
+        variables se comparten copia-en-escritura y la hija solo guarda las
+        que escribe, así que bifurcar cuesta lo mismo con 10 que con 100.000
+        variables. Lo que haga la hija no afecta al padre ni a sus hermanas,
+        y viceversa; si el padre vuelve a escribir, copia antes su arreglo
+        de valores una sola vez.
+
+        La hija comparte la tabla de símbolos (los programas compilados por
+        el padre se ejecutan en ella sin reenlazar), hereda límites, motor y
+        misiones, y empieza sin perfilador.
+        """
+        child = type(self)(self._limits, self._backend)
+        child.symbols = child.compiler.symbols = self.symbols
+        values = self._values
+        if type(values) is SharedValues:
+            child._values = values.fork()
+        else:
+            child._values = SharedValues(values)
+            self._shared = True
+        child._variables = VariablesView(self.symbols, child._values, child._before_write)
+        child._missions = dict(self._missions)
+        # Cachés que dependen solo de la tabla de símbolos.
+        child._line_cache = self._line_cache
+        child._linked = self._linked
+        child._generated = self._generated
+        child._nested = self._nested
+        return child
+
+    def _unshare(self) -> None:
+        # Deja la base intacta para los fork() que la usan. La vista se
+        # conserva (puede haberla guardado quien llamó a `variables`).
+        self._values = self._variables._values = list(self._values)
+        self._shared = False
+
+    def _before_write(self) -> None:
+        if self._shared:
+            self._unshare()
+
+    def snapshot(self, path: str) -> None:
+        """
+        Guarda las variables y las misiones en una instantánea binaria
+        (interprete.snapshot), de forma atómica.
+
+        Raises:
+            TypeError si alguna variable no se puede guardar.
+        """
+        from interprete import snapshot
+        snapshot.dump(self, path)
+
+    def restore(self, path: str) -> None:
+        """
+        Reemplaza las variables y las misiones por las de una instantánea
+        guardada con snapshot(). Los programas ya compilados siguen siendo
+        válidos.
+
+        Raises:
+            OSError si no se puede leer; ValueError si no es una instantánea
+            válida de esta versión.
+        """
+        from interprete import snapshot
+        snapshot.load(self, path)
 
     def eval_instruction(self, instruction: str) -> Any:
-        # 1. Análisis léxico
-        tokens = self.lexer.tokenize(instruction)
+        return self.evaluate(instruction).text()
+
+    def evaluate(self, instruction: str) -> Result:
+        """
+        Compila (con caché) y ejecuta una línea; devuelve un Result sin formatear.
+        """
+        return self.execute(self.prepare(instruction))
+
+    def prepare(self, instruction: str) -> Instruction:
+        """
+        Compila una línea para este intérprete, reutilizando la caché de líneas.
+
+        Raises:
+            InterpreterError si la instrucción no es válida.
+        """
+        instr = self._line_cache.get(instruction)
+        if instr is None:
+            try:
+                instr = self._compile_instruction(instruction)
+            finally:
+                self._grow_frame()
+            if len(self._line_cache) >= self.LINE_CACHE_SIZE:
+                self._line_cache.clear()
+            self._line_cache[instruction] = instr
+        elif len(self._values) < len(self.symbols):
+            # Línea compilada por un fork() que reservó nombres nuevos en la
+            # tabla compartida.
+            self._grow_frame()
+        return instr
+
+    def resolve_operands(self, instr: Instruction) -> Tuple[Any, ...]:
+        """
+        Valores actuales de los operandos de una instrucción.
+
+        Raises:
+            InterpreterError si alguna variable no está definida.
+        """
+        return tuple(self._fetch(operand) for operand in instr.operands)
 
-        # 2. Análisis sintáctico
+    def execute(self, instr: Instruction,
+                sink: Optional[Callable[[Result], Any]] = None) -> Result:
+        """
+        Ejecuta una instrucción ya compilada por este intérprete.
+
+        Args:
+            instr: Instrucción compilada.
+            sink: Función que recibe, en orden, el Result de cada instrucción
+                del cuerpo de un bucle; si es None se descartan.
+        """
+        if sink is not None:
+            self._sink = sink
+            try:
+                return self.execute(instr)
+            finally:
+                self._sink = None
+        if len(self._values) < len(self.symbols):
+            self._grow_frame()
+        if self.profiler is not None:
+            return self._execute_profiled(instr, instr.line or instr.source)
+        return instr.handler(self, instr.operands)
+
+    def compile_tokens(self, tokens: List[Token], line: int = 0,
+                       source: str = "") -> Instruction:
+        """
+        Valida y compila una instrucción ya tokenizada, sin volver a tokenizar.
+        También acepta tokens en forma de tupla (tipo, valor).
+
+        Raises:
+            InterpreterError si la instrucción no es válida.
+        """
+        tokens = as_tokens(tokens)
         try:
-            self.parser.parse(tokens)
-        except ParserError as e:
-            raise InterpreterError(f"Error de sintaxis: {e}")
+            validate(tokens)
+            instr = self.compiler.compile_tokens(tokens, line, source)
+        except ValidationError as e:
+            raise InterpreterError(f"Error de sintaxis: {e}", line or None)
+        finally:
+            self._grow_frame()
+        return instr
+
+    def compile(self, source: str, optimize: bool = True, first_line: int = 1) -> Program:
+        """
+        Compila un script completo una sola vez.
+
+        Args:
+            source: Texto del script.
+            optimize: Si es True, aplica el optimizador; el informe queda
+                en `program.report`.
+            first_line: Número de la primera línea de `source`, si es un
+                fragmento de un script mayor.
+
+        Raises:
+            InterpreterError con la línea del primer error de compilación.
+        """
+        program = self._compile_checked(source, first_line)
+        if optimize:
+            program = optimizer.optimize(program, self)
+        return program
+
+    def compile_file(self, path: str, optimize: bool = True, use_cache: bool = True,
+                     cache_dir: Optional[str] = None) -> Program:
+        """
+        Compila un archivo usando la caché en disco: si el script, la versión
+        y la gramática no cambiaron, el programa se carga sin pasar por el
+        lexer, el parser ni el análisis semántico.
+
+        Args:
+            path: Ruta del script.
+            optimize: Igual que en compile(); el optimizador se aplica
+                también a los programas cargados de la caché.
+            use_cache: Si es False, compila siempre desde el texto.
+            cache_dir: Directorio de la caché; por defecto, __gamercache__
+                junto al script.
+
+        Raises:
+            InterpreterError con la línea del primer error de compilación.
+        """
+        with open(path, "rb") as f:
+            raw = f.read()
+        if not use_cache:
+            return self.compile(raw.decode("utf-8"), optimize)
+        key = script_cache.source_key(raw)
+        location = script_cache.cache_path(path, cache_dir)
+        entry = script_cache.load(location, key)
+        if entry is not None:
+            program = self._load_cached(*entry)
+        else:
+            program = self._compile_checked(raw.decode("utf-8"))
+            try:
+                script_cache.dump(location, key, *self._cache_records(program))
+            except OSError:
+                pass  # Sin permiso de escritura: se compila en cada ejecución.
+        if optimize:
+            program = optimizer.optimize(program, self)
+        return program
+
+    def run(self, program: Program, mode: str = "text") -> Optional[List[Any]]:
+        """
+        Ejecuta un programa compilado.
+
+        Args:
+            program: Programa devuelto por compile().
+            mode: "text" devuelve los resultados como texto, "result" como
+                objetos Result y "quiet" los descarta sin formatear nada.
 
-        # 3. Análisis semántico
+        Los resultados de las instrucciones de un bucle se incluyen, en
+        orden, antes del resultado del propio `repetir`.
+
+        Raises:
+            InterpreterError con la línea de la instrucción que falló.
+        """
+        if mode not in RUN_MODES:
+            raise ValueError(f"Modo de ejecución desconocido: {mode}")
+        program = self._link(program)
+        # La tabla de símbolos puede ser compartida con un fork() que reservó
+        # nombres nuevos.
+        self._grow_frame()
+        keep = mode != "quiet"
+        results: List[Result] = []
+        append = results.append
+        instr = None
+        self._sink = append if keep else None
+        try:
+            if self._limits is not None:
+                self._run_governed(program, append if keep else None)
+            elif self.profiler is not None:
+                for instr in program.instructions:
+                    result = self._execute_profiled(instr, instr.line)
+                    if keep:
+                        append(result)
+            elif self._backend == "python":
+                self._run_python(program, append if keep else None)
+            elif keep:
+                for instr in program.instructions:
+                    append(instr.handler(self, instr.operands))
+            else:
+                for instr in program.instructions:
+                    instr.handler(self, instr.operands)
+        except InterpreterError as e:
+            if e.line is None:
+                e.line = instr.line
+            raise
+        finally:
+            self._sink = None
+        if mode == "text":
+            return [result.text() for result in results]
+        if mode == "result":
+            return results
+        return None
+
+    def _run_governed(self, program: Program, append) -> None:
+        # Bucle de run() con límites. Se ejecuta por bloques de
+        # DEADLINE_CHECK_INTERVAL instrucciones: el presupuesto se descuenta
+        # por bloque y el reloj se consulta una vez por bloque, así el bucle
+        # interno es el mismo que sin límites. Con presupuesto, un bloque
+        # termina en cada `repetir`, que descuenta sus vueltas de
+        # self._remaining antes de que siga el programa; lo mismo con cada
+        # `llamar`.
+        limits = self._limits
+        instructions = program.instructions
+        total = len(instructions)
+        remaining = limits.max_instructions
+        deadline = None
+        step = total or 1
+        if limits.timeout is not None:
+            deadline = perf_counter() + limits.timeout
+            step = DEADLINE_CHECK_INTERVAL
+        loops = iter(())
+        if remaining is not None:
+            nested = self._nested.get(program)
+            if nested is None:
+                nested = self._nested[program] = [
+                    idx + 1 for idx, instr in enumerate(instructions)
+                    if instr.command in NESTED_COMMANDS]
+            loops = iter(nested)
+        next_loop = next(loops, total)
+        self._deadline = deadline
+        self._calls_left = limits.max_calls
+        profiled = self.profiler is not None
+        instr = None
+        start = 0
         try:
-            self.semantic.variables = self.variables  # Sincroniza variables
-            self.semantic.analyze(tokens)
-        except SemanticError as e:
-            raise InterpreterError(f"Error semántico: {e}")
-
-        # 4. Ejecución de la instrucción
-        cmd = tokens[0][1]
-        action = KEYWORD_ACTIONS.get(cmd, None)
-
-        if action == "definir_variable":
-            name = tokens[1][1]
-            rhs_tipo, rhs_val = tokens[3]
-            # Resolver el valor según el tipo del token RHS.
-            if rhs_tipo == "NUMERO":
-                value = int(rhs_val)
-            elif rhs_tipo == "DECIMAL":
-                value = float(rhs_val)
-            elif rhs_tipo == "CADENA":
-                value = rhs_val
-            elif rhs_tipo == "IDENTIFICADOR":
-                # Si existe la variable referenciada, copiar su valor.
-                if rhs_val in self.variables:
-                    value = self.variables[rhs_val]
+            while start < total:
+                if start and deadline is not None and perf_counter() > deadline:
+                    raise self._timeout_error(instructions[start].line)
+                end = min(start + step, total)
+                if remaining is not None:
+                    while next_loop <= start:
+                        next_loop = next(loops, total)
+                    end = min(end, next_loop, start + remaining)
+                    if end == start:
+                        raise self._budget_error(instructions[start].line)
+                    self._remaining = remaining - (end - start)
+                block = instructions[start:end]
+                if profiled:
+                    for instr in block:
+                        result = self._execute_profiled(instr, instr.line)
+                        if append is not None:
+                            append(result)
+                elif append is not None:
+                    for instr in block:
+                        append(instr.handler(self, instr.operands))
                 else:
-                    # Si no existe, lo tomamos como literal string (ej: crear nombre = Juan)
-                    value = rhs_val
+                    for instr in block:
+                        instr.handler(self, instr.operands)
+                if remaining is not None:
+                    remaining = self._remaining
+                start = end
+        except InterpreterError as e:
+            if e.line is None:
+                e.line = instr.line
+            raise
+        finally:
+            self._remaining = self._deadline = self._calls_left = None
+
+    def _run_python(self, program: Program, append) -> None:
+        # El código generado escribe directamente en self._values. Con el
+        # motor de referencia, cada manejador que escribe copia antes el
+        # arreglo compartido con los fork().
+        if self._shared:
+            self._unshare()
+        keep = append is not None
+        generated = self._generated.get(program)
+        if generated is None:
+            generated = self._generated[program] = {}
+        compiled = generated.get(keep)
+        if compiled is None:
+            compiled = generated[keep] = codegen.translate(program, HANDLERS, FAST_HANDLERS, keep)
+        try:
+            compiled.run(self, append)
+        except InterpreterError as e:
+            if e.line is None:
+                e.line = compiled.line_at(e.__traceback__)
+            raise
+
+    def _budget_error(self, line: Optional[int]) -> ResourceLimitError:
+        return ResourceLimitError(
+            f"Se superó el límite de {self._limits.max_instructions} instrucciones.",
+            "max_instructions", line)
+
+    def _timeout_error(self, line: Optional[int]) -> ResourceLimitError:
+        return ResourceLimitError(
+            f"Se superó el tiempo límite de {self._limits.timeout} s.", "timeout", line)
+
+    def _check_bits(self, a, b, power: bool) -> None:
+        # Tamaño del resultado entero antes de calcularlo: |a| ** b ocupa
+        # floor(b * log2|a|) + 1 bits (nunca más que b * a.bit_length(), la
+        # cota que prueba _fast_potencia) y a * b, como mucho, la suma de
+        # ambos tamaños.
+        limit = self._max_bits
+        if type(a) is not int or type(b) is not int:
+            return
+        if power:
+            if b <= 0 or -1 <= a <= 1:
+                return
+            bits = b if b > limit else math.floor(b * math.log2(abs(a))) + 1
+        else:
+            bits = a.bit_length() + b.bit_length()
+        if bits > limit:
+            raise ResourceLimitError(
+                f"El resultado superaría el límite de {limit} bits.", "max_bits")
+
+    def _check_folded(self, result: Result) -> None:
+        # Límites de una instrucción que el optimizador calculó al compilar,
+        # quizá sin límites: los mismos que comprueba su manejador.
+        command, args = result.command, result.operands
+        if command in ("poder", "multiplicar"):
+            if self._max_bits is not None and len(args) == 2:
+                self._check_bits(args[0], args[1], command == "poder")
+        elif command == "crear":
+            value = result.value
+            if (self._max_string is not None and type(value) is str
+                    and len(value) > self._max_string):
+                raise ResourceLimitError(
+                    f"La cadena supera el límite de {self._max_string} caracteres.",
+                    "max_string")
+
+    def enable_profiling(self) -> Profiler:
+        """
+        Activa el perfilado (tiempos por etapa y comando, conteo por línea).
+        Los contadores se conservan entre activaciones hasta reset_profiling().
+        """
+        if self._profile_data is None:
+            self._profile_data = Profiler()
+        self.profiler = self.compiler.profiler = self._profile_data
+        return self._profile_data
+
+    def disable_profiling(self) -> None:
+        self.profiler = self.compiler.profiler = None
+
+    def reset_profiling(self) -> None:
+        if self._profile_data is not None:
+            self._profile_data.reset()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Devuelve los contadores de perfilado acumulados.
+
+        Raises:
+            InterpreterError si el perfilado nunca se activó.
+        """
+        if self._profile_data is None:
+            raise InterpreterError("El perfilado no está activo.")
+        return self._profile_data.stats()
+
+    def _execute_profiled(self, instr: Instruction, line) -> Result:
+        profiler = self.profiler
+        profiler.enter_command(instr.command)
+        start = perf_counter()
+        try:
+            return instr.handler(self, instr.operands)
+        finally:
+            profiler.record_command(instr.command, line, perf_counter() - start)
+
+    def _link(self, program: Program) -> Program:
+        """
+        Traduce (una sola vez) un programa compilado con otra tabla de símbolos.
+        """
+        if program.symbols is self.symbols:
+            return program
+        linked = self._linked.get(program)
+        if linked is None:
+            linked = program.relink(self.symbols)
+            self._linked[program] = linked
+            self._grow_frame()
+        return linked
+
+    def _compile_checked(self, source: str, first_line: int = 1) -> Program:
+        try:
+            program = self.compiler.compile(source, first_line)
+        except CompileError as e:
+            raise InterpreterError(str(e), e.line) from e
+        finally:
+            self._grow_frame()
+
+        # Tipos: los errores probados se informan ya; las instrucciones con
+        # operandos escalares probados usan manejadores sin comprobaciones.
+        types = self.semantic.analyze_program(program)
+        if types.errors:
+            line, message = types.errors[0]
+            raise InterpreterError(f"Error semántico: Línea {line}: {message}", line)
+        for instr, scalar in zip(program.walk(), types.scalar):
+            if scalar:
+                instr.handler = FAST_HANDLERS[KEYWORD_ACTIONS[instr.command]]
+        return program
+
+    def _cache_records(self, program: Program) -> Tuple[List[str], List[script_cache.Record]]:
+        # Solo se guardan los nombres que usa el programa, renumerados desde 0.
+        # Los bloques se guardan en línea: el registro del `repetir` sin su
+        # cuerpo, las instrucciones del cuerpo y un registro "fin". El de una
+        # `mision` lleva su nombre, el número de parámetros y los nombres de
+        # su tabla de símbolos, a la que se refieren los slots de su cuerpo.
+        local: Dict[int, int] = {}
+        names: List[str] = []
+        records = []
+
+        def add(instructions: List[Instruction], own: bool) -> None:
+            for instr in instructions:
+                command = instr.command
+                if command == "mision":
+                    mission = instr.operands[0][1]
+                    header = [(False, mission.name), (False, len(mission.params))]
+                    header += [(False, name) for name in mission.body.symbols.names]
+                    records.append((instr.line, command, False, tuple(header), instr.source))
+                    add(mission.body.instructions, False)
+                    records.append((instr.line, BLOCK_END, False, (), BLOCK_END))
+                    continue
+                block = command in BLOCK_COMMANDS
+                operands = []
+                for is_var, value in instr.operands[:1] if block else instr.operands:
+                    if is_var and own:
+                        if value not in local:
+                            local[value] = len(names)
+                            names.append(self.symbols.names[value])
+                        value = local[value]
+                    operands.append((is_var, value))
+                fast = instr.handler is FAST_HANDLERS.get(KEYWORD_ACTIONS[command])
+                records.append((instr.line, command, fast, tuple(operands), instr.source))
+                if block:
+                    add(instr.operands[1][1].instructions, own)
+                    records.append((instr.line, BLOCK_END, False, (), BLOCK_END))
+
+        add(program.instructions, True)
+        return names, records
+
+    def _load_cached(self, names: List[str], records: List[script_cache.Record]) -> Program:
+        slots = [self.symbols.intern(name) for name in names]
+        self._grow_frame()
+        # En un intérprete nuevo los nombres reciben los slots 0..n-1 y los
+        # operandos de la caché se usan tal cual. Dentro de una misión los
+        # slots son de su propia tabla y tampoco se traducen.
+        remap = slots != list(range(len(slots)))
+        symbols = self.symbols
+        instructions: List[Instruction] = []
+        open_blocks: List[Tuple[Instruction, List[Instruction]]] = []
+        for line, command, fast, operands, source in records:
+            if command == BLOCK_END:
+                head, outer = open_blocks.pop()
+                if head.command == "mision":
+                    (_, name), (_, count) = head.operands[:2]
+                    body = Program(instructions, symbols)
+                    head.operands = ((False, Mission(name, symbols.names[:count], body)),)
+                    symbols = self.symbols
+                else:
+                    head.operands += ((False, Program(instructions, symbols)),)
+                outer.append(head)
+                instructions = outer
+                continue
+            action = KEYWORD_ACTIONS[command]
+            handler = FAST_HANDLERS[action] if fast else HANDLERS[action]
+            if command == "mision":
+                symbols = SymbolTable()
+                for _, name in operands[2:]:
+                    symbols.intern(name)
+            elif remap and symbols is self.symbols:
+                operands = tuple((True, slots[v]) if is_var else (False, v)
+                                 for is_var, v in operands)
+            instr = Instruction(line, command, handler, operands, source)
+            if command in BLOCK_OPENERS:
+                open_blocks.append((instr, instructions))
+                instructions = []
             else:
-                # Caso raro: permitirlo por compatibilidad
-                value = rhs_val
-
-            self.variables[name] = value
-            return f"Variable '{name}' definida con valor {value}"
-
-        elif action == "suma":
-            a = self.variables[tokens[1][1]]
-            b = self.variables[tokens[2][1]]
-            self._check_numeric(a, b)
-            return f"Resultado: {a + b}"
-
-        elif action == "resta":
-            a = self.variables[tokens[1][1]]
-            b = self.variables[tokens[2][1]]
-            self._check_numeric(a, b)
-            return f"Resultado: {a - b}"
-
-        elif action == "multiplica":
-            a = self._resolve_value(tokens[1])
-            b = self._resolve_value(tokens[2])
-            self._check_numeric(a, b)
-            return f"Resultado: {a * b}"
-
-        elif action == "divide":
-            a = self._resolve_value(tokens[1])
-            b = self._resolve_value(tokens[2])
-            self._check_numeric(a, b)
-            if b == 0:
-                raise InterpreterError("No se puede dividir por cero.")
-            return f"Resultado: {a / b}"
-
-        elif action == "potencia":
-            a = self._resolve_value(tokens[1])
-            b = self._resolve_value(tokens[2])
-            self._check_numeric(a, b)
-            return f"Resultado: {a ** b}"
-
-        elif action == "raiz":
-            a = self.variables[tokens[1][1]]
-            self._check_numeric(a)
-            if a < 0:
-                raise InterpreterError("No se puede calcular la raíz de un número negativo.")
-            return f"Resultado: {math.sqrt(a)}"
+                instructions.append(instr)
+        return Program(instructions, self.symbols)
+
+    def _grow_frame(self) -> None:
+        missing = len(self.symbols) - len(self._values)
+        if missing > 0:
+            self._values.extend([UNDEFINED] * missing)
 
-        elif action == "abs":
-            a = self.variables[tokens[1][1]]
-            self._check_numeric(a)
-            return f"Resultado: {abs(a)}"
+    def _compile_instruction(self, instruction: str) -> Instruction:
+        # Léxico y validación (una sola pasada), y enlace con el manejador
+        try:
+            return self.compiler.compile_line(instruction)
+        except ValidationError as e:
+            raise InterpreterError(f"Error de sintaxis: {e}")
 
-        elif action == "max":
-            values = [self.variables[name[1]] for name in tokens[1:]]
-            self._check_numeric(*values)
-            return f"Resultado: {max(values)}"
+    # Manejadores de comandos: reciben los operandos ya resueltos.
 
-        elif action == "min":
-            values = [self.variables[name[1]] for name in tokens[1:]]
-            self._check_numeric(*values)
-            return f"Resultado: {min(values)}"
+    def _exec_definir_variable(self, operands) -> Result:
+        (_, slot), (is_var, rhs) = operands
+        if is_var:
+            value = self._values[rhs]
+            if value is UNDEFINED:
+                # Si no existe, lo tomamos como literal string (ej: crear nombre = Juan)
+                value = self.symbols.names[rhs]
+            # Si existe la variable referenciada, se copia su valor.
+        else:
+            value = rhs
+        if (self._max_string is not None and type(value) is str
+                and len(value) > self._max_string):
+            raise ResourceLimitError(
+                f"La cadena supera el límite de {self._max_string} caracteres.",
+                "max_string")
+        if self._shared:
+            self._unshare()
+        self._values[slot] = value
+        return Result("crear", (self.symbols.names[slot],), value)
 
-        elif action == "imprimir":
-            varname = tokens[1][1]
-            if varname not in self.variables:
-                raise InterpreterError(f"La variable '{varname}' no está definida.")
-            value = self.variables[varname]
-            return f"{varname} = {value}"
+    def _exec_suma(self, operands) -> Result:
+        a, b = self._fetch(operands[0]), self._fetch(operands[1])
+        self._check_numeric(a, b)
+        if isinstance(a, ARRAY_TYPES) or isinstance(b, ARRAY_TYPES):
+            value = self._elementwise(operator.add, a, b)
+        else:
+            value = a + b
+        return Result("curar", (a, b), value)
 
+    def _exec_resta(self, operands) -> Result:
+        a, b = self._fetch(operands[0]), self._fetch(operands[1])
+        self._check_numeric(a, b)
+        if isinstance(a, ARRAY_TYPES) or isinstance(b, ARRAY_TYPES):
+            value = self._elementwise(operator.sub, a, b)
+        else:
+            value = a - b
+        return Result("golpear", (a, b), value)
 
+    def _exec_multiplica(self, operands) -> Result:
+        a, b = self._fetch(operands[0]), self._fetch(operands[1])
+        self._check_numeric(a, b)
+        if isinstance(a, ARRAY_TYPES) or isinstance(b, ARRAY_TYPES):
+            value = self._elementwise(operator.mul, a, b)
         else:
-            raise InterpreterError("Comando Gamer no reconocido o no implementado.")
+            if self._max_bits is not None:
+                self._check_bits(a, b, False)
+            value = a * b
+        return Result("multiplicar", (a, b), value)
 
-    def reset(self) -> None:
-        self.variables.clear()
+    def _exec_divide(self, operands) -> Result:
+        a, b = self._fetch(operands[0]), self._fetch(operands[1])
+        self._check_numeric(a, b)
+        if isinstance(b, ARRAY_TYPES):
+            if not b.all():
+                raise InterpreterError("No se puede dividir por cero.")
+        elif b == 0:
+            raise InterpreterError("No se puede dividir por cero.")
+        try:
+            value = a / b
+        except ValueError:
+            raise InterpreterError(SHAPE_ERROR)
+        return Result("dividir", (a, b), value)
+
+    def _exec_potencia(self, operands) -> Result:
+        a, b = self._fetch(operands[0]), self._fetch(operands[1])
+        self._check_numeric(a, b)
+        if isinstance(a, ARRAY_TYPES) or isinstance(b, ARRAY_TYPES):
+            value = self._elementwise(operator.pow, a, b)
+        else:
+            if self._max_bits is not None:
+                self._check_bits(a, b, True)
+            value = a ** b
+        return Result("poder", (a, b), value)
 
-    def _parse_value(self, value: str) -> Union[int, float, str]:
+    def _elementwise(self, function: Callable[..., Any], *operands: Any) -> Any:
+        # Operación con algún arreglo entre los operandos.
         try:
-            return int(value)
+            return arrays.elementwise(function, *operands)
         except ValueError:
-            try:
-                return float(value)
-            except ValueError:
-                return value
+            raise InterpreterError(SHAPE_ERROR)
+        except OverflowError:
+            raise InterpreterError(OVERFLOW_ERROR)
+
+    def _exec_raiz(self, operands) -> Result:
+        a = self._fetch(operands[0])
+        self._check_numeric(a)
+        if isinstance(a, ARRAY_TYPES):
+            if (a < 0).any():
+                raise InterpreterError("No se puede calcular la raíz de un número negativo.")
+            return Result("revivir", (a,), arrays.np.sqrt(a))
+        if a < 0:
+            raise InterpreterError("No se puede calcular la raíz de un número negativo.")
+        return Result("revivir", (a,), math.sqrt(a))
+
+    def _exec_abs(self, operands) -> Result:
+        a = self._fetch(operands[0])
+        self._check_numeric(a)
+        if isinstance(a, ARRAY_TYPES):
+            return Result("xp", (a,), self._elementwise(abs, a))
+        return Result("xp", (a,), abs(a))
+
+    def _exec_max(self, operands) -> Result:
+        values = [self._fetch(op) for op in operands]
+        self._check_numeric(*values)
+        return Result("jefe", tuple(values), self._reduce(values, True))
+
+    def _exec_min(self, operands) -> Result:
+        values = [self._fetch(op) for op in operands]
+        self._check_numeric(*values)
+        return Result("esbirro", tuple(values), self._reduce(values, False))
+
+    def _reduce(self, values: List[Any], largest: bool) -> Any:
+        try:
+            return arrays.reduce(values, largest)
+        except ValueError as e:
+            raise InterpreterError(str(e))
+
+    def _exec_imprimir(self, operands) -> Result:
+        slot = operands[0][1]
+        return Result("decir", (self.symbols.names[slot],), self._fetch(operands[0]))
+
+    def _exec_definir_mision(self, operands) -> Result:
+        mission = operands[0][1]
+        self._missions[mission.name] = mission
+        return Result("mision", (mission.name,), mission)
+
+    def _exec_llamar(self, operands) -> Result:
+        name = operands[0][1]
+        mission = self._missions.get(name)
+        if mission is None:
+            raise InterpreterError(f"La misión '{name}' no está definida.")
+        args = tuple([self._fetch(operand) for operand in operands[2:]])
+        if len(args) != len(mission.params):
+            raise InterpreterError(ARITY_ERROR.format(
+                name=name, expected=len(mission.params), got=len(args)))
+        value = self._call(mission, args)
+        is_var, target = operands[1]
+        if is_var:
+            if value is None:
+                raise InterpreterError(f"La misión '{name}' no regresó ningún valor.")
+            if self._shared:
+                self._unshare()
+            self._values[target] = value
+        return Result("llamar", (name,) + args, value)
+
+    def _exec_regresar(self, operands) -> Result:
+        raise _Return(self._fetch(operands[0]))
+
+    def _call(self, mission: Mission, args: Tuple[Any, ...]) -> Any:
+        # Ejecuta el cuerpo en el marco de este nivel de profundidad: los
+        # manejadores leen self._values y self.symbols, que durante la
+        # llamada apuntan al marco y a la tabla de la misión. El marco se
+        # rellena en su sitio, sin crear listas nuevas.
+        depth = self._depth
+        if depth >= self._max_depth:
+            raise ResourceLimitError(
+                f"Se superó la profundidad máxima de {self._max_depth} llamadas.", "max_depth")
+        if self._calls_left is not None:
+            if not self._calls_left:
+                raise ResourceLimitError(
+                    f"Se superó el límite de {self._limits.max_calls} llamadas.", "max_calls")
+            self._calls_left -= 1
+        frames = self._frames
+        if depth == len(frames):
+            frames.append([])
+        frame = frames[depth]
+        if len(frame) < mission.size:
+            frame.extend([UNDEFINED] * (mission.size - len(frame)))
+        frame[:mission.size] = args + mission.blank
+        # El marco es propio: dentro de la misión no hay nada que copiar.
+        values, symbols, sink, shared = self._values, self.symbols, self._sink, self._shared
+        self._values, self.symbols, self._sink = frame, mission.body.symbols, None
+        self._shared = False
+        self._depth = depth + 1
+        instr = None
+        try:
+            if (self._remaining is not None or self._deadline is not None
+                    or self.profiler is not None):
+                # Con límites o perfilado, el `regresar` final también cuenta.
+                if mission.body.instructions:
+                    self._repeat_checked(mission.body.instructions, 1)
+                return None
+            for instr in mission.steps:
+                instr.handler(self, instr.operands)
+            instr = mission.tail
+            if instr is None:
+                return None
+            is_var, value = instr.operands[0]
+            if is_var:
+                value = frame[value]
+                if value is UNDEFINED:
+                    value = self._fetch(instr.operands[0])
+            return value
+        except _Return as r:
+            return r.value
+        except InterpreterError as e:
+            if e.line is None and instr is not None:
+                e.line = instr.line
+            raise
+        finally:
+            self._values, self.symbols, self._sink = values, symbols, sink
+            self._shared = shared
+            self._depth = depth
+
+    def _exec_repetir(self, operands) -> Result:
+        # El cuerpo ya está compilado: cada vuelta solo llama a sus manejadores.
+        count = self._fetch(operands[0])
+        if type(count) is not int or count < 0:
+            raise InterpreterError(COUNT_ERROR)
+        body = operands[1][1].instructions
+        if not body:
+            return Result("repetir", (count,), count)
+        if (self._remaining is not None or self._deadline is not None
+                or self.profiler is not None):
+            self._repeat_checked(body, count)
+            return Result("repetir", (count,), count)
+        sink = self._sink
+        instr = None
+        try:
+            if sink is None:
+                for _ in repeat(None, count):
+                    for instr in body:
+                        instr.handler(self, instr.operands)
+            else:
+                for _ in repeat(None, count):
+                    for instr in body:
+                        sink(instr.handler(self, instr.operands))
+        except InterpreterError as e:
+            if e.line is None:
+                e.line = instr.line
+            raise
+        return Result("repetir", (count,), count)
+
+    def _repeat_checked(self, body: List[Instruction], count: int) -> None:
+        # Vueltas con límites o perfilado: cada vuelta descuenta sus
+        # instrucciones del presupuesto (los bucles anidados, además, las
+        # suyas) y consulta el reloj.
+        size = len(body)
+        deadline = self._deadline
+        profiled = self.profiler is not None
+        sink = self._sink
+        instr = None
+        try:
+            for _ in repeat(None, count):
+                if deadline is not None and perf_counter() > deadline:
+                    raise self._timeout_error(body[0].line)
+                block = body
+                if self._remaining is not None:
+                    if self._remaining < size:
+                        block = body[:self._remaining]
+                    self._remaining -= len(block)
+                for instr in block:
+                    if profiled:
+                        result = self._execute_profiled(instr, instr.line)
+                    else:
+                        result = instr.handler(self, instr.operands)
+                    if sink is not None:
+                        sink(result)
+                if block is not body:
+                    raise self._budget_error(body[len(block)].line)
+        except InterpreterError as e:
+            if e.line is None:
+                e.line = instr.line
+            raise
+
+    # Manejadores rápidos: solo se enlazan cuando el análisis de tipos probó
+    # que todos los operandos son int/float ya definidos.
+
+    def _fast_suma(self, operands) -> Result:
+        (va, a), (vb, b) = operands
+        if va:
+            a = self._values[a]
+        if vb:
+            b = self._values[b]
+        return Result("curar", (a, b), a + b)
+
+    def _fast_resta(self, operands) -> Result:
+        (va, a), (vb, b) = operands
+        if va:
+            a = self._values[a]
+        if vb:
+            b = self._values[b]
+        return Result("golpear", (a, b), a - b)
+
+    def _fast_multiplica(self, operands) -> Result:
+        (va, a), (vb, b) = operands
+        if va:
+            a = self._values[a]
+        if vb:
+            b = self._values[b]
+        # Solo se comprueba con detalle si la cota rápida supera el límite.
+        limit = self._max_bits
+        if (limit is not None and type(a) is int and type(b) is int
+                and a.bit_length() + b.bit_length() > limit):
+            self._check_bits(a, b, False)
+        return Result("multiplicar", (a, b), a * b)
+
+    def _fast_divide(self, operands) -> Result:
+        (va, a), (vb, b) = operands
+        if va:
+            a = self._values[a]
+        if vb:
+            b = self._values[b]
+        if b == 0:
+            raise InterpreterError("No se puede dividir por cero.")
+        return Result("dividir", (a, b), a / b)
+
+    def _fast_potencia(self, operands) -> Result:
+        (va, a), (vb, b) = operands
+        if va:
+            a = self._values[a]
+        if vb:
+            b = self._values[b]
+        limit = self._max_bits
+        if (limit is not None and type(a) is int and type(b) is int
+                and b * a.bit_length() > limit):
+            self._check_bits(a, b, True)
+        return Result("poder", (a, b), a ** b)
+
+    def _fast_raiz(self, operands) -> Result:
+        a = self._values[operands[0][1]]
+        if a < 0:
+            raise InterpreterError("No se puede calcular la raíz de un número negativo.")
+        return Result("revivir", (a,), math.sqrt(a))
+
+    def _fast_abs(self, operands) -> Result:
+        a = self._values[operands[0][1]]
+        return Result("xp", (a,), abs(a))
+
+    def _fast_max(self, operands) -> Result:
+        values = self._values
+        args = tuple(values[slot] for _, slot in operands)
+        return Result("jefe", args, max(args))
+
+    def _fast_min(self, operands) -> Result:
+        values = self._values
+        args = tuple(values[slot] for _, slot in operands)
+        return Result("esbirro", args, min(args))
+
+    def _fetch(self, operand: Operand):
+        is_var, value = operand
+        if is_var:
+            slot = value
+            value = self._values[slot]
+            if value is UNDEFINED:
+                raise InterpreterError(
+                    f"La variable '{self.symbols.names[slot]}' no está definida.")
+        return value
+
+    def reset(self) -> None:
+        # Los slots se conservan para que los programas compilados sigan siendo válidos.
+        if self._shared:
+            self._unshare()
+        self._variables.clear()
+        self._missions.clear()
 
     def _check_numeric(self, *args):
         for arg in args:
-            if not isinstance(arg, (int, float)):
+            if not isinstance(arg, (int, float)) and not arrays.is_numeric_array(arg):
                 raise InterpreterError("Solo se pueden operar números.")
 
     def define_variable(self, name, value):
-        self.variables[name] = value
+        if self._shared:
+            self._unshare()
+        self._variables[name] = value
 
     def get_variable(self, name):
-        if name not in self.variables:
+        slot = self.symbols.lookup(name)
+        if slot is None or slot >= len(self._values) or self._values[slot] is UNDEFINED:
             raise InterpreterError(f"La variable '{name}' no está definida.")
-        return self.variables[name]
+        return self._values[slot]
     
-    def _resolve_value(self, token: Tuple[str, str]):
-        tipo, valor = token
-        if tipo in ("NUMERO", "DECIMAL"):
-            return self._parse_value(valor)
-        elif tipo == "IDENTIFICADOR":
-            return self.get_variable(valor)
+    def _resolve_value(self, token: Token):
+        if type(token) is not Token:
+            token = Token.from_tuple(token)
+        if token.number is not None:
+            return token.number
+        elif token.kind is TokenKind.IDENTIFICADOR:
+            return self.get_variable(token.value)
         else:
-            raise InterpreterError(f"Valor no válido: {valor}")
+            raise InterpreterError(f"Valor no válido: {token.value}")
+
+
+# Tabla acción -> manejador, usada por el compilador para enlazar instrucciones.
+HANDLERS = {
+    action: getattr(Interpreter, f"_exec_{action}")
+    for action in set(KEYWORD_ACTIONS.values())
+}
 
+# Variantes sin comprobaciones de tipo para las instrucciones probadas numéricas.
+FAST_HANDLERS = {
+    action: getattr(Interpreter, f"_fast_{action}")
+    for action in set(KEYWORD_ACTIONS.values())
+    if hasattr(Interpreter, f"_fast_{action}")
+}
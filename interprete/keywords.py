@@ -1,8 +1,14 @@
+from interprete.tokens import TokenKind
+
 KEYWORDS = [
     "crear", "curar", "golpear", "multiplicar", "dividir", "poder",
-    "revivir", "xp", "jefe", "esbirro", "decir"
+    "revivir", "xp", "jefe", "esbirro", "decir",
+    "repetir", "fin", "mision", "llamar", "regresar"
 ]
 
+# Conjunto para búsquedas O(1) desde el lexer.
+KEYWORD_SET = frozenset(KEYWORDS)
+
 KEYWORD_ACTIONS = {
     "crear": "definir_variable",
     "curar": "suma",
@@ -14,5 +20,49 @@ KEYWORD_ACTIONS = {
     "xp": "abs",
     "jefe": "max",
     "esbirro": "min",
-    "decir": "imprimir"
-}
\ No newline at end of file
+    "decir": "imprimir",
+    "repetir": "repetir",
+    "mision": "definir_mision",
+    "llamar": "llamar",
+    "regresar": "regresar"
+}
+
+# Bucles: su cuerpo llega hasta el "fin" que lo cierra y usa las mismas
+# variables que el resto del script.
+# "fin" no es una acción: solo delimita el bloque al compilar.
+BLOCK_COMMANDS = frozenset({"repetir"})
+BLOCK_END = "fin"
+# Todos los comandos que abren un bloque: bucles y definiciones de misiones.
+BLOCK_OPENERS = BLOCK_COMMANDS | {"mision"}
+
+# Tipos de token admitidos en cada posición de un comando.
+IDENT = frozenset({TokenKind.IDENTIFICADOR})
+IGUAL = frozenset({TokenKind.IGUAL})
+VALOR = frozenset({TokenKind.NUMERO, TokenKind.DECIMAL, TokenKind.IDENTIFICADOR})
+VALOR_CREAR = VALOR | {TokenKind.CADENA, TokenKind.LISTA}
+ENTERO = frozenset({TokenKind.NUMERO, TokenKind.IDENTIFICADOR})
+
+# Firma de cada comando: (tipos permitidos por posición, variádico).
+# La aridad es el número de posiciones; si el comando es variádico, la
+# última posición se puede repetir una o más veces. Si "variádico" es un
+# conjunto de tipos, tras las posiciones fijas pueden ir cero o más
+# tokens de esos tipos.
+COMMAND_SIGNATURES = {
+    "crear": ((IDENT, IGUAL, VALOR_CREAR), False),
+    "curar": ((VALOR, VALOR), False),
+    "golpear": ((VALOR, VALOR), False),
+    "multiplicar": ((VALOR, VALOR), False),
+    "dividir": ((VALOR, VALOR), False),
+    "poder": ((VALOR, VALOR), False),
+    "revivir": ((IDENT,), False),
+    "xp": ((IDENT,), False),
+    "jefe": ((IDENT,), True),
+    "esbirro": ((IDENT,), True),
+    "decir": ((IDENT,), False),
+    "repetir": ((ENTERO,), False),
+    "fin": ((), False),
+    # mision <nombre> <parámetros...>; llamar <nombre> <argumentos...>
+    "mision": ((IDENT,), True),
+    "llamar": ((IDENT,), VALOR),
+    "regresar": ((VALOR,), False),
+}
@@ -1,12 +1,53 @@
 """
 Módulo de análisis léxico para el intérprete Gamer.
-Convierte instrucciones en una lista de tokens.
+Convierte instrucciones en una lista de tokens (interprete.tokens.Token).
 """
 
-from typing import List, Tuple
-from interprete.keywords import KEYWORDS
+from sys import intern
+from typing import Iterator, List
+from interprete.keywords import KEYWORD_SET
+from interprete.tokens import Token, TokenKind
 import re
 
+# Patrón maestro: una sola pasada clasifica cada token por grupo con nombre.
+# Los números y el "=" solo cuentan si ocupan la palabra completa; si no,
+# la palabra cae en PALABRA, igual que con el antiguo split por espacios.
+TOKEN_PATTERN = re.compile(r'''
+    (?P<CADENA>"[^"]*")
+  | (?P<LISTA>\[[^\]]*\])
+  | (?P<DECIMAL>-?\d+\.\d+)(?!\S)
+  | (?P<NUMERO>-?\d+)(?!\S)
+  | (?P<IGUAL>=)(?!\S)
+  | (?P<PALABRA>\S+)
+''', re.VERBOSE)
+
+_KEYWORD, _IDENT, _UNKNOWN = TokenKind.KEYWORD, TokenKind.IDENTIFICADOR, TokenKind.DESCONOCIDO
+_NUMERO, _DECIMAL, _CADENA = TokenKind.NUMERO, TokenKind.DECIMAL, TokenKind.CADENA
+_KINDS = {kind.name: kind for kind in TokenKind}
+
+def _classify_word(word: str, column: int) -> Token:
+    # Comparamos en minúsculas para palabras clave
+    w = word.lower()
+    if w in KEYWORD_SET:
+        return Token(_KEYWORD, intern(w), None, column)
+    if w.isidentifier():
+        return Token(_IDENT, intern(w), None, column)
+    return Token(_UNKNOWN, w, None, column)
+
+def _make_token(match: "re.Match[str]") -> Token:
+    kind = match.lastgroup
+    word = match.group(kind)
+    column = match.start()
+    if kind == "PALABRA":
+        return _classify_word(word, column)
+    if kind == "NUMERO":
+        return Token(_NUMERO, word, int(word), column)
+    if kind == "DECIMAL":
+        return Token(_DECIMAL, word, float(word), column)
+    if kind == "CADENA":
+        return Token(_CADENA, word[1:-1], None, column)
+    return Token(_KINDS[kind], word, None, column)
+
 class Lexer:
     """
     Analizador léxico simple para el lenguaje Gamer.
@@ -15,39 +56,19 @@ class Lexer:
     def __init__(self) -> None:
         pass
 
-    def tokenize(self, instruction: str) -> List[Tuple[str, str]]:
+    def tokenize(self, instruction: str) -> List[Token]:
+        """
+        Convierte una instrucción en una lista de Token. Los números ya
+        llegan convertidos en `number`.
+        """
+        return [_make_token(match) for match in TOKEN_PATTERN.finditer(instruction)]
+
+    def iter_tokens(self, instruction: str) -> Iterator[Token]:
         """
-        Convierte una instrucción en una lista de tokens (tipo, valor).
+        Genera los tokens de una instrucción de forma perezosa.
         """
-        tokens = []
-
-        # Regex para separar cadenas entre comillas y palabras/números
-        pattern = r'"[^"]*"|\S+'
-        words = re.findall(pattern, instruction)
-
-        for word in words:
-            # Guardamos el valor original (para cadenas)
-            val = word
-
-            # Comparamos en minúsculas para palabras clave
-            w = word.lower()
-
-            if w == "=":
-                tokens.append(("IGUAL", "="))
-            elif re.fullmatch(r'-?\d+', w):
-                tokens.append(("NUMERO", w))
-            elif re.fullmatch(r'-?\d+\.\d+', w):
-                tokens.append(("DECIMAL", w))
-            elif w in KEYWORDS:  # 🔹 Reconocer palabra clave
-                tokens.append(("KEYWORD", w))
-            elif re.fullmatch(r'"[^"]*"', word):  # 🔹 Detectar cadena
-                tokens.append(("CADENA", word.strip('"')))
-            elif w.isidentifier():
-                tokens.append(("IDENTIFICADOR", w))
-            else:
-                tokens.append(("DESCONOCIDO", w))
-
-        return tokens
+        for match in TOKEN_PATTERN.finditer(instruction):
+            yield _make_token(match)
 
 
 # Ejemplo de uso:
@@ -0,0 +1,48 @@
+"""
+Módulo de límites de recursos para el intérprete Gamer.
+Define los topes de ejecución que un Interpreter puede aplicar a cada script.
+"""
+
+from typing import Optional
+
+# Cada cuántas instrucciones se consulta el reloj para el tiempo límite.
+DEADLINE_CHECK_INTERVAL = 64
+
+# Profundidad de llamadas a misiones que se permite siempre, también sin
+# límites: cada nivel ocupa varios marcos de la pila de Python.
+MAX_CALL_DEPTH = 200
+
+
+class Limits:
+    """
+    Límites de recursos de un intérprete. Un límite en None no se aplica;
+    sin ningún objeto Limits el intérprete no hace comprobaciones.
+
+    Attributes:
+        max_instructions: Instrucciones que puede ejecutar cada llamada a run().
+        max_bits: Tamaño máximo, en bits, del resultado entero de `poder` y
+            `multiplicar`; se comprueba antes de calcularlo.
+        max_string: Longitud máxima de una cadena asignada con `crear`.
+        timeout: Segundos que puede durar cada llamada a run().
+        max_depth: Llamadas a misiones anidadas; por defecto, MAX_CALL_DEPTH.
+            Un valor mayor puede agotar la pila de Python.
+        max_calls: Llamadas a misiones en cada llamada a run().
+    """
+
+    def __init__(self, max_instructions: Optional[int] = None,
+                 max_bits: Optional[int] = None,
+                 max_string: Optional[int] = None,
+                 timeout: Optional[float] = None,
+                 max_depth: Optional[int] = None,
+                 max_calls: Optional[int] = None) -> None:
+        self.max_instructions = max_instructions
+        self.max_bits = max_bits
+        self.max_string = max_string
+        self.timeout = timeout
+        self.max_depth = max_depth
+        self.max_calls = max_calls
+
+    def __repr__(self) -> str:
+        return (f"Limits(max_instructions={self.max_instructions}, max_bits={self.max_bits}, "
+                f"max_string={self.max_string}, timeout={self.timeout}, "
+                f"max_depth={self.max_depth}, max_calls={self.max_calls})")
@@ -0,0 +1,50 @@
+"""
+Módulo de carga de scripts para el intérprete Gamer.
+Lee scripts de cualquier tamaño mediante mmap, una línea cada vez, sin
+construir nunca el texto completo ni la lista de líneas.
+"""
+
+import mmap
+from typing import Iterator
+
+# Bytes ya procesados tras los que se liberan sus páginas de la memoria del
+# proceso; así la memoria residente no crece con el tamaño del archivo.
+RELEASE_WINDOW = 64 << 20
+
+
+def mmap_lines(path: str, window: int = RELEASE_WINDOW) -> Iterator[str]:
+    """
+    Genera las líneas de un archivo UTF-8 sin el salto final, igual que
+    `str.split("\\n")` pero sin la última línea vacía.
+
+    Los saltos de línea se buscan sobre los bytes del mapeo y cada línea se
+    decodifica por separado. Cada `window` bytes consumidos, sus páginas se
+    devuelven al sistema (MADV_DONTNEED), donde esté disponible.
+
+    Raises:
+        UnicodeDecodeError si una línea no es UTF-8 válido.
+    """
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Archivo vacío: no se puede mapear.
+    with data:
+        release = getattr(data, "madvise", None) if hasattr(mmap, "MADV_DONTNEED") else None
+        if release is not None and hasattr(mmap, "MADV_SEQUENTIAL"):
+            release(mmap.MADV_SEQUENTIAL)
+        window -= window % mmap.PAGESIZE
+        size = len(data)
+        find = data.find
+        pos = released = 0
+        while pos < size:
+            end = find(b"\n", pos)
+            if end == -1:
+                end = size
+            yield data[pos:end].decode("utf-8")
+            pos = end + 1
+            if release is not None and window and pos - released >= window:
+                # Solo páginas completas ya leídas.
+                upto = pos - pos % mmap.PAGESIZE
+                release(mmap.MADV_DONTNEED, released, upto - released)
+                released = upto
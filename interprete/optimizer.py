@@ -0,0 +1,222 @@
+"""
+Módulo de optimización para el intérprete Gamer.
+Plegado de constantes, eliminación de asignaciones muertas y reutilización
+de cálculos idénticos sobre programas ya compilados.
+
+Las instrucciones plegadas y las asignaciones muertas conservan su comando y
+su línea (para los mensajes y el perfilado), pero su único operando es el
+Result ya calculado: no leen ni escriben variables. Quien recorra un
+programa optimizado debe comprobarlo con folded() antes de interpretar sus
+operandos; reads() y writes() ya lo hacen.
+
+Los límites de recursos (interprete.limits) se aplican igual: el programa
+puede haberse optimizado sin límites, así que al ejecutarse con límites una
+instrucción plegada o una asignación muerta comprueba su Result como lo
+habría hecho su manejador (max_bits, max_string).
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from interprete.compiler import Instruction, Program
+from interprete.keywords import BLOCK_COMMANDS
+from interprete.results import Result
+
+# Comandos sin efectos: su resultado depende solo de sus operandos.
+PURE_COMMANDS = frozenset({
+    "curar", "golpear", "multiplicar", "dividir", "poder",
+    "revivir", "xp", "jefe", "esbirro",
+})
+
+# Tamaño máximo (en bits) de una potencia entera que se pliega al compilar.
+FOLD_MAX_BITS = 4096
+
+
+class OptimizationReport:
+    """
+    Registro de lo que hizo el optimizador, con la línea de cada cambio.
+    """
+
+    def __init__(self) -> None:
+        self.folded: List[Tuple[int, str, Any]] = []
+        self.dead_stores: List[Tuple[int, str]] = []
+        self.reused: List[Tuple[int, str, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.folded) + len(self.dead_stores) + len(self.reused)
+
+    def summary(self) -> str:
+        lines = [
+            f"Constantes plegadas: {len(self.folded)}",
+            f"Asignaciones muertas eliminadas: {len(self.dead_stores)}",
+            f"Cálculos reutilizados: {len(self.reused)}",
+        ]
+        for line, source, value in self.folded:
+            lines.append(f"  Línea {line}: '{source}' -> {value}")
+        for line, source in self.dead_stores:
+            lines.append(f"  Línea {line}: '{source}' no se almacena (se sobrescribe antes de leerse)")
+        for line, source, first in self.reused:
+            lines.append(f"  Línea {line}: '{source}' reutiliza el resultado de la línea {first}")
+        return "\n".join(lines)
+
+
+def _constant(interp, operands):
+    # Instrucción plegada: el resultado se calculó al compilar.
+    result = operands[0][1]
+    if interp._limits is not None:
+        interp._check_folded(result)
+    return result
+
+
+def _memo_store(register: int, handler: Callable) -> Callable:
+    def store(interp, operands):
+        result = handler(interp, operands)
+        interp._registers[register] = result
+        return result
+    return store
+
+
+def _memo_load(register: int) -> Callable:
+    def load(interp, operands):
+        return interp._registers[register]
+    return load
+
+
+def folded(instr: Instruction) -> bool:
+    """Indica si el optimizador reemplazó la instrucción por su resultado."""
+    return instr.handler is _constant
+
+
+def reads(instr: Instruction) -> List[int]:
+    """Slots de las variables que lee una instrucción (sin bloques)."""
+    if instr.handler is _constant:
+        return []
+    if instr.command == "crear":
+        is_var, rhs = instr.operands[1]
+        return [rhs] if is_var else []
+    if instr.command == "llamar":
+        return [v for is_var, v in instr.operands[2:] if is_var]
+    return [v for is_var, v in instr.operands if is_var]
+
+
+def writes(instr: Instruction) -> Optional[int]:
+    """Slot de la variable que asigna una instrucción, o None."""
+    if instr.handler is _constant:
+        return None
+    if instr.command == "crear":
+        return instr.operands[0][1]
+    if instr.command == "llamar":
+        is_var, target = instr.operands[1]
+        return target if is_var else None
+    return None
+
+
+def _can_fold(instr: Instruction) -> bool:
+    if instr.command not in PURE_COMMANDS:
+        return False
+    if any(is_var for is_var, _ in instr.operands):
+        return False
+    if instr.command == "poder":
+        (_, a), (_, b) = instr.operands
+        if isinstance(a, int) and isinstance(b, int) and b > 0:
+            return b * max(a.bit_length(), 1) <= FOLD_MAX_BITS
+    return True
+
+
+def optimize(program: Program, interpreter) -> Program:
+    """
+    Devuelve un programa optimizado equivalente y guarda el informe en
+    `program.report`. Los resultados, su orden y el estado final de las
+    variables no cambian, tampoco cuando una instrucción falla. El cuerpo
+    de los bucles no se optimiza.
+
+    Args:
+        program: Programa compilado por `interpreter`.
+        interpreter: Intérprete usado para evaluar las instrucciones plegadas;
+            solo se evalúan instrucciones con operandos literales, que no
+            leen ni modifican variables.
+    """
+    report = OptimizationReport()
+    instructions = list(program.instructions)
+
+    # 1. Plegado de constantes: operaciones puras con todos los operandos literales.
+    for idx, instr in enumerate(instructions):
+        if not _can_fold(instr):
+            continue
+        try:
+            result = instr.handler(interpreter, instr.operands)
+        except Exception:
+            continue  # El error se conserva para que ocurra en su momento.
+        instructions[idx] = Instruction(instr.line, instr.command, _constant,
+                                        ((False, result),), instr.source)
+        report.folded.append((instr.line, instr.source, result.value))
+
+    # 2. Asignaciones muertas: crear con literal que se sobrescribe antes de
+    # cualquier lectura. Solo se cruzan instrucciones que no pueden fallar
+    # (otros crear o constantes), así el estado ante un error es el mismo.
+    names = program.symbols.names
+    pending: Dict[int, int] = {}
+    for idx, instr in enumerate(instructions):
+        if instr.handler is _constant:
+            continue
+        if instr.command != "crear":
+            pending.clear()
+            continue
+        for slot in reads(instr):
+            pending.pop(slot, None)
+        target = writes(instr)
+        previous = pending.pop(target, None)
+        if previous is not None:
+            dead = instructions[previous]
+            value = dead.operands[1][1]
+            result = Result("crear", (names[target],), value)
+            instructions[previous] = Instruction(dead.line, dead.command, _constant,
+                                                 ((False, result),), dead.source)
+            report.dead_stores.append((dead.line, dead.source))
+        if not instr.operands[1][0]:
+            pending[target] = idx
+
+    # 3. Reutilización: misma operación pura con los mismos operandos y sin
+    # escrituras intermedias en las variables que lee.
+    seen: Dict[Tuple, int] = {}
+    registers: Dict[int, int] = {}
+    readers: Dict[int, List[Tuple]] = {}
+    for idx, instr in enumerate(instructions):
+        if instr.command in BLOCK_COMMANDS:
+            # El cuerpo de un bucle puede escribir cualquier variable.
+            seen.clear()
+            readers.clear()
+            continue
+        target = writes(instr)
+        if target is not None:
+            for key in readers.pop(target, ()):
+                seen.pop(key, None)
+            continue
+        if instr.command not in PURE_COMMANDS or instr.handler is _constant:
+            continue
+        key = (instr.command, _operand_key(instr.operands))
+        first = seen.get(key)
+        if first is None:
+            seen[key] = idx
+            for slot in reads(instr):
+                readers.setdefault(slot, []).append(key)
+            continue
+        register = registers.get(first)
+        if register is None:
+            register = registers[first] = len(registers)
+            original = instructions[first]
+            instructions[first] = Instruction(original.line, original.command,
+                                              _memo_store(register, original.handler),
+                                              original.operands, original.source)
+        instructions[idx] = Instruction(instr.line, instr.command, _memo_load(register),
+                                        instr.operands, instr.source)
+        report.reused.append((instr.line, instr.source, instructions[first].line))
+
+    optimized = Program(instructions, program.symbols)
+    optimized.report = report
+    return optimized
+
+
+def _operand_key(operands: Tuple) -> Tuple:
+    # Los literales se distinguen por tipo: 2 y 2.0 dan resultados distintos.
+    return tuple((is_var, type(v).__name__, v) for is_var, v in operands)
+
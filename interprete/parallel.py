@@ -0,0 +1,321 @@
+"""
+Módulo de ejecución en paralelo para el intérprete Gamer.
+Ejecuta un programa compilado calculando a la vez, en un pool de procesos o
+de hilos, las instrucciones puras costosas que no dependen unas de otras,
+con los mismos resultados, en el mismo orden, y el mismo estado final de
+las variables que Interpreter.run.
+
+Dependencias: las instrucciones puras (PURE_COMMANDS) solo leen variables y
+su resultado no se guarda en ninguna, así que cada una depende únicamente de
+las asignaciones anteriores a las variables que lee. Como las asignaciones
+se ejecutan en orden en este proceso, basta con leer los operandos al llegar
+a la instrucción: una instrucción pura costosa se envía al pool con esos
+valores y la ejecución sigue sin esperarla. Las instrucciones baratas se
+ejecutan en el momento, sin pasar por el pool.
+
+Errores: si una instrucción enviada al pool falla, las asignaciones que
+hicieron después las instrucciones siguientes se deshacen (cada una guarda
+antes el valor anterior de las variables que escribe), así el estado es el
+mismo que si la ejecución se hubiera detenido en ella.
+"""
+
+import math
+import os
+import weakref
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Deque, List, Optional, Tuple, Union
+
+from interprete.arrays import ARRAY_TYPES
+from interprete.compiler import Instruction, Program
+from interprete.interpreter import (FAST_HANDLERS, HANDLERS, RUN_MODES, Interpreter,
+                                    InterpreterError)
+from interprete.keywords import BLOCK_COMMANDS, KEYWORD_ACTIONS
+from interprete.limits import Limits
+from interprete.optimizer import PURE_COMMANDS, folded, writes
+from interprete.results import Result
+
+# Una potencia o producto entero con un resultado mayor (en bits) se calcula
+# en el ejecutor; igual para jefe/esbirro u operaciones con más elementos.
+HEAVY_BITS = 1 << 16
+HEAVY_ITEMS = 10_000
+
+# Plan de una instrucción de primer nivel: si se puede enviar al pool y los
+# slots que escribe (None si no se pueden deshacer sus efectos: se espera a
+# las instrucciones pendientes antes de ejecutarla).
+Step = Tuple[bool, Optional[Tuple[int, ...]]]
+
+
+def is_heavy(command: str, values: Tuple[Any, ...], heavy_bits: int = HEAVY_BITS,
+             heavy_items: int = HEAVY_ITEMS) -> bool:
+    """
+    Indica si una instrucción pura es costosa, a partir de sus operandos ya
+    resueltos y sin calcular nada.
+    """
+    if command not in PURE_COMMANDS:
+        return False
+    items = len(values)
+    for value in values:
+        if isinstance(value, ARRAY_TYPES):
+            items += value.size
+    if items > heavy_items:
+        return True
+    if len(values) == 2 and type(values[0]) is int and type(values[1]) is int:
+        a, b = values
+        if command == "poder":
+            return b > 0 and not -1 <= a <= 1 and (b > heavy_bits or
+                                                   b * math.log2(abs(a)) > heavy_bits)
+        if command == "multiplicar":
+            return a.bit_length() + b.bit_length() > heavy_bits
+    return False
+
+
+# Intérprete de cada proceso del ejecutor; se crea con la primera tarea.
+_worker: Optional[Interpreter] = None
+
+
+def compute(command: str, values: Tuple[Any, ...], limits: Optional[Limits]) -> Any:
+    """
+    Calcula el valor de una instrucción pura con operandos literales. Se
+    ejecuta en el ejecutor (otro proceso o hilo).
+    """
+    global _worker
+    if _worker is None:
+        _worker = Interpreter()
+    _worker.limits = limits
+    handler = HANDLERS[KEYWORD_ACTIONS[command]]
+    return handler(_worker, tuple((False, value) for value in values)).value
+
+
+def plan(program: Program, heavy_items: int = HEAVY_ITEMS) -> List[Step]:
+    """
+    Calcula, para cada instrucción de primer nivel, si es una instrucción
+    pura que puede ser costosa (y calcularse en el pool) y el conjunto de
+    variables que escribe: un `crear` o un `llamar` con destino, su
+    variable; un bucle, las que asigna su cuerpo; una `mision` no escribe
+    variables pero define una misión, y se trata como una barrera (None).
+    Las instrucciones plegadas por el optimizador no leen ni escriben nada.
+    """
+    steps: List[Step] = []
+    for instr in program.instructions:
+        command = instr.command
+        if folded(instr):
+            steps.append((False, ()))
+        elif command in PURE_COMMANDS:
+            # Las reutilizadas o plegadas por el optimizador quedan en línea.
+            # Con operandos escalares probados (manejador rápido), solo una
+            # potencia o un producto de enteros puede ser costoso.
+            action = KEYWORD_ACTIONS[command]
+            handler = instr.handler
+            if handler is FAST_HANDLERS.get(action):
+                offload = (command in ("poder", "multiplicar")
+                           or len(instr.operands) > heavy_items)
+            else:
+                offload = handler is HANDLERS[action]
+            steps.append((offload, ()))
+        elif command == "mision":
+            steps.append((False, None))
+        elif command in BLOCK_COMMANDS:
+            written = {writes(inner) for inner in instr.operands[1][1].walk()}
+            written.discard(None)
+            steps.append((False, tuple(sorted(written))))
+        else:
+            target = writes(instr)
+            steps.append((False, () if target is None else (target,)))
+    return steps
+
+
+class _Offloaded:
+    # Instrucción enviada al pool, en su lugar de la cola de resultados.
+
+    __slots__ = ("position", "instr", "values", "future")
+
+    def __init__(self, position: int, instr: Instruction, values: Tuple[Any, ...],
+                 future: Future) -> None:
+        self.position = position
+        self.instr = instr
+        self.values = values
+        self.future = future
+
+
+class ParallelRunner:
+    """
+    Ejecuta programas de un intérprete con las instrucciones puras costosas
+    en paralelo.
+
+    Con límites de recursos o perfilado activos se ejecuta igual que
+    Interpreter.run, en serie. Se usa siempre el motor de referencia.
+
+    Args:
+        interpreter: Intérprete cuyas variables y misiones se usan.
+        executor: Ejecutor para las instrucciones costosas; por defecto, un
+            ProcessPoolExecutor (las potencias grandes retienen el GIL), que
+            se crea con la primera y se cierra con close().
+        max_pending: Instrucciones costosas en curso a la vez; al llegar a
+            ese número se espera a la más antigua.
+    """
+
+    def __init__(self, interpreter: Interpreter, executor: Optional[Executor] = None,
+                 max_pending: Optional[int] = None, heavy_bits: int = HEAVY_BITS,
+                 heavy_items: int = HEAVY_ITEMS) -> None:
+        self.interpreter = interpreter
+        self.heavy_bits = heavy_bits
+        self.heavy_items = heavy_items
+        self.max_pending = max_pending or 2 * (os.cpu_count() or 1)
+        self.stats = {"instructions": 0, "offloaded": 0}
+        self._executor = executor
+        self._owns_executor = executor is None
+        # Plan de cada programa; vacío si no tiene nada que enviar al pool.
+        self._plans: "weakref.WeakKeyDictionary[Program, List[Step]]" = \
+            weakref.WeakKeyDictionary()
+
+    def __enter__(self) -> "ParallelRunner":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cierra el ejecutor propio."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def run(self, program: Program, mode: str = "text") -> Optional[List[Any]]:
+        """
+        Ejecuta un programa compilado; mismos argumentos, resultados y errores
+        que Interpreter.run.
+        """
+        interp = self.interpreter
+        if mode not in RUN_MODES:
+            raise ValueError(f"Modo de ejecución desconocido: {mode}")
+        if interp.limits is not None or interp.profiler is not None:
+            return interp.run(program, mode)
+        program = interp._link(program)
+        steps = self._plans.get(program)
+        if steps is None:
+            steps = plan(program, self.heavy_items)
+            if not any(offload for offload, _ in steps):
+                steps = []
+            self._plans[program] = steps
+        if not steps:
+            # Nada que enviar al pool: la ejecución en serie de siempre.
+            self.stats["instructions"] += len(program.instructions)
+            return interp.run(program, mode)
+        if interp._shared:
+            interp._unshare()
+        interp._grow_frame()
+
+        keep = mode != "quiet"
+        # Cola en orden de programa: Result ya calculados y _Offloaded.
+        queue: Deque[Union[Result, _Offloaded]] = deque()
+        results: Optional[List[Result]] = [] if keep else None
+        # (posición, slot, valor anterior) de las asignaciones hechas con
+        # instrucciones pendientes en el pool.
+        journal: List[Tuple[int, int, Any]] = []
+        pending = 0
+        instr = None
+        interp._sink = queue.append if keep else None
+        append = queue.append
+        fetch = interp._fetch
+        heavy_bits, heavy_items = self.heavy_bits, self.heavy_items
+        try:
+            for position, instr in enumerate(program.instructions):
+                offload, written = steps[position]
+                if not (offload or pending):
+                    # Lo habitual: una instrucción barata sin nada pendiente.
+                    result = instr.handler(interp, instr.operands)
+                    if keep:
+                        append(result)
+                    continue
+                if pending and written is None:
+                    pending = self._collect(queue, results, journal, pending, 0)
+                heavy = False
+                try:
+                    if offload:
+                        values = tuple([fetch(operand) for operand in instr.operands])
+                        heavy = is_heavy(instr.command, values, heavy_bits, heavy_items)
+                    if not heavy:
+                        if pending and written:
+                            current = interp._values
+                            journal.extend((position, slot, current[slot]) for slot in written)
+                        result = instr.handler(interp, instr.operands)
+                except Exception:
+                    # Un error anterior en el pool tiene prioridad.
+                    self._collect(queue, results, journal, pending, 0)
+                    raise
+                if heavy:
+                    append(_Offloaded(position, instr, values,
+                                      self._submit(instr.command, values)))
+                    pending += 1
+                    if pending >= self.max_pending:
+                        pending = self._collect(queue, results, journal, pending,
+                                                self.max_pending - 1)
+                    continue
+                if keep:
+                    append(result)
+                if pending:
+                    pending = self._collect(queue, results, journal, pending, None)
+            self._collect(queue, results, journal, pending, 0)
+        except BaseException as e:
+            if isinstance(e, InterpreterError) and e.line is None:
+                e.line = instr.line
+            for entry in queue:
+                if type(entry) is _Offloaded:
+                    entry.future.cancel()
+            raise
+        finally:
+            interp._sink = None
+        self.stats["instructions"] += len(program.instructions)
+        if results is None:
+            return None
+        if mode == "text":
+            return [result.text() for result in results]
+        return results
+
+    def _submit(self, command: str, values: Tuple[Any, ...]) -> Future:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor()
+        self.stats["offloaded"] += 1
+        return self._executor.submit(compute, command, values, None)
+
+    def _collect(self, queue: Deque, results: Optional[List[Result]], journal: List,
+                 pending: int, until: Optional[int]) -> int:
+        # Pasa a `results` las entradas del principio de la cola que ya están
+        # listas. Con `until`, espera hasta dejar ese número de pendientes;
+        # con None, no espera. Devuelve las que quedan pendientes.
+        if not pending:
+            if results is not None:
+                results.extend(queue)
+            queue.clear()
+            journal.clear()
+            return 0
+        while queue:
+            head = queue[0]
+            if type(head) is _Offloaded:
+                if until is None or pending <= until:
+                    if not head.future.done():
+                        break
+                try:
+                    value = head.future.result()
+                except Exception as e:
+                    if isinstance(e, InterpreterError) and e.line is None:
+                        e.line = head.instr.line
+                    self._rollback(journal, head.position)
+                    raise
+                pending -= 1
+                head = Result(head.instr.command, head.values, value)
+            queue.popleft()
+            if results is not None:
+                results.append(head)
+        if not pending:
+            journal.clear()
+        return pending
+
+    def _rollback(self, journal: List[Tuple[int, int, Any]], position: int) -> None:
+        # Deshace, de la última a la primera, las asignaciones posteriores a
+        # la instrucción que falló.
+        values = self.interpreter._values
+        for after, slot, previous in reversed(journal):
+            if after > position:
+                values[slot] = previous
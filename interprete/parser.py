@@ -4,7 +4,7 @@ Valida la estructura de las instrucciones tokenizadas.
 """
 
 from typing import List, Tuple
-from interprete.keywords import KEYWORDS
+from interprete.validator import validate, ValidationError
 
 class ParserError(Exception):
     """Excepción personalizada para errores de sintaxis."""
@@ -40,95 +40,11 @@ class Parser:
         Raises:
             ParserError si la sintaxis es inválida.
         """
-        if not tokens:
-            raise ParserError("No hay tokens para analizar.")
-
-        # crear <identificador> = <numero/decimal>
-        if tokens[0][1] == "crear":
-            if (len(tokens) == 4 and
-                tokens[1][0] == "IDENTIFICADOR" and
-                tokens[2][0] == "IGUAL" and
-                tokens[3][0] in ("NUMERO", "DECIMAL", "IDENTIFICADOR", "CADENA")):
-                return True
-            else:
-                raise ParserError("Sintaxis inválida para 'crear'.")
-        # curar <identificador> <identificador>
-        if tokens[0][1] == "curar":
-            if (len(tokens) == 3 and
-                tokens[1][0] == "IDENTIFICADOR" and
-                tokens[2][0] == "IDENTIFICADOR"):
-                return True
-            else:
-                raise ParserError("Sintaxis inválida para 'curar'.")
-        # golpear <identificador> <identificador>
-        if tokens[0][1] == "golpear":
-            if (len(tokens) == 3 and
-                tokens[1][0] == "IDENTIFICADOR" and
-                tokens[2][0] == "IDENTIFICADOR"):
-                return True
-            else:
-                raise ParserError("Sintaxis inválida para 'golpear'.")
-        # multiplicar <valor> <valor>
-        if tokens[0][1] == "multiplicar":
-            if (len(tokens) == 3 and
-                tokens[1][0] in ("NUMERO", "DECIMAL", "IDENTIFICADOR") and
-                tokens[2][0] in ("NUMERO", "DECIMAL", "IDENTIFICADOR")):
-                return True
-            else:
-                raise ParserError("Sintaxis inválida para 'multiplicar'.")
-        # dividir <identificador> <identificador>
-        if tokens[0][1] == "dividir":
-            if (len(tokens) == 3 and
-                tokens[1][0] in ("NUMERO", "DECIMAL", "IDENTIFICADOR") and
-                tokens[2][0] in ("NUMERO", "DECIMAL", "IDENTIFICADOR")):
-                return True
-            else:
-                raise ParserError("Sintaxis inválida para 'dividir'.")
-        # poder <valor> <valor>
-        if tokens[0][1] == "poder":
-            if (len(tokens) == 3 and
-                tokens[1][0] in ("NUMERO", "DECIMAL", "IDENTIFICADOR") and
-                tokens[2][0] in ("NUMERO", "DECIMAL", "IDENTIFICADOR")):
-                return True
-            else:
-                raise ParserError("Sintaxis inválida para 'poder'.")
-        # revivir <identificador>
-        if tokens[0][1] == "revivir":
-            if (len(tokens) == 2 and
-                tokens[1][0] == "IDENTIFICADOR"):
-                return True
-            else:
-                raise ParserError("Sintaxis inválida para 'revivir'.")
-        # xp <identificador>
-        if tokens[0][1] == "xp":
-            if (len(tokens) == 2 and
-                tokens[1][0] == "IDENTIFICADOR"):
-                return True
-            else:
-                raise ParserError("Sintaxis inválida para 'xp'.")
-        # jefe <identificador> <identificador> ...
-        if tokens[0][1] == "jefe":
-            if (len(tokens) >= 2 and
-                all(t[0] == "IDENTIFICADOR" for t in tokens[1:])):
-                return True
-            else:
-                raise ParserError("Sintaxis inválida para 'jefe'.")
-        # esbirro <identificador> <identificador> ...
-        if tokens[0][1] == "esbirro":
-            if (len(tokens) >= 2 and
-                all(t[0] == "IDENTIFICADOR" for t in tokens[1:])):
-                return True
-            else:
-                raise ParserError("Sintaxis inválida para 'esbirro'.")
-        # decir <identificador>
-        if tokens[0][1] == "decir":
-            if (len(tokens) == 2 and
-                tokens[1][0] == "IDENTIFICADOR"):
-                return True
-            else:
-                raise ParserError("Sintaxis inválida para 'decir'.")
-
-        raise ParserError("Instrucción no reconocida.")
+        try:
+            validate(tokens)
+        except ValidationError as e:
+            raise ParserError(str(e))
+        return True
 
 # Ejemplo de uso:
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+"""
+Módulo de perfilado para el intérprete Gamer.
+Acumula tiempos por etapa, por comando y conteos de ejecución por línea.
+
+Las instrucciones de un `repetir` o de una misión llamada con `llamar` se
+ejecutan dentro de esa instrucción: su tiempo se anida bajo ella en las
+pilas (gamer;execute;repetir;poder) y la etapa `execute` suma solo el
+tiempo propio de cada instrucción, sin contar dos veces el de las anidadas.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple, Union
+
+# Etapas del front-end y de la ejecución, en el orden en que se reportan.
+STAGES = ("lex", "parse", "compile", "execute")
+
+LineKey = Union[int, str]
+
+
+class Profiler:
+    """
+    Contadores de perfilado. Solo se usa cuando el perfilado está activo;
+    con el perfilado desactivado el intérprete no llama a ningún método.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, List[float]] = {stage: [0, 0.0] for stage in STAGES}
+        self.commands: Dict[str, List[float]] = {}
+        self.lines: Dict[LineKey, int] = {}
+        # Tiempo propio (sin las instrucciones anidadas) por pila de comandos.
+        self.stacks: Dict[Tuple[str, ...], float] = {}
+        # Comandos en curso y, por cada uno, el tiempo de sus anidados.
+        self._path: List[str] = []
+        self._nested: List[float] = []
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        entry = self.stages[stage]
+        entry[0] += 1
+        entry[1] += seconds
+
+    def enter_command(self, command: str) -> None:
+        """Marca el comienzo de una instrucción; termina con record_command."""
+        self._path.append(command)
+        self._nested.append(0.0)
+
+    def record_command(self, command: str, line: LineKey, seconds: float) -> None:
+        """
+        Termina la instrucción abierta con enter_command. `seconds` es su
+        tiempo total, que se guarda por comando; en la pila y en la etapa
+        solo cuenta el tiempo propio.
+        """
+        stack = tuple(self._path)
+        self._path.pop()
+        own = seconds - self._nested.pop()
+        if self._nested:
+            self._nested[-1] += seconds
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + own
+        entry = self.commands.get(command)
+        if entry is None:
+            entry = self.commands[command] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += seconds
+        self.lines[line] = self.lines.get(line, 0) + 1
+        stage = self.stages["execute"]
+        stage[0] += 1
+        stage[1] += own
+
+    def reset(self) -> None:
+        self.__init__()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Devuelve una copia de los contadores como diccionarios simples. El
+        tiempo de cada comando incluye el de las instrucciones que ejecuta;
+        el de cada pila ("repetir;poder") y el de las etapas, no.
+        """
+        return {
+            "stages": {name: {"calls": int(c), "seconds": t}
+                       for name, (c, t) in self.stages.items()},
+            "commands": {name: {"calls": int(c), "seconds": t}
+                         for name, (c, t) in self.commands.items()},
+            "lines": dict(self.lines),
+            "stacks": {";".join(stack): seconds for stack, seconds in self.stacks.items()},
+        }
+
+    def to_json(self, indent: int = 2) -> str:
+        stats = self.stats()
+        stats["lines"] = {str(k): v for k, v in stats["lines"].items()}
+        return json.dumps(stats, indent=indent, ensure_ascii=False)
+
+    def collapsed_stacks(self) -> List[str]:
+        """
+        Líneas en formato "pila;marco peso" (peso en microsegundos), compatible
+        con flamegraph.pl y speedscope.
+        """
+        lines = []
+        for stage in ("lex", "parse", "compile"):
+            weight = int(self.stages[stage][1] * 1e6)
+            if weight:
+                lines.append(f"gamer;front-end;{stage} {weight}")
+        for stack, seconds in sorted(self.stacks.items()):
+            weight = int(seconds * 1e6)
+            if weight:
+                lines.append(f"gamer;execute;{';'.join(stack)} {weight}")
+        return lines
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for line in self.collapsed_stacks():
+                f.write(line + "\n")
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json() + "\n")
@@ -0,0 +1,49 @@
+"""
+Módulo de resultados estructurados para el intérprete Gamer.
+Los manejadores devuelven objetos Result; el texto se genera solo si se pide.
+"""
+
+from typing import Any, Optional, Tuple
+
+
+class Result:
+    """
+    Resultado de una instrucción: comando, operandos resueltos y valor.
+    En `crear` y `decir` el operando es el nombre de la variable; en
+    `repetir`, el valor es el número de vueltas; en `mision` el operando es
+    su nombre y el valor la misión, y en `llamar` los operandos son el nombre
+    y los argumentos, y el valor lo que regresó (None si nada).
+    """
+
+    __slots__ = ("command", "operands", "value", "_text")
+
+    def __init__(self, command: str, operands: Tuple[Any, ...], value: Any) -> None:
+        self.command = command
+        self.operands = operands
+        self.value = value
+        self._text: Optional[str] = None
+
+    def text(self) -> str:
+        """
+        Texto del resultado, con el mismo formato que eval_instruction.
+        Se calcula la primera vez que se pide y queda guardado.
+        """
+        if self._text is None:
+            if self.command == "crear":
+                self._text = f"Variable '{self.operands[0]}' definida con valor {self.value}"
+            elif self.command == "decir":
+                self._text = f"{self.operands[0]} = {self.value}"
+            elif self.command == "repetir":
+                self._text = f"Bloque repetido {self.value} veces"
+            elif self.command == "mision":
+                self._text = f"Misión '{self.operands[0]}' definida"
+            elif self.command == "llamar" and self.value is None:
+                self._text = f"Misión '{self.operands[0]}' completada"
+            else:
+                self._text = f"Resultado: {self.value}"
+        return self._text
+
+    __str__ = text
+
+    def __repr__(self) -> str:
+        return f"Result({self.command!r}, {self.operands!r}, {self.value!r})"
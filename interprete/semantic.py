@@ -1,63 +1,209 @@
 """
 Módulo de análisis semántico para el intérprete Gamer.
-Valida solo la estructura de las instrucciones, no gestiona variables.
+Valida la forma de cada instrucción e infiere los tipos de las variables
+sobre el programa completo.
 """
 
-from typing import List, Tuple
+from typing import Any, Dict, List, Tuple
+from interprete.keywords import BLOCK_COMMANDS
+from interprete.validator import validate, ValidationError
+
+# Tipos inferidos. Un slot sin tipo en el análisis es desconocido: puede no
+# estar definido o venir de fuera del programa (define_variable, otro script).
+INT, FLOAT, STR, ARRAY = "int", "float", "str", "array"
+SCALARS = frozenset({INT, FLOAT})
+
+# Comandos que exigen operandos numéricos.
+NUMERIC_COMMANDS = frozenset({
+    "curar", "golpear", "multiplicar", "dividir", "poder",
+    "revivir", "xp", "jefe", "esbirro",
+})
+
+COUNT_ERROR = "'repetir' necesita un número entero no negativo."
+ARITY_ERROR = "La misión '{name}' necesita {expected} argumentos y recibió {got}."
 
 class SemanticError(Exception):
     """Excepción personalizada para errores semánticos."""
     pass
 
+class ProgramTypes:
+    """
+    Resultado del análisis de tipos de un programa.
+
+    Attributes:
+        scalar: Por instrucción, en el orden de Program.walk(), True si todos
+            sus operandos son int/float probados (se puede ejecutar sin
+            comprobaciones de tipo).
+        errors: Lista de (línea, mensaje) con los errores probados.
+        types: Tipo final inferido de cada slot asignado en el programa.
+    """
+
+    def __init__(self) -> None:
+        self.scalar: List[bool] = []
+        self.errors: List[Tuple[int, str]] = []
+        self.types: Dict[int, str] = {}
+
 class SemanticAnalyzer:
     """
-    Analizador semántico: valida forma, no existencia de variables.
+    Analizador semántico: valida forma e infiere tipos del programa completo.
     """
 
     def __init__(self) -> None:
-        # Ya no guardamos variables en esta versión
         pass
 
     def analyze(self, tokens: List[Tuple[str, str]]) -> bool:
-        if not tokens:
-            raise SemanticError("No hay tokens para analizar.")
-
-        cmd = tokens[0][1]
-
-        # crear <identificador> = <valor>
-        if cmd == "crear":
-            if not (
-                len(tokens) == 4
-                and tokens[1][0] == "IDENTIFICADOR"
-                and tokens[2][0] == "IGUAL"
-                and tokens[3][0] in ("NUMERO", "DECIMAL", "IDENTIFICADOR", "CADENA")
-            ):
-                raise SemanticError("Sintaxis inválida para 'crear'.")
-            return True
-
-        # Comandos binarios
-        if cmd in ["curar", "golpear", "multiplicar", "dividir", "poder"]:
-            if len(tokens) != 3:
-                raise SemanticError(f"Sintaxis inválida para '{cmd}'.")
-            # solo revisamos tipo de token
-            for t in tokens[1:]:
-                if t[0] not in ("IDENTIFICADOR", "NUMERO", "DECIMAL"):
-                    raise SemanticError(f"Token inesperado: {t}")
-            return True
-
-        # Comandos unarios
-        if cmd in ["revivir", "xp", "decir"]:
-            if len(tokens) != 2 or tokens[1][0] != "IDENTIFICADOR":
-                raise SemanticError(f"Sintaxis inválida para '{cmd}'.")
-            return True
-
-        # Comandos múltiples
-        if cmd in ["jefe", "esbirro"]:
-            if len(tokens) < 2:
-                raise SemanticError(f"Sintaxis inválida para '{cmd}'.")
-            for t in tokens[1:]:
-                if t[0] != "IDENTIFICADOR":
-                    raise SemanticError(f"Token inesperado: {t}")
-            return True
-
-        raise SemanticError(f"Instrucción no reconocida: {cmd}")
+        try:
+            validate(tokens)
+        except ValidationError as e:
+            raise SemanticError(str(e))
+        return True
+
+    def analyze_program(self, program, fresh: bool = False) -> ProgramTypes:
+        """
+        Recorre un programa compilado siguiendo el tipo de cada variable a
+        través de las asignaciones con `crear`.
+
+        Args:
+            program: Programa compilado (interprete.compiler.Program).
+            fresh: Si es True, el programa se ejecutará sin variables previas,
+                así que un identificador aún no asignado está indefinido: en
+                `crear x = y` el valor es la cadena "y" y leerlo en otro
+                comando es un error probado.
+
+        Returns:
+            ProgramTypes con las instrucciones probadas y los errores.
+        """
+        info = ProgramTypes()
+        # Número de parámetros de las misiones definidas hasta cada punto.
+        self._missions: Dict[str, int] = {}
+        self._analyze(program.instructions, info, program.symbols.names, fresh)
+        # None marca un slot asignado con tipo desconocido.
+        for slot in [slot for slot, kind in info.types.items() if kind is None]:
+            del info.types[slot]
+        return info
+
+    def _analyze(self, instructions, info: ProgramTypes, names: List[str],
+                 fresh: bool) -> None:
+        types = info.types
+        for instr in instructions:
+            cmd = instr.command
+            scalar = False
+            if cmd in BLOCK_COMMANDS:
+                info.scalar.append(False)
+                self._analyze_block(instr, info, names, fresh)
+                continue
+            if cmd == "mision":
+                info.scalar.append(False)
+                self._analyze_mission(instr.operands[0][1], info)
+                continue
+            if cmd == "llamar":
+                info.scalar.append(False)
+                self._analyze_call(instr, info, names, fresh)
+                continue
+            if cmd == "crear":
+                (_, target), (is_var, rhs) = instr.operands
+                if not is_var:
+                    kind = _literal_type(rhs)
+                elif rhs in types:
+                    kind = types[rhs]
+                elif fresh:
+                    kind = STR  # Identificador indefinido: se toma como texto.
+                else:
+                    kind = None
+                types[target] = kind
+            else:
+                kinds = []
+                for is_var, value in instr.operands:
+                    if not is_var:
+                        kinds.append(_literal_type(value))
+                    elif value in types:
+                        kinds.append(types[value])
+                    elif fresh:
+                        info.errors.append(
+                            (instr.line, f"La variable '{names[value]}' no está definida."))
+                        kinds.append(None)
+                    else:
+                        kinds.append(None)
+                if cmd in NUMERIC_COMMANDS:
+                    if STR in kinds:
+                        info.errors.append((instr.line, "Solo se pueden operar números."))
+                    else:
+                        scalar = all(kind in SCALARS for kind in kinds)
+            info.scalar.append(scalar)
+
+    def _analyze_block(self, instr, info: ProgramTypes, names: List[str],
+                       fresh: bool) -> None:
+        # repetir <n>: la cuenta debe ser un entero no negativo. El cuerpo
+        # puede ejecutarse cero o más veces, así que las variables que asigna
+        # tienen tipo desconocido al entrar (vueltas anteriores) y al salir,
+        # y sus errores solo se informan si la cuenta es un literal mayor
+        # que cero.
+        types = info.types
+        (is_var, count), (_, body) = instr.operands
+        if not is_var:
+            if count < 0:
+                info.errors.append((instr.line, COUNT_ERROR))
+        elif count in types:
+            if types[count] is not None and types[count] != INT:
+                info.errors.append((instr.line, COUNT_ERROR))
+        elif fresh:
+            info.errors.append(
+                (instr.line, f"La variable '{names[count]}' no está definida."))
+        written = [i.operands[0][1] for i in body.walk() if i.command == "crear"]
+        written += [i.operands[1][1] for i in body.walk()
+                    if i.command == "llamar" and i.operands[1][0]]
+        for slot in written:
+            types[slot] = None
+        if not is_var and count > 0:
+            self._analyze(body.instructions, info, names, fresh)
+        else:
+            # Con cero vueltas el cuerpo no se ejecuta: sus errores no están
+            # probados y se descartan (las instrucciones con error quedan
+            # sin marcar como escalares).
+            errors = info.errors
+            info.errors = []
+            try:
+                self._analyze(body.instructions, info, names, fresh)
+            finally:
+                info.errors = errors
+        for slot in written:
+            types[slot] = None
+
+    def _analyze_mission(self, mission, info: ProgramTypes) -> None:
+        # El cuerpo usa su propia tabla de símbolos y empieza sin variables:
+        # solo los parámetros están definidos, con tipo desconocido.
+        self._missions[mission.name] = len(mission.params)
+        outer = info.types
+        info.types = {slot: None for slot in range(len(mission.params))}
+        try:
+            self._analyze(mission.body.instructions, info, mission.body.symbols.names, True)
+        finally:
+            info.types = outer
+
+    def _analyze_call(self, instr, info: ProgramTypes, names: List[str],
+                      fresh: bool) -> None:
+        # llamar <misión> <argumentos...>: el valor de regreso (si se guarda)
+        # tiene tipo desconocido.
+        types = info.types
+        name = instr.operands[0][1]
+        args = instr.operands[2:]
+        for is_var, value in args:
+            if is_var and value not in types and fresh:
+                info.errors.append(
+                    (instr.line, f"La variable '{names[value]}' no está definida."))
+        expected = self._missions.get(name)
+        if expected is not None and expected != len(args):
+            info.errors.append(
+                (instr.line, ARITY_ERROR.format(name=name, expected=expected, got=len(args))))
+        is_var, target = instr.operands[1]
+        if is_var:
+            types[target] = None
+
+def _literal_type(value: Any) -> str:
+    if isinstance(value, int):
+        return INT
+    if isinstance(value, float):
+        return FLOAT
+    if isinstance(value, str):
+        return STR
+    return ARRAY
@@ -0,0 +1,318 @@
+"""
+Servidor asyncio multi-sesión para el intérprete Gamer.
+Cada conexión (TCP o socket Unix) es una sesión con su propio Interpreter.
+
+Protocolo por líneas (UTF-8): el cliente envía una instrucción por línea y
+recibe una respuesta por instrucción, en el mismo orden, aunque envíe varias
+sin esperar:
+
+    OK <resultado>
+    ERR <mensaje>
+
+Las líneas vacías se ignoran y no tienen respuesta.
+
+Si el servidor guarda sesiones (snapshot_dir), un cliente puede darle nombre
+a la suya con la línea `:sesion <nombre>`: si existe una instantánea con ese
+nombre, se restaura (variables y misiones) y la respuesta es
+`OK Sesión '<nombre>' restaurada`; si no, `OK Sesión '<nombre>' nueva`. Las
+sesiones con nombre se guardan periódicamente, al cerrarse y al cerrar el
+servidor, así que sobreviven a un reinicio.
+"""
+
+import asyncio
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor
+from time import monotonic
+from typing import Any, Dict, Optional, Set, Tuple
+
+from interprete.cache import write_atomic
+from interprete.interpreter import Interpreter, InterpreterError
+from interprete.limits import Limits
+from interprete.optimizer import PURE_COMMANDS
+from interprete.parallel import HEAVY_BITS, HEAVY_ITEMS, compute, is_heavy
+from interprete.results import Result
+from interprete import snapshot
+
+# Tamaño máximo de una línea del protocolo.
+MAX_LINE = 1 << 16
+
+BUSY_MESSAGE = "ERR Servidor ocupado: se alcanzó el máximo de sesiones."
+
+# Línea de control que da nombre a una sesión, y nombres válidos.
+SESSION_COMMAND = ":sesion"
+SESSION_NAME = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+class Session:
+    """
+    Sesión de un cliente: su intérprete y la hora de su última actividad.
+    Mientras responde una instrucción (`busy`) no se considera inactiva.
+    Una sesión con nombre (`name`) se guarda cuando `handled` pasa de
+    `saved`, el número de instrucciones atendidas en la última instantánea.
+    """
+
+    __slots__ = ("interpreter", "peer", "last_active", "busy", "handled", "name", "saved")
+
+    def __init__(self, interpreter: Interpreter, peer: Any) -> None:
+        self.interpreter = interpreter
+        self.peer = peer
+        self.last_active = monotonic()
+        self.busy = False
+        self.handled = 0
+        self.name: Optional[str] = None
+        self.saved = 0
+
+
+class SessionServer:
+    """
+    Servidor de sesiones aisladas.
+
+    Contrapresión: cada sesión procesa sus líneas en orden y no lee la
+    siguiente hasta haber escrito la respuesta en un búfer con espacio
+    (writer.drain), así un cliente que no lee sus respuestas deja de ser
+    atendido y el sistema operativo frena sus envíos. Además se limitan las
+    sesiones simultáneas y las tareas pendientes en el ejecutor.
+
+    Args:
+        limits: Límites de recursos de cada sesión.
+        idle_timeout: Segundos sin recibir nada tras los que se cierra una sesión.
+        max_sessions: Sesiones simultáneas; las conexiones de más se rechazan.
+        executor: Ejecutor para las instrucciones costosas; por defecto, un
+            ProcessPoolExecutor (las potencias grandes retienen el GIL).
+        max_pending: Instrucciones costosas en curso a la vez; las demás esperan.
+        snapshot_dir: Directorio de las instantáneas de las sesiones con
+            nombre (`:sesion`); None para no guardarlas.
+        snapshot_interval: Segundos entre instantáneas de las sesiones que
+            cambiaron.
+    """
+
+    def __init__(self, limits: Optional[Limits] = None, idle_timeout: float = 300.0,
+                 max_sessions: int = 1024, executor: Optional[Executor] = None,
+                 max_pending: Optional[int] = None, heavy_bits: int = HEAVY_BITS,
+                 heavy_items: int = HEAVY_ITEMS, snapshot_dir: Optional[str] = None,
+                 snapshot_interval: float = 60.0) -> None:
+        self.limits = limits
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.heavy_bits = heavy_bits
+        self.heavy_items = heavy_items
+        self.snapshot_dir = snapshot_dir
+        self.snapshot_interval = snapshot_interval
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_pending = max_pending or 2 * (os.cpu_count() or 1)
+        self._pending: Optional[asyncio.Semaphore] = None
+        self.sessions: Dict[asyncio.StreamWriter, Session] = {}
+        self.stats = {"sessions": 0, "rejected": 0, "evicted": 0,
+                      "instructions": 0, "offloaded": 0, "restored": 0, "snapshots": 0}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._reaper: Optional[asyncio.Task] = None
+        self._saver: Optional[asyncio.Task] = None
+        self._handlers: Set[asyncio.Task] = set()
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        self._server = await asyncio.start_server(self.handle, host, port, limit=MAX_LINE)
+        self._start_tasks()
+        return self._server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        self._server = await asyncio.start_unix_server(self.handle, path, limit=MAX_LINE)
+        self._start_tasks()
+        return self._server
+
+    def _start_tasks(self) -> None:
+        self._reaper = asyncio.create_task(self._evict_idle())
+        if self.snapshot_dir is not None:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            self._saver = asyncio.create_task(self._snapshot_sessions())
+
+    async def close(self) -> None:
+        """
+        Deja de aceptar conexiones, cierra las sesiones (guardando las que
+        tienen nombre) y el ejecutor propio.
+        """
+        if self._reaper is not None:
+            self._reaper.cancel()
+        if self._saver is not None:
+            self._saver.cancel()
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self.sessions):
+            writer.close()
+        if self._handlers:
+            # Las sesiones terminan solas al ver la conexión cerrada.
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Atiende una conexión hasta que el cliente la cierra o queda inactiva.
+        """
+        if len(self.sessions) >= self.max_sessions:
+            self.stats["rejected"] += 1
+            writer.write(BUSY_MESSAGE.encode("utf-8") + b"\n")
+            await self._close(writer)
+            return
+        session = Session(Interpreter(limits=self.limits), writer.get_extra_info("peername"))
+        self.sessions[writer] = session
+        self.stats["sessions"] += 1
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            while True:
+                try:
+                    raw = await reader.readline()
+                except ValueError:
+                    writer.write(f"ERR Línea demasiado larga (máximo {MAX_LINE} bytes).\n"
+                                 .encode("utf-8"))
+                    break
+                if not raw:
+                    break
+                line = raw.decode("utf-8", "replace").strip()
+                if not line:
+                    session.last_active = monotonic()
+                    continue
+                session.busy = True
+                writer.write(await self._reply(session, line))
+                await writer.drain()
+                session.busy = False
+                session.last_active = monotonic()
+        except ConnectionError:
+            pass
+        finally:
+            del self.sessions[writer]
+            try:
+                await self._save(session)
+            finally:
+                self._handlers.discard(task)
+                await self._close(writer)
+
+    async def _evict_idle(self) -> None:
+        # Un único temporizador revisa todas las sesiones, en lugar de uno por
+        # lectura; al cerrar la conexión, la lectura pendiente termina sola.
+        interval = max(self.idle_timeout / 4, 0.01)
+        while True:
+            await asyncio.sleep(interval)
+            deadline = monotonic() - self.idle_timeout
+            for writer, session in list(self.sessions.items()):
+                if (session.last_active < deadline and not session.busy
+                        and not writer.is_closing()):
+                    self.stats["evicted"] += 1
+                    writer.write("ERR Sesión cerrada por inactividad.\n".encode("utf-8"))
+                    writer.close()
+
+    async def _snapshot_sessions(self) -> None:
+        # Un único temporizador guarda las sesiones con nombre que cambiaron.
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            for session in list(self.sessions.values()):
+                await self._save(session)
+
+    async def _save(self, session: Session) -> None:
+        if session.name is None or session.handled == session.saved:
+            return
+        # La imagen se codifica en el bucle (el estado no cambia a medias) y
+        # se escribe en un hilo, sin detener a las demás sesiones.
+        handled = session.handled
+        try:
+            data = snapshot.dumps(session.interpreter)
+            await asyncio.to_thread(write_atomic,
+                                    self._snapshot_path(session.name), data)
+        except (OSError, TypeError):
+            return  # Se reintenta en la próxima vuelta.
+        session.saved = handled
+        self.stats["snapshots"] += 1
+
+    def _snapshot_path(self, name: str) -> str:
+        return os.path.join(self.snapshot_dir, name + snapshot.SUFFIX)
+
+    async def _name_session(self, session: Session, name: str) -> str:
+        if self.snapshot_dir is None:
+            return "ERR El servidor no guarda sesiones."
+        if not SESSION_NAME.fullmatch(name):
+            return "ERR Nombre de sesión no válido (letras, números, '_' y '-')."
+        await self._save(session)
+        path = self._snapshot_path(name)
+        try:
+            session.interpreter.restore(path)
+        except FileNotFoundError:
+            state = "nueva"
+        except (OSError, ValueError) as e:
+            return f"ERR No se pudo restaurar la sesión '{name}': {e}"
+        else:
+            state = "restaurada"
+            self.stats["restored"] += 1
+        session.name = name
+        # Una sesión nueva se guarda en la próxima vuelta aunque no cambie.
+        session.saved = session.handled if state == "restaurada" else -1
+        return f"OK Sesión '{name}' {state}"
+
+    async def _reply(self, session: Session, line: str) -> bytes:
+        interp = session.interpreter
+        if line[0] == ":":
+            command, _, name = line.partition(" ")
+            if command == SESSION_COMMAND:
+                text = await self._name_session(session, name.strip())
+                return (text + "\n").encode("utf-8")
+        session.handled += 1
+        self.stats["instructions"] += 1
+        try:
+            instr = interp.prepare(line)
+            if instr.command in PURE_COMMANDS:
+                values = interp.resolve_operands(instr)
+                if is_heavy(instr.command, values, self.heavy_bits, self.heavy_items):
+                    result = await self._offload(instr.command, values)
+                else:
+                    result = interp.execute(instr)
+            else:
+                result = interp.execute(instr)
+            text = "OK " + result.text()
+        except InterpreterError as e:
+            text = f"ERR {e}"
+        except ValueError:
+            # Python no convierte a texto enteros de más de 4300 dígitos.
+            text = "ERR El resultado es demasiado grande para mostrarse."
+        except Exception as e:
+            # Errores de Python (división por cero, desbordamiento, ...): la
+            # sesión sigue abierta.
+            text = f"ERR Error inesperado: {e}"
+        # Una respuesta ocupa siempre una línea.
+        return (text.replace("\n", " ") + "\n").encode("utf-8")
+
+    async def _offload(self, command: str, values: Tuple[Any, ...]) -> Result:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor()
+        if self._pending is None:
+            self._pending = asyncio.Semaphore(self._max_pending)
+        self.stats["offloaded"] += 1
+        async with self._pending:
+            loop = asyncio.get_running_loop()
+            value = await loop.run_in_executor(self._executor, compute,
+                                               command, values, self.limits)
+        return Result(command, values, value)
+
+    async def _close(self, writer: asyncio.StreamWriter) -> None:
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def serve(host: str = "127.0.0.1", port: int = 7777, unix: Optional[str] = None,
+                **options: Any) -> None:
+    """
+    Ejecuta el servidor hasta que se cancela (por ejemplo, con Ctrl+C).
+    """
+    server = SessionServer(**options)
+    listener = await (server.start_unix(unix) if unix else server.start_tcp(host, port))
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        await server.close()
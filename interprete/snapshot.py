@@ -0,0 +1,263 @@
+"""
+Módulo de instantáneas de sesión para el intérprete Gamer.
+Guarda el estado de un Interpreter (variables y misiones) en una imagen
+binaria compacta y versionada, y lo restaura sin volver a ejecutar nada:
+el servidor y el modo por lotes la usan para retomar una sesión tras un
+reinicio.
+
+Formato (mismo esquema por columnas que la caché de compilación): cabecera
+con magia y versión, y bloques con prefijo de longitud:
+    nombres (texto separado por "\n"), etiquetas de tipo (un byte por
+    variable), enteros (int64), flotantes (float64), valores raros (enteros
+    grandes en complemento a dos, cadenas y arreglos) y las misiones, que se
+    guardan ya compiladas en el formato de interprete/cache.py.
+"""
+
+import mmap
+import struct
+from array import array
+from time import monotonic
+from typing import Any, List, Optional
+
+from interprete import cache
+from interprete.compiler import Instruction, Program
+from interprete.interpreter import HANDLERS, Interpreter
+from interprete.symbols import UNDEFINED, VariablesView
+
+MAGIC = b"GMRS"
+FORMAT_VERSION = 1
+SUFFIX = ".gms"
+
+_HEADER = struct.Struct("<4sH")
+_COUNT = cache._COUNT
+_BLOCKS = 6
+
+_INT, _FLOAT, _BOOL, _EXTRA = b"i"[0], b"f"[0], b"b"[0], b"x"[0]
+_INT_MIN, _INT_MAX = cache._INT_MIN, cache._INT_MAX
+
+# Clave de las misiones: depende solo de la versión y de la gramática.
+_MISSIONS_KEY = cache.source_key(b"misiones")
+
+
+def dumps(interp: Interpreter) -> bytes:
+    """
+    Codifica las variables definidas y las misiones de un intérprete.
+
+    Raises:
+        TypeError si alguna variable tiene un valor que no se puede guardar.
+    """
+    names: List[str] = []
+    tags = bytearray()
+    ints, floats = array("q"), array("d")
+    extras = bytearray()
+    for name, value in zip(interp.symbols.names, interp._values):
+        if value is UNDEFINED:
+            continue
+        names.append(name)
+        kind = type(value)
+        if kind is int and _INT_MIN <= value <= _INT_MAX:
+            tags.append(_INT)
+            ints.append(value)
+        elif kind is float:
+            tags.append(_FLOAT)
+            floats.append(value)
+        elif kind is bool:
+            tags.append(_BOOL)
+            ints.append(value)
+        else:
+            tags.append(_EXTRA)
+            try:
+                cache._put_extra(extras, value)
+            except TypeError:
+                raise TypeError(f"La variable '{name}' tiene un valor que no se "
+                                f"puede guardar: {value!r}") from None
+
+    missions = b""
+    if interp._missions:
+        definer = HANDLERS["definir_mision"]
+        instructions = [
+            Instruction(0, "mision", definer, ((False, mission),),
+                        " ".join(["mision", mission.name, *mission.params]))
+            for mission in interp._missions.values()]
+        program = Program(instructions, interp.symbols)
+        missions = cache.encode(_MISSIONS_KEY, *interp._cache_records(program))
+
+    out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION))
+    for block in ("\n".join(names).encode("utf-8"), tags, ints.tobytes(),
+                  floats.tobytes(), extras, missions):
+        out += _COUNT.pack(len(block))
+        out += block
+    return bytes(out)
+
+
+def loads(interp: Interpreter, data) -> None:
+    """
+    Reemplaza las variables y las misiones de un intérprete por las de una
+    imagen de dumps(). Los slots de la tabla de símbolos se conservan, así
+    que los programas ya compilados siguen siendo válidos.
+
+    Raises:
+        ValueError si la imagen no es válida, es de otra versión del formato
+        o guarda misiones compiladas con otra versión del intérprete.
+    """
+    magic, version = _read_header(data)
+    if magic != MAGIC:
+        raise ValueError("No es una instantánea de sesión.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Versión de instantánea no soportada: {version}")
+    try:
+        blocks = _read_blocks(data)
+        names_raw, tags, ints_raw, floats_raw, extras, missions_raw = blocks
+        names = names_raw.decode("utf-8").split("\n") if names_raw else []
+        ints = array("q")
+        ints.frombytes(ints_raw)
+        floats = array("d")
+        floats.frombytes(floats_raw)
+        values = _decode_values(tags, ints, floats, extras)
+    except (struct.error, IndexError, UnicodeDecodeError, StopIteration):
+        raise ValueError("Instantánea dañada.") from None
+    if len(values) != len(names):
+        raise ValueError("Instantánea dañada.")
+    missions = None
+    if missions_raw:
+        missions = cache.decode(missions_raw, _MISSIONS_KEY)
+        if missions is None:
+            raise ValueError("Las misiones de la instantánea son de otra versión del intérprete.")
+
+    # Un arreglo de valores nuevo: si el anterior era la base de algún
+    # fork(), queda intacto para ellos.
+    symbols = interp.symbols
+    fresh = not len(symbols)
+    slots = symbols.intern_all(names)
+    count = len(slots)
+    if fresh or slots == list(range(count)):
+        frame = values
+        frame.extend([UNDEFINED] * (len(symbols) - count))
+    else:
+        frame = [UNDEFINED] * len(symbols)
+        for slot, value in zip(slots, values):
+            frame[slot] = value
+    interp._values = frame
+    interp._variables = VariablesView(symbols, frame, interp._before_write)
+    interp._shared = False
+    interp._missions.clear()
+    if missions is not None:
+        for instr in interp._load_cached(*missions).instructions:
+            mission = instr.operands[0][1]
+            interp._missions[mission.name] = mission
+
+
+def dump(interp: Interpreter, path: str) -> None:
+    """
+    Guarda una instantánea de forma atómica (archivo temporal + rename): una
+    instantánea anterior solo se reemplaza por otra completa.
+    """
+    cache.write_atomic(path, dumps(interp))
+
+
+def load(interp: Interpreter, path: str) -> None:
+    """
+    Restaura una instantánea leyéndola mediante mmap.
+
+    Raises:
+        OSError si el archivo no se puede leer; ValueError si no es válido.
+    """
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError("No es una instantánea de sesión.") from None  # Archivo vacío.
+        with data:
+            loads(interp, data)
+
+
+def _read_header(data) -> tuple:
+    try:
+        return _HEADER.unpack_from(data, 0)
+    except struct.error:
+        raise ValueError("No es una instantánea de sesión.") from None
+
+
+def _read_blocks(data) -> List[bytes]:
+    pos = _HEADER.size
+    blocks = []
+    for _ in range(_BLOCKS):
+        (size,) = _COUNT.unpack_from(data, pos)
+        start = pos + _COUNT.size
+        pos = start + size
+        if pos > len(data):
+            raise IndexError(pos)
+        blocks.append(data[start:pos])
+    if pos != len(data):
+        raise IndexError(pos)
+    return blocks
+
+
+def _decode_values(tags: bytes, ints: array, floats: array, extras: bytes) -> List[Any]:
+    # Casos comunes: todas las variables enteras o todas decimales, sin
+    # recorrer las etiquetas una a una.
+    count = len(tags)
+    if tags.count(_INT) == count and len(ints) == count:
+        return ints.tolist()
+    if tags.count(_FLOAT) == count and len(floats) == count:
+        return floats.tolist()
+    next_int, next_float = iter(ints.tolist()).__next__, iter(floats.tolist()).__next__
+    values: List[Any] = []
+    append = values.append
+    pos = 0
+    for tag in tags:
+        if tag == _INT:
+            append(next_int())
+        elif tag == _FLOAT:
+            append(next_float())
+        elif tag == _BOOL:
+            append(bool(next_int()))
+        elif tag == _EXTRA:
+            value, pos = cache._get_extra(extras, pos)
+            append(value)
+        else:
+            raise IndexError(tag)
+    return values
+
+
+class AutoSnapshot:
+    """
+    Guarda instantáneas periódicas de un intérprete en un archivo.
+
+    tick() se llama tras cada instrucción (o línea) ejecutada y guarda cuando
+    pasaron `interval` segundos desde la última instantánea o, si se indica,
+    cada `every` llamadas. Sin cambios desde la última, no se guarda nada.
+
+    Args:
+        interpreter: Intérprete cuyo estado se guarda.
+        path: Archivo de la instantánea.
+        interval: Segundos entre instantáneas; None para no usar el reloj.
+        every: Instrucciones entre instantáneas; None para no contarlas.
+    """
+
+    __slots__ = ("interpreter", "path", "interval", "every", "saves", "_pending", "_last")
+
+    def __init__(self, interpreter: Interpreter, path: str, interval: Optional[float] = 60.0,
+                 every: Optional[int] = None) -> None:
+        self.interpreter = interpreter
+        self.path = path
+        self.interval = interval
+        self.every = every
+        self.saves = 0
+        self._pending = 0
+        self._last = monotonic()
+
+    def tick(self) -> None:
+        self._pending += 1
+        if self.every is not None and self._pending >= self.every:
+            self.save()
+        elif self.interval is not None and monotonic() - self._last >= self.interval:
+            self.save()
+
+    def save(self) -> None:
+        """Guarda una instantánea si hubo cambios desde la anterior."""
+        if self._pending:
+            dump(self.interpreter, self.path)
+            self.saves += 1
+            self._pending = 0
+        self._last = monotonic()
@@ -0,0 +1,327 @@
+"""
+Módulo de barridos de parámetros para el intérprete Gamer.
+Ejecuta un mismo script con muchos conjuntos de valores iniciales (uno por
+fila de un CSV o JSON) repartiendo lotes de filas entre varios procesos.
+
+Cada proceso compila el script una sola vez y ejecuta cada fila sobre un
+estado vacío con sus variables iniciales. De cada fila se guardan las
+columnas elegidas: el valor final de algunas variables y el último valor
+que mostró `decir` para otras. Los resultados se entregan por lotes, en el
+orden de las filas, a medida que terminan: ni las filas ni los resultados
+se acumulan en memoria.
+"""
+
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from interprete.arrays import ARRAY_TYPES, parse_array
+from interprete.compiler import Program
+from interprete.interpreter import Interpreter, InterpreterError
+from interprete.limits import Limits
+from interprete.optimizer import folded
+
+# Filas por lote enviado a cada proceso.
+BATCH_SIZE = 256
+
+# Lotes en vuelo por proceso: mantiene ocupado el pool sin leer toda la entrada.
+PREFETCH = 2
+
+# Prefijo de las columnas con la salida de `decir`.
+DECIR_PREFIX = "decir:"
+
+# Columna con el error de cada fila (None si terminó bien).
+ERROR_COLUMN = "error"
+
+Binding = Dict[str, Any]
+
+
+class SweepBatch:
+    """
+    Resultados de un lote de filas en forma de columnas.
+
+    Attributes:
+        start: Índice (desde 0) de la primera fila del lote.
+        columns: Nombre de columna -> lista de valores, uno por fila. Las
+            variables sin valor y las que `decir` no mostró quedan en None.
+        errors: Mensaje de error de cada fila o None.
+    """
+
+    __slots__ = ("start", "columns", "errors")
+
+    def __init__(self, start: int, columns: Dict[str, List[Any]],
+                 errors: List[Optional[str]]) -> None:
+        self.start = start
+        self.columns = columns
+        self.errors = errors
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Genera, por fila, (índice, valores de las columnas..., error)."""
+        columns = list(self.columns.values())
+        for offset, error in enumerate(self.errors):
+            yield (self.start + offset, *(column[offset] for column in columns), error)
+
+
+def parse_value(text: str) -> Any:
+    """
+    Convierte una celda de CSV en el valor de una variable: entero, decimal,
+    lista (arreglo) o, si no es nada de eso, cadena.
+    """
+    text = text.strip()
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    if text.startswith("[") and text.endswith("]"):
+        return parse_array(text)
+    return text
+
+
+def read_bindings(stream: TextIO, fmt: str = "csv") -> Iterator[Binding]:
+    """
+    Lee filas de valores iniciales una a una.
+
+    Args:
+        stream: Texto de entrada.
+        fmt: "csv" (la cabecera da los nombres de las variables; las celdas
+            vacías no definen la variable), "jsonl" (un objeto por línea) o
+            "json" (una lista de objetos, que se lee completa).
+
+    Los nombres se pasan a minúsculas, como los identificadores del script.
+
+    Raises:
+        ValueError si el formato no se reconoce, una fila no es un objeto o
+        un nombre no es un identificador válido.
+    """
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            yield {variable_name(name): parse_value(value) for name, value in row.items()
+                   if name and value not in (None, "")}
+    elif fmt in ("json", "jsonl"):
+        rows: Iterable[Any] = json.load(stream) if fmt == "json" else (
+            json.loads(line) for line in stream if line.strip())
+        for row in rows:
+            if not isinstance(row, dict):
+                raise ValueError("Cada fila debe ser un objeto JSON.")
+            yield {variable_name(name): _from_json(value) for name, value in row.items()}
+    else:
+        raise ValueError(f"Formato de entrada desconocido: {fmt}")
+
+
+def variable_name(name: str) -> str:
+    """
+    Nombre de variable tal como lo ve el script (el lexer pasa los
+    identificadores a minúsculas).
+
+    Raises:
+        ValueError si no es un identificador válido.
+    """
+    lowered = name.strip().lower()
+    if not lowered.isidentifier():
+        raise ValueError(f"Nombre de variable no válido: {name!r}")
+    return lowered
+
+
+def _from_json(value: Any) -> Any:
+    if isinstance(value, list):
+        return parse_array("[" + " ".join(str(item) for item in value) + "]")
+    return value
+
+
+def assigned_names(program: Program) -> List[str]:
+    """
+    Variables que asigna el script (con `crear`) fuera de las misiones, en
+    orden de primera asignación: las columnas por defecto de un barrido.
+    Las asignaciones muertas que eliminó el optimizador se omiten: siempre
+    las sigue otro `crear` a la misma variable.
+    """
+    names: Dict[str, None] = {}
+    stack = list(reversed(program.instructions))
+    while stack:
+        instr = stack.pop()
+        if folded(instr):
+            continue
+        if instr.command == "repetir":
+            stack.extend(reversed(instr.operands[1][1].instructions))
+        elif instr.command == "crear":
+            names[program.symbols.names[instr.operands[0][1]]] = None
+        elif instr.command == "llamar" and instr.operands[1][0]:
+            names[program.symbols.names[instr.operands[1][1]]] = None
+    return list(names)
+
+
+class _Runner:
+    # Script compilado y columnas elegidas; hay uno por proceso.
+
+    def __init__(self, source: str, variables: Sequence[str], said: Sequence[str],
+                 limits: Optional[Limits], backend: str) -> None:
+        self.interpreter = Interpreter(limits=limits, backend=backend)
+        self.program = self.interpreter.compile(source)
+        self.variables = list(variables)
+        self.said = list(said)
+
+    def run(self, start: int, rows: List[Binding]) -> SweepBatch:
+        interp = self.interpreter
+        columns: Dict[str, List[Any]] = {name: [] for name in self.variables}
+        for name in self.said:
+            columns[DECIR_PREFIX + name] = []
+        errors: List[Optional[str]] = []
+        mode = "result" if self.said else "quiet"
+        wanted = set(self.said)
+        for row in rows:
+            interp.reset()
+            values = dict.fromkeys(columns)
+            try:
+                for name, value in row.items():
+                    interp.define_variable(name, value)
+                results = interp.run(self.program, mode)
+                state = interp.variables
+                for name in self.variables:
+                    values[name] = state.get(name)
+                if results:
+                    for result in results:
+                        if result.command == "decir" and result.operands[0] in wanted:
+                            values[DECIR_PREFIX + result.operands[0]] = result.value
+                error = None
+            except InterpreterError as e:
+                values = dict.fromkeys(columns)
+                error = f"Línea {e.line} - {e}" if e.line else str(e)
+            except Exception as e:
+                values = dict.fromkeys(columns)
+                error = f"Error inesperado: {e}"
+            for name, value in values.items():
+                columns[name].append(value)
+            errors.append(error)
+        return SweepBatch(start, columns, errors)
+
+
+_runner: Optional[_Runner] = None
+
+
+def _init_worker(*args: Any) -> None:
+    global _runner
+    _runner = _Runner(*args)
+
+
+def _run_batch(start: int, rows: List[Binding]) -> SweepBatch:
+    # Se ejecuta en un proceso del pool, con el script ya compilado.
+    return _runner.run(start, rows)
+
+
+def _batches(rows: Iterable[Binding], size: int) -> Iterator[Tuple[int, List[Binding]]]:
+    batch: List[Binding] = []
+    start = 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield start, batch
+            start += len(batch)
+            batch = []
+    if batch:
+        yield start, batch
+
+
+def sweep(source: str, rows: Iterable[Binding], variables: Optional[Sequence[str]] = None,
+          said: Sequence[str] = (), workers: Optional[int] = None,
+          batch_size: int = BATCH_SIZE, limits: Optional[Limits] = None,
+          backend: str = "reference") -> Iterator[SweepBatch]:
+    """
+    Ejecuta un script con cada fila de valores iniciales y genera los
+    resultados por lotes, en orden.
+
+    Args:
+        source: Texto del script.
+        rows: Valores iniciales de cada ejecución (nombre -> valor); se leen
+            a medida que hacen falta.
+        variables: Variables cuyo valor final se guarda; por defecto, las que
+            asigna el script (assigned_names). Una lista vacía no guarda
+            ninguna.
+        said: Variables de las que se guarda el último valor mostrado con
+            `decir`, en columnas "decir:<nombre>".
+        workers: Procesos del pool; por defecto, uno por núcleo. Con 1 se
+            ejecuta en este mismo proceso.
+        batch_size: Filas por lote.
+        limits: Límites de recursos de cada ejecución.
+        backend: Motor de ejecución (ver Interpreter.backend).
+
+    Los nombres de `variables` y `said` se pasan a minúsculas.
+
+    Raises:
+        InterpreterError si el script no compila (antes de leer ninguna fila);
+        ValueError si un nombre no es un identificador válido.
+    """
+    program = Interpreter(backend=backend).compile(source)
+    if variables is None:
+        variables = assigned_names(program)
+    variables = [variable_name(name) for name in variables]
+    said = [variable_name(name) for name in said]
+    settings = (source, list(variables), list(said), limits, backend)
+    batches = _batches(rows, batch_size)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        runner = _Runner(*settings)
+        for start, batch in batches:
+            yield runner.run(start, batch)
+        return
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=settings) as pool:
+        pending: deque = deque()
+        for start, batch in batches:
+            pending.append(pool.submit(_run_batch, start, batch))
+            if len(pending) >= workers * PREFETCH:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_csv(batches: Iterable[SweepBatch], out: TextIO) -> int:
+    """
+    Escribe los resultados como CSV con una columna "fila" al principio y
+    "error" al final. Devuelve el número de filas con error.
+    """
+    writer = csv.writer(out)
+    errors = 0
+    header = False
+    for batch in batches:
+        if not header:
+            writer.writerow(["fila", *batch.columns, ERROR_COLUMN])
+            header = True
+        for row in batch.rows():
+            writer.writerow(["" if value is None else _to_text(value) for value in row])
+        errors += sum(error is not None for error in batch.errors)
+    return errors
+
+
+def write_jsonl(batches: Iterable[SweepBatch], out: TextIO) -> int:
+    """
+    Escribe un objeto JSON por fila. Devuelve el número de filas con error.
+    """
+    errors = 0
+    for batch in batches:
+        names = ["fila", *batch.columns, ERROR_COLUMN]
+        for row in batch.rows():
+            out.write(json.dumps(dict(zip(names, map(_to_json, row))), ensure_ascii=False))
+            out.write("\n")
+        errors += sum(error is not None for error in batch.errors)
+    return errors
+
+
+def _to_text(value: Any) -> str:
+    if isinstance(value, ARRAY_TYPES):
+        return "[" + ", ".join(str(item) for item in value.tolist()) + "]"
+    return str(value)
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, ARRAY_TYPES):
+        return value.tolist()
+    return value
@@ -0,0 +1,182 @@
+"""
+Módulo de tabla de símbolos para el intérprete Gamer.
+Asigna a cada identificador una posición fija (slot) en un arreglo de valores.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional
+
+class _Undefined:
+    """Marca de una posición sin valor (variable no definida)."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "UNDEFINED"
+
+UNDEFINED: Any = _Undefined()
+
+
+class SymbolTable:
+    """
+    Tabla nombre -> slot. Los slots nunca se reutilizan ni se eliminan.
+    """
+
+    __slots__ = ("slots", "names")
+
+    def __init__(self) -> None:
+        self.slots: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, name: str) -> int:
+        """
+        Devuelve el slot de un nombre, reservándolo si es nuevo.
+        """
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = len(self.names)
+            self.slots[name] = slot
+            self.names.append(name)
+        return slot
+
+    def intern_all(self, names: List[str]) -> List[int]:
+        """
+        intern() de una lista de nombres distintos. En una tabla vacía los
+        nombres reciben los slots 0..n-1 de una sola vez.
+        """
+        if not self.names:
+            self.slots.update(zip(names, range(len(names))))
+            self.names.extend(names)
+            return list(range(len(names)))
+        return [self.intern(name) for name in names]
+
+    def lookup(self, name: str) -> Optional[int]:
+        return self.slots.get(name)
+
+
+class SharedValues:
+    """
+    Arreglo de valores copia-en-escritura sobre el de otro intérprete
+    (Interpreter.fork). Las lecturas van al arreglo base salvo en los slots
+    que se escribieron aquí, que se guardan aparte: crear la vista no copia
+    nada y la memoria crece solo con las escrituras. La base no debe
+    cambiar mientras se comparte.
+    """
+
+    __slots__ = ("_base", "_own", "_size")
+
+    def __init__(self, base: List[Any], own: Optional[Dict[int, Any]] = None,
+                 size: Optional[int] = None) -> None:
+        self._base = base
+        self._own: Dict[int, Any] = own if own is not None else {}
+        self._size = len(base) if size is None else size
+
+    def __getitem__(self, slot: int) -> Any:
+        own = self._own
+        if slot in own:
+            return own[slot]
+        try:
+            return self._base[slot]
+        except IndexError:
+            return UNDEFINED  # Slot reservado después de compartir la base.
+
+    def __setitem__(self, slot: int, value: Any) -> None:
+        self._own[slot] = value
+        if slot >= self._size:
+            self._size = slot + 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        for slot in range(self._size):
+            yield self[slot]
+
+    def extend(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self[self._size] = value
+
+    def clear(self) -> None:
+        """Deja todos los slots sin valor, sin tocar la base."""
+        self._base = []
+        self._own = {}
+
+    def fork(self) -> "SharedValues":
+        """Otra vista sobre la misma base con una copia de las escrituras."""
+        return SharedValues(self._base, dict(self._own), self._size)
+
+    @property
+    def written(self) -> int:
+        """Número de slots escritos sobre la base."""
+        return len(self._own)
+
+
+class VariablesView(MutableMapping):
+    """
+    Vista tipo diccionario sobre la tabla de símbolos y el arreglo de valores.
+    Mantiene la compatibilidad con el antiguo Interpreter.variables.
+
+    `before_write`, si se da, se llama antes de cada escritura: el
+    intérprete la usa para copiar un arreglo compartido con sus fork() y
+    cambiar `_values` por la copia.
+    """
+
+    __slots__ = ("_symbols", "_values", "_before_write")
+
+    def __init__(self, symbols: SymbolTable, values: List[Any],
+                 before_write: Optional[Callable[[], None]] = None) -> None:
+        self._symbols = symbols
+        self._values = values
+        self._before_write = before_write
+
+    def __getitem__(self, name: str) -> Any:
+        slot = self._symbols.slots.get(name)
+        if slot is None or slot >= len(self._values):
+            raise KeyError(name)
+        value = self._values[slot]
+        if value is UNDEFINED:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        if self._before_write is not None:
+            self._before_write()
+        slot = self._symbols.intern(name)
+        values = self._values
+        if slot >= len(values):
+            values.extend([UNDEFINED] * (len(self._symbols) - len(values)))
+        values[slot] = value
+
+    def __delitem__(self, name: str) -> None:
+        self[name]  # KeyError si no existe
+        if self._before_write is not None:
+            self._before_write()
+        self._values[self._symbols.slots[name]] = UNDEFINED
+
+    def __iter__(self) -> Iterator[str]:
+        names = self._symbols.names
+        for slot, value in enumerate(self._values):
+            if value is not UNDEFINED:
+                yield names[slot]
+
+    def __len__(self) -> int:
+        return sum(1 for value in self._values if value is not UNDEFINED)
+
+    def __contains__(self, name: object) -> bool:
+        slot = self._symbols.slots.get(name)  # type: ignore[arg-type]
+        return (slot is not None and slot < len(self._values)
+                and self._values[slot] is not UNDEFINED)
+
+    def clear(self) -> None:
+        if self._before_write is not None:
+            self._before_write()
+        values = self._values
+        if type(values) is SharedValues:
+            values.clear()
+        else:
+            values[:] = [UNDEFINED] * len(values)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
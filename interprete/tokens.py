@@ -0,0 +1,107 @@
+"""
+Módulo de tokens para el intérprete Gamer.
+Representación compacta de los tokens que produce el lexer.
+"""
+
+from enum import IntEnum
+from sys import intern
+from typing import Any, Iterator, List, Sequence, Tuple, Union
+
+
+class TokenKind(IntEnum):
+    """Tipo de token; el nombre coincide con el de la antigua forma de tupla."""
+    KEYWORD = 0
+    IDENTIFICADOR = 1
+    NUMERO = 2
+    DECIMAL = 3
+    CADENA = 4
+    LISTA = 5
+    IGUAL = 6
+    DESCONOCIDO = 7
+
+
+_NAMES = tuple(kind.name for kind in TokenKind)
+
+
+class Token:
+    """
+    Token del lexer.
+
+    Attributes:
+        kind: Tipo (TokenKind).
+        value: Texto del token: palabras clave e identificadores en
+            minúsculas e internados, cadenas sin comillas.
+        number: Valor ya convertido de NUMERO (int) y DECIMAL (float);
+            None en el resto.
+        column: Posición del token en la instrucción (desde 0).
+
+    Por compatibilidad, un Token se compara, desempaqueta e indexa como la
+    tupla (tipo, valor) que usaban las versiones anteriores:
+    `Token(...) == ("NUMERO", "100")` y `tipo, valor = token`.
+    """
+
+    __slots__ = ("kind", "value", "number", "column")
+
+    def __init__(self, kind: TokenKind, value: str, number: Union[int, float, None] = None,
+                 column: int = 0) -> None:
+        self.kind = kind
+        self.value = value
+        self.number = number
+        self.column = column
+
+    @classmethod
+    def from_tuple(cls, token: Tuple[str, str], column: int = 0) -> "Token":
+        """
+        Crea un Token a partir de la forma (tipo, valor).
+        """
+        name, value = token
+        kind = TokenKind[name]
+        number = None
+        if kind is TokenKind.NUMERO:
+            number = int(value)
+        elif kind is TokenKind.DECIMAL:
+            number = float(value)
+        elif kind is TokenKind.KEYWORD or kind is TokenKind.IDENTIFICADOR:
+            value = intern(value)
+        return cls(kind, value, number, column)
+
+    def as_tuple(self) -> Tuple[str, str]:
+        return (_NAMES[self.kind], self.value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.as_tuple())
+
+    def __getitem__(self, index: int) -> str:
+        return self.as_tuple()[index]
+
+    def __len__(self) -> int:
+        return 2
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Token):
+            return self.kind == other.kind and self.value == other.value
+        if isinstance(other, tuple):
+            return self.as_tuple() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.as_tuple())
+
+    def __repr__(self) -> str:
+        return f"Token({_NAMES[self.kind]}, {self.value!r}, column={self.column})"
+
+
+def as_tokens(tokens: Sequence[Union[Token, Tuple[str, str]]]) -> List[Token]:
+    """
+    Adaptador de compatibilidad: acepta listas de Token o de tuplas (tipo, valor).
+    """
+    if not tokens or type(tokens[0]) is Token:
+        return tokens  # type: ignore[return-value]
+    return [t if type(t) is Token else Token.from_tuple(t) for t in tokens]
+
+
+def as_tuples(tokens: Sequence[Token]) -> List[Tuple[str, str]]:
+    """
+    Convierte una lista de Token a la forma de tuplas (tipo, valor).
+    """
+    return [token.as_tuple() for token in tokens]
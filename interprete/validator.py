@@ -0,0 +1,55 @@
+"""
+Módulo de validación para el intérprete Gamer.
+Comprueba aridad y tipos de token con la tabla COMMAND_SIGNATURES.
+"""
+
+from typing import Sequence, Tuple, Union
+from interprete.keywords import COMMAND_SIGNATURES
+from interprete.tokens import Token, TokenKind, as_tokens
+
+class ValidationError(Exception):
+    """Excepción para instrucciones que no cumplen su firma."""
+    pass
+
+def validate(tokens: Sequence[Union[Token, Tuple[str, str]]]) -> str:
+    """
+    Valida una instrucción tokenizada en una sola pasada.
+
+    Args:
+        tokens: Lista de Token generada por el lexer (también se aceptan
+            tuplas (tipo, valor)).
+
+    Returns:
+        El comando de la instrucción.
+
+    Raises:
+        ValidationError si la instrucción no cumple la firma de su comando.
+    """
+    if not tokens:
+        raise ValidationError("No hay tokens para analizar.")
+
+    tokens = as_tokens(tokens)
+    cmd = tokens[0].value
+    if (cmd == "crear" and len(tokens) > 3 and tokens[3].kind is TokenKind.KEYWORD
+            and tokens[3].value == "llamar"):
+        # crear <nombre> = llamar <misión> <argumentos...>
+        if tokens[1].kind is not TokenKind.IDENTIFICADOR or tokens[2].kind is not TokenKind.IGUAL:
+            raise ValidationError(f"Sintaxis inválida para '{cmd}'.")
+        validate(tokens[3:])
+        return cmd
+    signature = COMMAND_SIGNATURES.get(cmd)
+    if signature is None:
+        raise ValidationError(f"Instrucción no reconocida: {cmd}")
+
+    slots, variadic = signature
+    arity = len(slots)
+    count = len(tokens) - 1
+    if count < arity or (count > arity and not variadic):
+        raise ValidationError(f"Sintaxis inválida para '{cmd}'.")
+
+    extra = slots[-1] if variadic is True else variadic
+    for i in range(count):
+        kinds = slots[i] if i < arity else extra
+        if tokens[i + 1].kind not in kinds:
+            raise ValidationError(f"Sintaxis inválida para '{cmd}'.")
+    return cmd
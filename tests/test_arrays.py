@@ -0,0 +1,94 @@
+import pytest
+from interprete.interpreter import Interpreter, InterpreterError
+from interprete.lexer import Lexer
+
+np = pytest.importorskip("numpy")
+
+def test_tokenize_lista():
+    lexer = Lexer()
+    tokens = lexer.tokenize("crear vidas = [10, 20, 30]")
+    assert tokens[3] == ("LISTA", "[10, 20, 30]")
+
+def test_crear_arreglo():
+    interp = Interpreter()
+    result = interp.eval_instruction("crear vidas = [10, 20, 30]")
+    assert result == "Variable 'vidas' definida con valor [10 20 30]"
+    assert interp.get_variable("vidas").tolist() == [10, 20, 30]
+
+def test_crear_arreglo_invalido():
+    interp = Interpreter()
+    with pytest.raises(InterpreterError):
+        interp.eval_instruction("crear vidas = [10, hola]")
+
+def test_curar_con_difusion():
+    interp = Interpreter()
+    interp.eval_instruction("crear vidas = [10, 20, 30]")
+    assert interp.eval_instruction("curar vidas 5") == "Resultado: [15 25 35]"
+    interp.eval_instruction("crear pociones = [1 2 3]")
+    assert interp.eval_instruction("golpear vidas pociones") == "Resultado: [ 9 18 27]"
+
+def test_formas_incompatibles():
+    interp = Interpreter()
+    interp.eval_instruction("crear a = [1, 2, 3]")
+    interp.eval_instruction("crear b = [1, 2]")
+    with pytest.raises(InterpreterError, match="formas compatibles"):
+        interp.eval_instruction("multiplicar a b")
+
+def test_dividir_arreglo_por_cero():
+    interp = Interpreter()
+    interp.eval_instruction("crear a = [1, 2]")
+    interp.eval_instruction("crear b = [1, 0]")
+    with pytest.raises(InterpreterError, match="dividir por cero"):
+        interp.eval_instruction("dividir a b")
+
+def test_poder_exponente_negativo_como_escalares():
+    interp = Interpreter()
+    interp.eval_instruction("crear a = [2, 4]")
+    assert interp.eval_instruction("poder a -1") == "Resultado: [0.5  0.25]"
+
+def test_revivir_y_xp_vectorizados():
+    interp = Interpreter()
+    interp.eval_instruction("crear a = [4, 9]")
+    assert interp.eval_instruction("revivir a") == "Resultado: [2. 3.]"
+    interp.eval_instruction("crear b = [-4, 9]")
+    assert interp.eval_instruction("xp b") == "Resultado: [4 9]"
+    with pytest.raises(InterpreterError, match="negativo"):
+        interp.eval_instruction("revivir b")
+
+def test_jefe_esbirro_reducen_arreglos():
+    interp = Interpreter()
+    interp.eval_instruction("crear a = [4, 90, -3]")
+    interp.eval_instruction("crear b = 50")
+    assert interp.eval_instruction("jefe a b") == "Resultado: 90"
+    assert interp.eval_instruction("esbirro a b") == "Resultado: -3"
+
+def test_arreglo_con_cadena_no_es_numerico():
+    interp = Interpreter()
+    interp.eval_instruction("crear a = [1, 2]")
+    interp.eval_instruction('crear n = "Juan"')
+    with pytest.raises(InterpreterError, match="Solo se pueden operar números."):
+        interp.eval_instruction("curar a n")
+
+def test_desbordamiento_de_enteros():
+    interp = Interpreter()
+    interp.eval_instruction("crear a = [10, 2]")
+    assert interp.eval_instruction("poder a 18") == "Resultado: [1000000000000000000              262144]"
+    for line in ("poder a 30", "poder a 99999999", "curar a 99999999999999999999",
+                 "multiplicar a 1000000000000000000"):
+        with pytest.raises(InterpreterError, match="no cabe en un arreglo de enteros"):
+            interp.eval_instruction(line)
+    interp.eval_instruction("crear b = [4611686018427387903, -4611686018427387904]")
+    assert interp.get_variable("b").tolist() == [2 ** 62 - 1, -2 ** 62]
+    assert interp.eval_instruction("curar b b") == (
+        "Resultado: [ 9223372036854775806 -9223372036854775808]")
+    with pytest.raises(InterpreterError, match="no cabe"):
+        interp.eval_instruction("multiplicar b 3")
+    interp.eval_instruction("crear c = [-4611686018427387904, 4611686018427387905]")
+    with pytest.raises(InterpreterError, match="no cabe"):
+        interp.eval_instruction("golpear b c")
+
+def test_desbordamiento_en_programa_compilado():
+    interp = Interpreter()
+    with pytest.raises(InterpreterError) as exc:
+        interp.run(interp.compile("crear a = [10, 2]\npoder a 30\n"))
+    assert exc.value.line == 2
@@ -0,0 +1,22 @@
+from benchmarks.generator import generate_program
+from benchmarks.bench_stages import run_benchmarks
+from interprete.interpreter import Interpreter
+
+def test_generador_reproducible():
+    assert generate_program(200, seed=7) == generate_program(200, seed=7)
+    assert generate_program(200, seed=7) != generate_program(200, seed=8)
+
+def test_generador_programa_valido():
+    program = generate_program(500, seed=3, identifiers=10, max_list=20)
+    interp = Interpreter()
+    assert len(interp.run(interp.compile("\n".join(program)))) == 500
+
+def test_generador_mezcla_configurable():
+    program = generate_program(100, seed=1, mix={"crear": 1, "jefe": 1}, max_list=30)
+    assert {line.split()[0] for line in program} == {"crear", "jefe"}
+
+def test_run_benchmarks_reporta_etapas():
+    report = run_benchmarks(generate_program(50, seed=2), repeat=1)
+    assert set(report) == {"lexer", "parser", "semantic", "eval_instruction", "compile", "run"}
+    assert report["lexer"]["items"] == 50
+    assert report["run"]["peak_memory_bytes"] >= 0
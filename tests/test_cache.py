@@ -0,0 +1,145 @@
+import io
+import os
+import pytest
+from interprete import cache
+from interprete.cli import main, run_program
+from interprete.interpreter import Interpreter, InterpreterError
+from interprete.lexer import Lexer
+from interprete.semantic import SemanticAnalyzer
+
+SCRIPT = (
+    "crear a = 10\n"
+    "crear grande = 123456789012345678901234567890\n"
+    "crear negativo = -7\n"
+    "crear f = 2.5\n"
+    'crear saludo = "hola, ñandú"\n'
+    "crear copia = a\n"
+    "\n"
+    "curar a f\n"
+    "poder grande 2\n"
+    "jefe a negativo copia\n"
+    "decir saludo\n"
+)
+
+def _write(tmp_path, text, name="script.gamer"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+def test_cache_misma_salida_y_archivo(tmp_path):
+    path = _write(tmp_path, SCRIPT)
+    expected = Interpreter().run(Interpreter().compile(SCRIPT))
+    cold = Interpreter()
+    assert cold.run(cold.compile_file(path)) == expected
+    assert os.path.exists(cache.cache_path(path))
+    warm = Interpreter()
+    assert warm.run(warm.compile_file(path)) == expected
+    assert warm.variables == cold.variables
+
+def test_carga_caliente_sin_front_end(tmp_path, monkeypatch):
+    path = _write(tmp_path, SCRIPT)
+    Interpreter().compile_file(path)
+    def fail(*args, **kwargs):
+        raise AssertionError("no debe analizar el texto")
+    monkeypatch.setattr(Lexer, "tokenize", fail)
+    monkeypatch.setattr(SemanticAnalyzer, "analyze_program", fail)
+    interp = Interpreter()
+    program = interp.compile_file(path, optimize=False)
+    assert [i.line for i in program] == [1, 2, 3, 4, 5, 6, 8, 9, 10, 11]
+    assert interp.run(program)[-1] == "saludo = hola, ñandú"
+
+def test_conserva_manejadores_rapidos(tmp_path):
+    path = _write(tmp_path, "crear a = 1\ncrear b = 2\ncurar a b\n")
+    cold = Interpreter().compile_file(path, optimize=False)
+    warm = Interpreter().compile_file(path, optimize=False)
+    assert [i.handler for i in warm] == [i.handler for i in cold]
+
+def test_programa_cargado_en_interprete_con_variables(tmp_path):
+    path = _write(tmp_path, "crear a = 1\ndecir a\n")
+    Interpreter().compile_file(path)
+    interp = Interpreter()
+    interp.define_variable("otra", 5)
+    assert interp.run(interp.compile_file(path)) == ["Variable 'a' definida con valor 1", "a = 1"]
+    assert interp.variables == {"otra": 5, "a": 1}
+
+def test_invalida_al_cambiar_el_script(tmp_path):
+    path = _write(tmp_path, "crear a = 1\n")
+    Interpreter().compile_file(path)
+    _write(tmp_path, "crear a = 2\n")
+    interp = Interpreter()
+    assert interp.run(interp.compile_file(path)) == ["Variable 'a' definida con valor 2"]
+
+def test_invalida_al_cambiar_la_gramatica(tmp_path, monkeypatch):
+    path = _write(tmp_path, "crear a = 1\n")
+    raw = open(path, "rb").read()
+    Interpreter().compile_file(path)
+    key = cache.source_key(raw)
+    assert cache.load(cache.cache_path(path), key) is not None
+    monkeypatch.setattr(cache, "_grammar_digest", b"\x00" * 32)
+    assert cache.source_key(raw) != key
+    assert cache.load(cache.cache_path(path), cache.source_key(raw)) is None
+
+def test_archivo_danado_se_recompila(tmp_path):
+    path = _write(tmp_path, "crear a = 1\n")
+    Interpreter().compile_file(path)
+    location = cache.cache_path(path)
+    data = open(location, "rb").read()
+    with open(location, "wb") as f:
+        f.write(data[:-3])
+    assert cache.load(location, cache.source_key(open(path, "rb").read())) is None
+    interp = Interpreter()
+    assert interp.run(interp.compile_file(path)) == ["Variable 'a' definida con valor 1"]
+
+def test_directorio_de_cache(tmp_path):
+    path = _write(tmp_path, "crear a = 1\n")
+    Interpreter().compile_file(path, cache_dir=str(tmp_path / "cache"))
+    assert os.listdir(tmp_path / "cache") == ["script.gamer" + cache.SUFFIX]
+    assert not (tmp_path / cache.CACHE_DIR).exists()
+
+def test_errores_no_se_guardan(tmp_path):
+    path = _write(tmp_path, "crear a = 1\ncurar a\n")
+    with pytest.raises(InterpreterError) as exc:
+        Interpreter().compile_file(path)
+    assert exc.value.line == 2
+    assert not os.path.exists(cache.cache_path(path))
+
+def test_arreglos_en_cache(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = _write(tmp_path, "crear v = [1, 2, 3]\ncrear w = [0.5 1.5]\ndecir v\n")
+    Interpreter().compile_file(path)
+    interp = Interpreter()
+    interp.run(interp.compile_file(path))
+    assert np.array_equal(interp.variables["v"], [1, 2, 3])
+    assert interp.variables["w"].dtype == np.float64
+
+def test_instruccion_con_muchos_operandos(tmp_path):
+    names = [f"v{i}" for i in range(300)]
+    source = "".join(f"crear {name} = {i}\n" for i, name in enumerate(names))
+    path = _write(tmp_path, source + "jefe " + " ".join(names) + "\n")
+    expected = Interpreter().run(Interpreter().compile(source + "jefe " + " ".join(names)))
+    for _ in range(2):
+        interp = Interpreter()
+        assert interp.run(interp.compile_file(path)) == expected
+    assert expected[-1] == "Resultado: 299"
+
+def test_run_program_continua_tras_error():
+    interp = Interpreter()
+    program = interp.compile("crear a = 1\ncrear b = 0\ndividir a b\ndecir a\n", optimize=False)
+    out, err = io.StringIO(), io.StringIO()
+    assert run_program(program, interp, out, err, name="x") == 1
+    assert err.getvalue() == "x: Línea 3 - Error: No se puede dividir por cero.\n"
+    assert out.getvalue().endswith("a = 1\n")
+
+def test_main_run_con_cache(tmp_path, capsys):
+    path = _write(tmp_path, "crear a = 2\npoder a 3\n")
+    for _ in range(2):
+        assert main(["run", "--cache", path]) == 0
+        assert capsys.readouterr().out == "Variable 'a' definida con valor 2\nResultado: 8\n"
+    assert os.path.exists(cache.cache_path(path))
+
+def test_main_run_con_cache_informa_errores_por_linea(tmp_path, capsys):
+    path = _write(tmp_path, "decir x\ncrear x = 1\ndecir x\n")
+    assert main(["run", "--cache", path]) == 1
+    captured = capsys.readouterr()
+    assert "Línea 1 - Error" in captured.err
+    assert captured.out.endswith("x = 1\n")
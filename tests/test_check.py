@@ -0,0 +1,132 @@
+import pytest
+from interprete.check import check_file, check_line, check_source, split_file
+from interprete.cli import main
+from interprete.interpreter import Interpreter, InterpreterError
+
+SCRIPT = (
+    "crear a = 1\n"
+    "curar a\n"
+    "\n"
+    "bailar a\n"
+    "crear l = [1, x]\n"
+    "decir a\n"
+    "jefe\n"
+)
+
+EXPECTED = [
+    (2, "Error de sintaxis: Sintaxis inválida para 'curar'."),
+    (4, "Error de sintaxis: Instrucción no reconocida: bailar"),
+    (5, "Error de sintaxis: Elemento de lista no válido: x"),
+    (7, "Error de sintaxis: Sintaxis inválida para 'jefe'."),
+]
+
+def test_check_line_mismo_mensaje_que_compile():
+    with pytest.raises(InterpreterError) as exc:
+        Interpreter().compile("curar a")
+    assert check_line("curar a") == str(exc.value)
+    assert check_line("crear a = 1") is None
+
+def test_check_source():
+    assert check_source(SCRIPT, workers=1) == EXPECTED
+
+def test_check_source_en_bloques():
+    assert check_source(SCRIPT, workers=1, chunk_lines=2) == EXPECTED
+    assert check_source(SCRIPT, workers=2, chunk_lines=3) == EXPECTED
+
+def test_split_file_corta_en_saltos(tmp_path):
+    path = tmp_path / "s.gamer"
+    path.write_bytes(SCRIPT.encode("utf-8"))
+    ranges = split_file(str(path), chunk_size=5)
+    data = path.read_bytes()
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start and data[end - 1:end] == b"\n"
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_check_file_ordenado(tmp_path, chunk_size):
+    path = tmp_path / "s.gamer"
+    path.write_bytes((SCRIPT * 50).replace("\n", "\r\n").encode("utf-8"))
+    expected = [(line + 7 * i, msg) for i in range(50) for line, msg in EXPECTED]
+    assert list(check_file(str(path), workers=1, chunk_size=chunk_size)) == expected
+
+def test_check_file_con_procesos(tmp_path):
+    path = tmp_path / "s.gamer"
+    path.write_text(SCRIPT * 20, encoding="utf-8")
+    expected = list(check_file(str(path), workers=1))
+    assert list(check_file(str(path), workers=2, chunk_size=64)) == expected
+
+def test_main_check(tmp_path, capsys):
+    good = tmp_path / "bien.gamer"
+    bad = tmp_path / "mal.gamer"
+    good.write_text("crear a = 1\n", encoding="utf-8")
+    bad.write_text(SCRIPT, encoding="utf-8")
+    assert main(["check", "-j", "1", str(good)]) == 0
+    assert capsys.readouterr().out == ""
+    assert main(["check", "-j", "1", str(bad)]) == 1
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == f"{bad}: Línea 2 - Error: Error de sintaxis: Sintaxis inválida para 'curar'."
+    assert len(out) == 4
+
+BLOCKS = (
+    "repetir 2\n"
+    "repetir 3\n"
+    "crear a = 1\n"
+    "fin\n"
+    "fin\n"
+    "fin\n"
+    "mision f a\n"
+    "repetir 3\n"
+)
+
+BLOCK_ERRORS = [
+    (6, "Error de sintaxis: 'fin' sin bloque abierto."),
+    (7, "Error de sintaxis: Falta 'fin' para el bloque 'mision'."),
+    (8, "Error de sintaxis: Falta 'fin' para el bloque 'repetir'."),
+]
+
+def test_bloques_mismo_mensaje_que_compile():
+    for source in ("repetir 3\ncrear a = 1\n", "crear a = 1\nfin\n"):
+        with pytest.raises(InterpreterError) as exc:
+            Interpreter().compile(source)
+        assert check_source(source, workers=1) == [(exc.value.line, str(exc.value))]
+
+@pytest.mark.parametrize("chunk_lines", [1, 2, 3, 100])
+def test_bloques_entre_trozos(chunk_lines):
+    assert check_source(BLOCKS, workers=1, chunk_lines=chunk_lines) == BLOCK_ERRORS
+
+def test_bloques_entre_trozos_del_archivo(tmp_path):
+    path = tmp_path / "s.gamer"
+    path.write_text(BLOCKS, encoding="utf-8")
+    for chunk_size in (1, 12, 1 << 20):
+        assert list(check_file(str(path), workers=1, chunk_size=chunk_size)) == BLOCK_ERRORS
+    assert list(check_file(str(path), workers=2, chunk_size=12)) == BLOCK_ERRORS
+
+MISSIONS = (
+    "regresar a\n"
+    "mision f a\n"
+    "repetir 2\n"
+    "regresar a\n"
+    "fin\n"
+    "fin\n"
+    "repetir 2\n"
+    "mision g b\n"
+    "regresar b\n"
+    "fin\n"
+    "fin\n"
+)
+
+MISSION_ERRORS = [
+    (1, "Error de sintaxis: 'regresar' solo se puede usar dentro de una misión."),
+    (8, "Error de sintaxis: Una misión no se puede definir dentro de otro bloque."),
+]
+
+def test_misiones_mismo_mensaje_que_compile():
+    for source in ("regresar a\n", "repetir 2\nmision g b\nfin\nfin\n",
+                   "mision g a a\nregresar a\nfin\n"):
+        with pytest.raises(InterpreterError) as exc:
+            Interpreter().compile(source)
+        assert check_source(source, workers=1) == [(exc.value.line, str(exc.value))]
+
+@pytest.mark.parametrize("chunk_lines", [1, 3, 7, 100])
+def test_misiones_entre_trozos(chunk_lines):
+    assert check_source(MISSIONS, workers=1, chunk_lines=chunk_lines) == MISSION_ERRORS
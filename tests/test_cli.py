@@ -0,0 +1,61 @@
+import io
+from interprete.cli import main, run_program, run_stream
+from interprete.interpreter import Interpreter
+
+def test_run_stream_escribe_resultados():
+    out, err = io.StringIO(), io.StringIO()
+    lines = iter(["crear a = 2\n", "\n", "poder a 3\n"])
+    errors = run_stream(lines, Interpreter(), out, err)
+    assert errors == 0
+    assert out.getvalue() == "Variable 'a' definida con valor 2\nResultado: 8\n"
+    assert err.getvalue() == ""
+
+def test_run_stream_continua_tras_error():
+    out, err = io.StringIO(), io.StringIO()
+    errors = run_stream(["decir x", "crear x = 1", "decir x"], Interpreter(), out, err)
+    assert errors == 1
+    assert "Línea 1 - Error" in err.getvalue()
+    assert out.getvalue().endswith("x = 1\n")
+
+def test_run_stream_fail_fast():
+    out, err = io.StringIO(), io.StringIO()
+    errors = run_stream(["decir x", "crear x = 1"], Interpreter(), out, err, fail_fast=True)
+    assert errors == 1
+    assert out.getvalue() == ""
+
+def test_errores_de_python_continuan():
+    lines = ["poder 0 -1", "repetir 1", "poder 0 -1", "fin", "crear a = 1"]
+    out, err = io.StringIO(), io.StringIO()
+    assert run_stream(lines, Interpreter(), out, err, name="s") == 2
+    assert err.getvalue().splitlines()[0].startswith("s: Línea 1 - Error inesperado: ")
+    assert err.getvalue().splitlines()[1].startswith("s: Línea 2 - Error inesperado: ")
+    assert out.getvalue() == "Variable 'a' definida con valor 1\n"
+    out, err = io.StringIO(), io.StringIO()
+    assert run_stream(lines, Interpreter(), out, err, fail_fast=True) == 1
+    assert out.getvalue() == ""
+    interp = Interpreter()
+    program = interp.compile("\n".join(lines), optimize=False)
+    out, err = io.StringIO(), io.StringIO()
+    assert run_program(program, interp, out, err, name="s") == 2
+    assert "Línea 2 - Error inesperado" in err.getvalue()
+    assert out.getvalue() == "Variable 'a' definida con valor 1\n"
+
+def test_main_run_archivos_comparten_interprete(tmp_path, capsys):
+    first = tmp_path / "uno.gamer"
+    second = tmp_path / "dos.gamer"
+    first.write_text("crear vida = 100\n", encoding="utf-8")
+    second.write_text("decir vida\n", encoding="utf-8")
+    assert main(["run", str(first), str(second)]) == 0
+    assert capsys.readouterr().out.splitlines()[-1] == "vida = 100"
+
+def test_main_run_codigo_de_error(tmp_path, capsys):
+    script = tmp_path / "malo.gamer"
+    script.write_text("curar a\n", encoding="utf-8")
+    assert main(["run", str(script)]) == 1
+    assert "Error de sintaxis" in capsys.readouterr().err
+
+def test_run_stream_quiet():
+    out, err = io.StringIO(), io.StringIO()
+    errors = run_stream(["crear a = 1", "decir b"], Interpreter(), out, err, quiet=True)
+    assert errors == 1
+    assert out.getvalue() == ""
@@ -0,0 +1,97 @@
+import pytest
+from benchmarks.generator import generate_program
+from interprete import codegen
+from interprete.interpreter import Interpreter, InterpreterError
+from interprete.limits import Limits
+
+def _outcome(backend, source, mode="text", optimize=True, setup=None):
+    # Resultados (o error con su línea) y estado final con un motor.
+    interp = Interpreter(backend=backend)
+    if setup:
+        interp.variables = setup
+    try:
+        program = interp.compile(source, optimize=optimize)
+        results = interp.run(program, mode)
+        if mode == "result":
+            results = [(r.command, r.operands, r.text()) for r in results]
+    except InterpreterError as e:
+        results = ("error", type(e).__name__, str(e), e.line)
+    state = {name: str(value) for name, value in interp.variables.items()}
+    return results, state
+
+def _same(source, **kwargs):
+    expected = _outcome("reference", source, **kwargs)
+    assert _outcome("python", source, **kwargs) == expected
+    return expected
+
+def test_motor_desconocido():
+    with pytest.raises(ValueError):
+        Interpreter(backend="jit")
+
+@pytest.mark.parametrize("seed", range(6))
+def test_programas_generados_igual_que_referencia(seed):
+    source = "\n".join(generate_program(400, seed=seed, max_list=5))
+    for optimize in (True, False):
+        for mode in ("text", "result", "quiet"):
+            _same(source, mode=mode, optimize=optimize)
+
+@pytest.mark.parametrize("source", [
+    "crear a = 1\ncrear b = 0\ndividir a b\n",
+    "crear a = -4\nrevivir a\n",
+    "crear a = 1\ncurar a b\n",
+    "decir nadie\n",
+    'crear a = "hola"\nxp a\n',
+    "crear a = [1, 2]\ncrear b = [1, 2, 3]\ncurar a b\n",
+    "crear a = []\njefe a a\n",
+    "crear a = 2\nrepetir 3\ncurar a 1\nrepetir 2\ndividir a 0\nfin\nfin\n",
+])
+def test_errores_con_mismo_mensaje_y_linea(source):
+    results, _ = _same(source)
+    assert results[0] == "error"
+
+def test_cuenta_no_valida_en_ejecucion():
+    results, _ = _same("repetir n\nfin\n", setup={"n": 2.5})
+    assert results[2] == "'repetir' necesita un número entero no negativo."
+
+def test_errores_en_modo_silencioso():
+    _same("crear a = 1\ncrear b = 0\nrepetir 2\ndividir a b\nfin\n", mode="quiet")
+
+def test_variables_externas_sin_tipo_probado():
+    source = "curar a b\nmultiplicar a b\njefe a b\nesbirro a b\ncrear c = a\ndecir c\n"
+    _same(source, setup={"a": 3, "b": 4.5})
+    _same(source, setup={"a": "texto", "b": 1})
+    _same(source, mode="result", setup={"a": True, "b": 2})
+
+def test_identificador_indefinido_como_texto():
+    _same("crear nombre = Juan\ndecir nombre\n")
+
+def test_traduccion_se_reutiliza():
+    interp = Interpreter(backend="python")
+    program = interp.compile("crear a = 2\npoder a 8\n")
+    assert interp.run(program) == interp.run(program)
+    assert len(interp._generated[program]) == 1
+
+def test_codigo_generado_sin_comprobaciones_con_tipos_probados():
+    interp = Interpreter(backend="python")
+    program = interp.compile("crear a = 2\ncrear b = 3\nmultiplicar a b\n", optimize=False)
+    interp.run(program)
+    source = interp._generated[program][True].source
+    assert "x0 * x1" in source
+    assert "_S" not in source.split("\n", 1)[1]
+
+def test_varias_funciones_generadas(monkeypatch):
+    monkeypatch.setattr(codegen, "CHUNK_SIZE", 3)
+    source = "\n".join(generate_program(50, seed=9)) + "\ndividir a 0\n"
+    results, _ = _same("crear a = 1\n" + source)
+    assert results[-1] == 52
+
+def test_limites_y_perfilado_usan_el_motor_de_referencia():
+    interp = Interpreter(limits=Limits(max_instructions=1), backend="python")
+    with pytest.raises(InterpreterError, match="límite de 1 instrucciones"):
+        interp.run(interp.compile("crear a = 1\ndecir a\n"))
+    interp = Interpreter(backend="python")
+    interp.enable_profiling()
+    program = interp.compile("crear a = 1\ndecir a\n")
+    interp.run(program)
+    assert interp.stats()["lines"] == {1: 1, 2: 1}
+    assert program not in interp._generated
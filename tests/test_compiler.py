@@ -0,0 +1,85 @@
+import pytest
+from interprete.interpreter import Interpreter, InterpreterError
+from interprete.compiler import Program
+
+SCRIPT = (
+    "crear a = 10\n"
+    "crear b = 5\n"
+    "\n"
+    "curar a b\n"
+    "multiplicar a 3\n"
+    "decir a\n"
+)
+
+def test_compile_devuelve_programa():
+    interp = Interpreter()
+    program = interp.compile(SCRIPT)
+    assert isinstance(program, Program)
+    assert len(program) == 5
+    assert [i.line for i in program] == [1, 2, 4, 5, 6]
+
+def test_run_programa():
+    interp = Interpreter()
+    program = interp.compile(SCRIPT)
+    assert interp.run(program) == [
+        "Variable 'a' definida con valor 10",
+        "Variable 'b' definida con valor 5",
+        "Resultado: 15",
+        "Resultado: 30",
+        "a = 10",
+    ]
+
+def test_run_programa_varias_veces():
+    interp = Interpreter()
+    program = interp.compile(SCRIPT)
+    first = interp.run(program)
+    assert interp.run(program) == first
+
+def test_run_mismo_programa_en_otro_interprete():
+    program = Interpreter().compile(SCRIPT)
+    other = Interpreter()
+    other.run(program)
+    assert other.variables == {"a": 10, "b": 5}
+
+def test_compile_error_con_linea():
+    interp = Interpreter()
+    with pytest.raises(InterpreterError) as exc:
+        interp.compile("crear a = 1\ncurar a\n")
+    assert exc.value.line == 2
+    assert "Error de sintaxis" in str(exc.value)
+
+def test_run_error_con_linea():
+    interp = Interpreter()
+    program = interp.compile("crear a = 1\ncrear b = 0\ndividir a b\n")
+    with pytest.raises(InterpreterError) as exc:
+        interp.run(program)
+    assert exc.value.line == 3
+
+def test_eval_instruction_reutiliza_compilacion():
+    interp = Interpreter()
+    interp.eval_instruction("crear a = 1")
+    interp.eval_instruction("crear a = 1")
+    assert len(interp._line_cache) == 1
+
+def test_compile_informa_error_de_tipo():
+    interp = Interpreter()
+    with pytest.raises(InterpreterError) as exc:
+        interp.compile('crear n = "Juan"\ncrear a = 1\ncurar a n\n')
+    assert exc.value.line == 3
+    assert "Solo se pueden operar números." in str(exc.value)
+    assert interp.variables == {}
+
+def test_camino_rapido_sin_comprobaciones(monkeypatch):
+    interp = Interpreter()
+    program = interp.compile("crear a = 4\ncrear b = 2\ndividir a b\njefe a b\nrevivir a\n",
+                             optimize=False)
+    def fail(*args):
+        raise AssertionError("no debe comprobar tipos")
+    monkeypatch.setattr(interp, "_check_numeric", fail)
+    assert interp.run(program)[2:] == ["Resultado: 2.0", "Resultado: 4", "Resultado: 2.0"]
+
+def test_camino_rapido_conserva_errores():
+    interp = Interpreter()
+    program = interp.compile("crear a = 4\ncrear b = 0\ndividir a b\n")
+    with pytest.raises(InterpreterError, match="No se puede dividir por cero."):
+        interp.run(program)
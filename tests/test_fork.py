@@ -0,0 +1,132 @@
+import pytest
+from interprete.interpreter import Interpreter, InterpreterError
+from interprete.limits import Limits
+from interprete.symbols import SharedValues
+
+def _base(count=1000):
+    interp = Interpreter()
+    interp.run(interp.compile("\n".join(f"crear v{i} = {i}" for i in range(count))), "quiet")
+    return interp
+
+def test_hija_parte_del_estado_del_padre():
+    parent = _base(10)
+    child = parent.fork()
+    assert dict(child.variables) == dict(parent.variables)
+    assert child.eval_instruction("curar v3 v4") == "Resultado: 7"
+
+def test_hermanas_aisladas():
+    parent = _base(10)
+    a, b = parent.fork(), parent.fork()
+    a.eval_instruction("crear v1 = 100")
+    b.eval_instruction("crear v1 = 200")
+    b.eval_instruction("crear nueva = 1")
+    assert a.get_variable("v1") == 100
+    assert b.get_variable("v1") == 200
+    assert parent.get_variable("v1") == 1
+    assert "nueva" not in a.variables and "nueva" not in parent.variables
+    assert "nueva" in b.variables
+
+def test_padre_no_afecta_a_las_hijas():
+    parent = _base(10)
+    child = parent.fork()
+    program = parent.compile("crear v2 = -1\ncrear w = 5\n")
+    parent.run(program)
+    parent.define_variable("v3", "texto")
+    del parent.variables["v4"]
+    assert child.get_variable("v2") == 2
+    assert child.get_variable("v3") == 3
+    assert "w" not in child.variables
+    # El programa del padre se ejecuta en la hija sin reenlazar.
+    child.run(program)
+    assert child.get_variable("w") == 5
+    assert "v4" not in parent.variables
+    assert child.get_variable("v4") == 4
+
+def test_solo_se_materializan_las_escrituras():
+    parent = _base(5000)
+    child = parent.fork()
+    assert isinstance(child._values, SharedValues)
+    assert child._values._base is parent._values
+    child.run(child.compile("crear v7 = 0\ncrear v8 = v9\ncurar v1 v2\n"), "quiet")
+    assert child._values.written == 2
+    assert len(child.variables) == 5000
+
+def test_fork_de_una_hija():
+    parent = _base(10)
+    child = parent.fork()
+    child.eval_instruction("crear v0 = 50")
+    grandchild = child.fork()
+    grandchild.eval_instruction("crear v1 = 60")
+    child.eval_instruction("crear v0 = 70")
+    assert grandchild.get_variable("v0") == 50
+    assert child.get_variable("v1") == 1
+    assert grandchild._values._base is parent._values
+
+def test_reset_y_asignacion_de_variables_en_la_hija():
+    parent = _base(10)
+    child = parent.fork()
+    child.reset()
+    assert len(child.variables) == 0
+    assert len(parent.variables) == 10
+    child.variables = {"v1": 9}
+    assert dict(child.variables) == {"v1": 9}
+    assert parent.get_variable("v1") == 1
+
+def test_hija_hereda_limites_motor_y_misiones():
+    parent = Interpreter(limits=Limits(max_instructions=2), backend="python")
+    parent.run(parent.compile("mision id v\nregresar v\nfin\n"))
+    child = parent.fork()
+    assert child.limits is parent.limits
+    assert child.backend == "python"
+    with pytest.raises(InterpreterError, match="límite de 2 instrucciones"):
+        child.run(child.compile("llamar id 1\nllamar id 2\n"))
+    child.limits = None
+    child.run(child.compile("crear x = llamar id 4\n"))
+    assert child.get_variable("x") == 4
+    assert "x" not in parent.variables
+
+def test_motor_python_en_la_hija():
+    parent = _base(10)
+    child = parent.fork()
+    child.backend = "python"
+    assert child.run(child.compile("crear v5 = 1\ncurar v5 v6\n")) == [
+        "Variable 'v5' definida con valor 1", "Resultado: 7"]
+    assert parent.get_variable("v5") == 5
+
+def test_padre_ejecuta_una_linea_compilada_por_la_hija():
+    parent = Interpreter()
+    parent.eval_instruction("crear a = 1")
+    child = parent.fork()
+    child.eval_instruction("crear zz = 5")
+    with pytest.raises(InterpreterError):
+        parent.get_variable("zz")
+    assert parent.eval_instruction("crear zz = 6") == "Variable 'zz' definida con valor 6"
+    assert parent.get_variable("zz") == 6
+    assert child.get_variable("zz") == 5
+
+def test_lecturas_del_padre_no_copian():
+    parent = _base(100)
+    child = parent.fork()
+    base = parent._values
+    view = parent.variables
+    assert view["v5"] == 5 and len(view) == 100
+    assert parent.eval_instruction("decir v5") == "v5 = 5"
+    parent.run(parent.compile("curar v1 v2\ndecir v3\n"))
+    assert parent._values is base and parent._shared
+    # La primera escritura copia; la vista guardada sigue siendo válida.
+    view["v5"] = 50
+    assert parent._values is not base and view["v5"] == 50
+    assert child.get_variable("v5") == 5
+
+def test_escrituras_del_padre_copian():
+    for write, value in (("crear v1 = 9", 9), ("crear v1 = llamar copia v2", 2)):
+        parent = _base(10)
+        parent.run(parent.compile("mision copia a\ncrear r = a\nregresar r\nfin\n"))
+        child = parent.fork()
+        parent.eval_instruction(write)
+        assert child.get_variable("v1") == 1
+        assert parent.get_variable("v1") == value
+    parent = _base(10)
+    child = parent.fork()
+    parent.reset()
+    assert child.get_variable("v1") == 1 and "v1" not in parent.variables
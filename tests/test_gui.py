@@ -0,0 +1,54 @@
+import threading
+import pytest
+
+pytest.importorskip("tkinter")
+
+from interprete.gui import iter_console_lines, write_console_lines
+from interprete.interpreter import Interpreter
+
+def test_iter_console_lines_ejecuta():
+    lines = list(iter_console_lines("crear a = 2\n\ncurar a a\n", Interpreter(), execute=True))
+    assert ("Línea 3 - Resultado: 4", None) in lines
+    assert lines[0] == ("Línea 1 - Tokens: [('KEYWORD', 'crear'), ('IDENTIFICADOR', 'a'), "
+                        "('IGUAL', '='), ('NUMERO', '2')]", None)
+
+def test_iter_console_lines_solo_compila():
+    interp = Interpreter()
+    lines = list(iter_console_lines("crear a = 2\n", interp, execute=False))
+    assert lines[-1] == ("Línea 1 - Sintaxis: válida", None)
+    assert interp.variables == {}
+
+def test_iter_console_lines_errores():
+    lines = list(iter_console_lines("curar a\ndecir x\n", Interpreter(), execute=True))
+    errors = [text for text, tag in lines if tag == "error"]
+    assert errors[0].startswith("Línea 1 - Error de sintaxis")
+    assert errors[1].startswith("Línea 2 - Error:")
+
+def test_iter_console_lines_detener():
+    stop = threading.Event()
+    stop.set()
+    lines = list(iter_console_lines("crear a = 1\n", Interpreter(), True, stop))
+    assert lines == [("Ejecución detenida.", "error")]
+
+def test_iter_console_lines_error_inesperado_en_bloque():
+    lines = list(iter_console_lines("repetir 1\npoder 0 -1\nfin\ncrear a = 1\n",
+                                    Interpreter(), execute=True))
+    errors = [text for text, tag in lines if tag == "error"]
+    assert len(errors) == 1 and errors[0].startswith("Línea 1 - Error inesperado: ")
+    assert ("Línea 4 - Variable 'a' definida con valor 1", None) in lines
+
+def test_write_console_lines_detiene_un_bucle_largo():
+    stop = threading.Event()
+    lines = []
+
+    def emit(item):
+        lines.append(item)
+        if len(lines) == 10:
+            stop.set()
+
+    interp = Interpreter()
+    write_console_lines("crear a = 1\nrepetir 1000000\ndecir a\nfin\ndecir a\n",
+                        interp, True, emit, stop)
+    assert len(lines) == 11
+    assert lines[-2] == ("Línea 2 - a = 1", None)
+    assert lines[-1] == ("Ejecución detenida.", "error")
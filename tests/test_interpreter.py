@@ -195,3 +195,9 @@ def test_poder_numero_variable():
     interp.eval_instruction("crear b = 3")
     result = interp.eval_instruction("poder 2 b")
     assert result == "Resultado: 8"
+
+def test_curar_con_literal():
+    interp = Interpreter()
+    interp.eval_instruction("crear vida = 100")
+    result = interp.eval_instruction("curar vida 25")
+    assert result == "Resultado: 125"
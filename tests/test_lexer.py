@@ -56,3 +56,37 @@ def test_lexer_case_insensitive_crear():
     assert tokens[1] == ("IDENTIFICADOR", "vida")
     assert tokens[2] == ("IGUAL", "=")
     assert tokens[3] == ("NUMERO", "100")
+
+def test_iter_tokens_es_perezoso():
+    lexer = Lexer()
+    gen = lexer.iter_tokens("jefe a b c")
+    assert next(gen) == ("KEYWORD", "jefe")
+    assert list(gen) == [
+        ("IDENTIFICADOR", "a"),
+        ("IDENTIFICADOR", "b"),
+        ("IDENTIFICADOR", "c")
+    ]
+
+def test_tokenize_cadena_con_espacios():
+    lexer = Lexer()
+    tokens = lexer.tokenize('crear nombre = "Juan Pérez"')
+    assert tokens[3] == ("CADENA", "Juan Pérez")
+
+def test_tokenize_palabras_mixtas():
+    lexer = Lexer()
+    tokens = lexer.tokenize("12abc -5 3.5x == daño")
+    assert tokens == [
+        ("DESCONOCIDO", "12abc"),
+        ("NUMERO", "-5"),
+        ("DESCONOCIDO", "3.5x"),
+        ("DESCONOCIDO", "=="),
+        ("IDENTIFICADOR", "daño")
+    ]
+
+def test_tokenize_igual_al_lexer_anterior():
+    from benchmarks.bench_lexer import LegacyLexer, make_script
+    lexer = Lexer()
+    legacy = LegacyLexer()
+    lines = make_script(20000) + ['"a"b', '"abierta x', 'x"y z"', '""', "=5"]
+    for line in lines:
+        assert lexer.tokenize(line) == legacy.tokenize(line)
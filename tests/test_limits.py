@@ -0,0 +1,103 @@
+import time
+import pytest
+from interprete.interpreter import Interpreter, InterpreterError, ResourceLimitError
+from interprete.limits import Limits
+
+def test_sin_limites_por_defecto():
+    interp = Interpreter()
+    assert interp.limits is None
+    assert interp.eval_instruction("poder 2 5000").startswith("Resultado: ")
+
+def test_limite_de_instrucciones():
+    interp = Interpreter(limits=Limits(max_instructions=3))
+    program = interp.compile("crear a = 1\ncurar a 1\ncurar a 2\ncurar a 3\n", optimize=False)
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.run(program)
+    assert exc.value.limit == "max_instructions"
+    assert exc.value.line == 4
+    assert isinstance(exc.value, InterpreterError)
+
+def test_limite_de_instrucciones_por_llamada():
+    interp = Interpreter(limits=Limits(max_instructions=2))
+    program = interp.compile("crear a = 1\ndecir a\n")
+    assert interp.run(program) == interp.run(program)
+
+def test_limite_de_bits_antes_de_calcular():
+    interp = Interpreter(limits=Limits(max_bits=10_000))
+    start = time.perf_counter()
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.eval_instruction("poder 9 99999999")
+    assert time.perf_counter() - start < 1
+    assert exc.value.limit == "max_bits"
+    assert "10000 bits" in str(exc.value)
+    assert interp.eval_instruction("poder 2 9999").startswith("Resultado: ")
+    assert interp.eval_instruction("poder 1 99999999") == "Resultado: 1"
+    assert interp.eval_instruction("poder 2 -3") == "Resultado: 0.125"
+
+def test_limite_de_bits_en_manejador_rapido_y_multiplicar():
+    interp = Interpreter(limits=Limits(max_bits=64))
+    program = interp.compile("crear a = 4294967296\ncrear b = a\nmultiplicar a b\n"
+                             "multiplicar a 4294967296\npoder a 3\n", optimize=False)
+    assert program.instructions[2].handler.__name__.startswith("_fast")
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.run(program)
+    assert exc.value.line == 3
+    assert interp.eval_instruction("multiplicar 4294967295 4294967295").startswith("Resultado")
+
+def test_limite_de_bits_en_el_borde():
+    interp = Interpreter(limits=Limits(max_bits=64))
+    program = interp.compile("crear a = 2\ncrear b = 63\npoder a b\ncrear c = 64\npoder a c\n",
+                             optimize=False)
+    assert program.instructions[2].handler.__name__.startswith("_fast")
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.run(program)
+    assert exc.value.line == 5
+    assert interp.eval_instruction("poder 2 63") == f"Resultado: {2 ** 63}"
+    assert interp.eval_instruction("poder -2 63") == f"Resultado: {-2 ** 63}"
+    assert interp.eval_instruction("poder 3 40") == f"Resultado: {3 ** 40}"
+    for source in ("poder 2 64", "poder -2 64", "poder 3 41",
+                   "multiplicar 4294967296 4294967296"):
+        with pytest.raises(ResourceLimitError):
+            interp.eval_instruction(source)
+    assert interp.eval_instruction("multiplicar 4294967295 4294967295").startswith("Resultado")
+
+def test_limite_de_cadena():
+    interp = Interpreter(limits=Limits(max_string=5))
+    interp.eval_instruction('crear corto = "hola"')
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.eval_instruction('crear largo = "demasiado largo"')
+    assert exc.value.limit == "max_string"
+    with pytest.raises(ResourceLimitError):
+        interp.eval_instruction("crear nombre = identificador")
+    assert "largo" not in interp.variables
+
+def test_limites_con_programa_optimizado_sin_limites():
+    # El plegado y las asignaciones muertas se calculan al compilar, sin
+    # límites; al ejecutar con límites se comprueban igual.
+    interp = Interpreter()
+    program = interp.compile('poder 3 2000\ncrear s = "demasiado largo"\ncrear s = 1\n')
+    assert len(program.report.folded) == 1 and len(program.report.dead_stores) == 1
+    interp.limits = Limits(max_bits=1000)
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.run(program)
+    assert (exc.value.limit, exc.value.line) == ("max_bits", 1)
+    interp.limits = Limits(max_string=5)
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.run(program)
+    assert (exc.value.limit, exc.value.line) == ("max_string", 2)
+    interp.limits = Limits(max_bits=4000, max_string=20)
+    assert interp.run(program)[-1] == "Variable 's' definida con valor 1"
+
+def test_tiempo_limite():
+    interp = Interpreter(limits=Limits(timeout=0.0))
+    program = interp.compile("\n".join(f"curar {i} 1" for i in range(200)), optimize=False)
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.run(program)
+    assert exc.value.limit == "timeout"
+    assert exc.value.line == 65
+
+def test_limites_no_cambian_resultados():
+    script = "crear a = 3\npoder a 20\nmultiplicar a a\ncrear s = \"hola\"\ndecir s\n"
+    expected = Interpreter().run(Interpreter().compile(script))
+    governed = Interpreter(limits=Limits(1000, 1000, 100, 10.0))
+    assert governed.run(governed.compile(script)) == expected
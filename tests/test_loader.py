@@ -0,0 +1,48 @@
+import mmap
+import pytest
+from interprete.cli import main
+from interprete.loader import mmap_lines
+
+@pytest.mark.parametrize("text", [
+    "crear a = 1\ndecir a\n",
+    "crear a = 1\ndecir a",
+    "crear a = 1\r\n\r\ndecir a\r\n",
+    'crear s = "ñandú"\n\n\ndecir s\n',
+    "\n",
+])
+def test_mmap_lines_igual_que_split(tmp_path, text):
+    path = tmp_path / "s.gamer"
+    path.write_bytes(text.encode("utf-8"))
+    expected = text.split("\n")
+    if text.endswith("\n"):
+        expected.pop()
+    assert list(mmap_lines(str(path))) == expected
+
+def test_mmap_lines_archivo_vacio(tmp_path):
+    path = tmp_path / "vacio.gamer"
+    path.write_bytes(b"")
+    assert list(mmap_lines(str(path))) == []
+
+def test_mmap_lines_libera_paginas(tmp_path):
+    lines = [f"crear v{i} = {i}" for i in range(5000)]
+    path = tmp_path / "grande.gamer"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    assert list(mmap_lines(str(path), window=mmap.PAGESIZE)) == lines
+
+def test_mmap_lines_utf8_invalido(tmp_path):
+    path = tmp_path / "mal.gamer"
+    path.write_bytes(b"crear a = 1\n\xff\n")
+    lines = mmap_lines(str(path))
+    assert next(lines) == "crear a = 1"
+    with pytest.raises(UnicodeDecodeError):
+        next(lines)
+
+def test_main_run_lee_con_mmap(tmp_path, capsys, monkeypatch):
+    path = tmp_path / "s.gamer"
+    path.write_text("crear a = 2\r\npoder a 3\r\n", encoding="utf-8")
+    opened = []
+    import interprete.cli as cli
+    monkeypatch.setattr(cli, "mmap_lines", lambda p: opened.append(p) or mmap_lines(p))
+    assert main(["run", str(path)]) == 0
+    assert opened == [str(path)]
+    assert capsys.readouterr().out == "Variable 'a' definida con valor 2\nResultado: 8\n"
@@ -0,0 +1,134 @@
+import io
+import pytest
+from interprete.cli import run_stream
+from interprete.compiler import group_blocks
+from interprete.interpreter import Interpreter, InterpreterError, ResourceLimitError
+from interprete.limits import Limits
+
+def _unrolled(count, body):
+    return "\n".join(body * count)
+
+def test_repetir_equivale_al_script_desenrollado():
+    body = ["crear a = 3", "multiplicar a 2", "decir a"]
+    interp = Interpreter()
+    results = interp.run(interp.compile("repetir 4\n" + "\n".join(body) + "\nfin\n"))
+    expected = Interpreter().run(Interpreter().compile(_unrolled(4, body)))
+    assert results == expected + ["Bloque repetido 4 veces"]
+
+def test_repetir_cuenta_desde_variable_y_cero_vueltas():
+    interp = Interpreter()
+    program = interp.compile("crear n = 0\nrepetir n\ndecir n\nfin\n")
+    assert interp.run(program) == ["Variable 'n' definida con valor 0",
+                                   "Bloque repetido 0 veces"]
+
+def test_repetir_anidado():
+    interp = Interpreter()
+    program = interp.compile("crear x = 1\nrepetir 3\nrepetir 2\ndecir x\nfin\nfin\n")
+    results = interp.run(program, "result")
+    assert [r.command for r in results].count("decir") == 6
+    assert [(i.line, i.command) for i in program.walk()] == [
+        (1, "crear"), (2, "repetir"), (3, "repetir"), (4, "decir")]
+
+def test_repetir_modo_silencioso():
+    interp = Interpreter()
+    assert interp.run(interp.compile("crear x = 1\nrepetir 10\ncurar x 1\nfin"), "quiet") is None
+
+def test_errores_de_bloque():
+    with pytest.raises(InterpreterError) as exc:
+        Interpreter().compile("crear x = 1\nrepetir 2\ndecir x\n")
+    assert exc.value.line == 2
+    assert "Falta 'fin'" in str(exc.value)
+    with pytest.raises(InterpreterError) as exc:
+        Interpreter().compile("crear x = 1\nfin\n")
+    assert exc.value.line == 2
+    assert "'fin' sin bloque abierto" in str(exc.value)
+    with pytest.raises(InterpreterError, match="solo se puede usar en un script completo"):
+        Interpreter().evaluate("repetir 3")
+
+def test_cuenta_invalida():
+    with pytest.raises(InterpreterError, match="entero no negativo"):
+        Interpreter().compile("repetir -1\nfin\n")
+    with pytest.raises(InterpreterError, match="entero no negativo"):
+        Interpreter().compile('crear n = "tres"\nrepetir n\nfin\n')
+    interp = Interpreter()
+    program = interp.compile("repetir n\nfin\n")
+    interp.define_variable("n", 2.5)
+    with pytest.raises(InterpreterError, match="entero no negativo") as exc:
+        interp.run(program)
+    assert exc.value.line == 1
+
+def test_error_en_el_cuerpo_informa_su_linea():
+    interp = Interpreter()
+    program = interp.compile("crear x = 0\nrepetir 3\ndecir x\ndividir x 0\nfin\n")
+    with pytest.raises(InterpreterError, match="dividir por cero") as exc:
+        interp.run(program)
+    assert exc.value.line == 4
+
+def test_cuerpo_usa_manejadores_rapidos():
+    interp = Interpreter()
+    program = interp.compile('crear a = 2\ncrear b = 1\nrepetir 2\ncurar a 1\nxp b\n'
+                             'crear b = "texto"\nfin\n', optimize=False)
+    body = program.instructions[2].operands[1][1].instructions
+    assert body[0].handler.__name__ == "_fast_suma"
+    # b se reasigna dentro del cuerpo: en la segunda vuelta ya no es un número.
+    assert body[1].handler.__name__ == "_exec_abs"
+    with pytest.raises(InterpreterError, match="Solo se pueden operar números") as exc:
+        interp.run(program)
+    assert exc.value.line == 5
+
+def test_presupuesto_cuenta_cada_vuelta():
+    script = "crear x = 1\nrepetir 3\ncurar x 1\nxp x\nfin\ndecir x\n"
+    interp = Interpreter(limits=Limits(max_instructions=9))
+    assert len(interp.run(interp.compile(script))) == 9
+    interp = Interpreter(limits=Limits(max_instructions=8))
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.run(interp.compile(script))
+    assert exc.value.line == 6
+    interp = Interpreter(limits=Limits(max_instructions=5))
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.run(interp.compile(script))
+    assert exc.value.limit == "max_instructions"
+    assert exc.value.line == 4
+
+def test_tiempo_limite_dentro_del_bucle():
+    interp = Interpreter(limits=Limits(timeout=0.05))
+    program = interp.compile("crear x = 1\nrepetir 100000000\ncurar x 1\nfin\n")
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.run(program, "quiet")
+    assert exc.value.limit == "timeout"
+    assert exc.value.line == 3
+
+def test_perfilado_cuenta_el_cuerpo():
+    interp = Interpreter()
+    interp.enable_profiling()
+    interp.run(interp.compile("crear x = 1\nrepetir 4\ncurar x 1\nfin\n"))
+    assert interp.stats()["lines"][3] == 4
+
+def test_cache_conserva_los_bloques(tmp_path):
+    script = tmp_path / "bucle.gamer"
+    script.write_text("crear x = 2\nrepetir 2\nrepetir 2\npoder x 3\nfin\ndecir x\nfin\n",
+                      encoding="utf-8")
+    expected = Interpreter().run(Interpreter().compile_file(str(script)))
+    interp = Interpreter()
+    interp.define_variable("otro", 1)
+    cached = interp.compile_file(str(script))
+    assert [(i.line, i.command) for i in cached.walk()] == [
+        (1, "crear"), (2, "repetir"), (3, "repetir"), (4, "poder"), (6, "decir")]
+    assert interp.run(cached) == expected
+
+def test_group_blocks():
+    lines = ["crear x = 1", "", "REPETIR 2", "repetir 1", "decir x", "fin", "", "fin", "decir x"]
+    assert list(group_blocks(lines)) == [
+        (1, "crear x = 1", False),
+        (3, "REPETIR 2\nrepetir 1\ndecir x\nfin\n\nfin", True),
+        (9, "decir x", False),
+    ]
+
+def test_run_stream_con_bloques():
+    out, err = io.StringIO(), io.StringIO()
+    lines = ["crear x = 1", "repetir 2", "decir x", "fin", "repetir 1", "dividir x 0", "fin"]
+    errors = run_stream(lines, Interpreter(), out, err)
+    assert errors == 1
+    assert out.getvalue() == ("Variable 'x' definida con valor 1\n"
+                              "x = 1\nx = 1\nBloque repetido 2 veces\n")
+    assert "Línea 6 - Error" in err.getvalue()
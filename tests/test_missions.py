@@ -0,0 +1,137 @@
+import io
+import pytest
+from interprete import cache
+from interprete.cli import run_stream
+from interprete.interpreter import Interpreter, InterpreterError, ResourceLimitError
+from interprete.limits import Limits, MAX_CALL_DEPTH
+
+COPIA = "mision copia a\ncrear r = a\nregresar r\nfin\n"
+
+def _run(source, mode="text", **kwargs):
+    interp = Interpreter(**kwargs)
+    return interp, interp.run(interp.compile(source), mode)
+
+def test_definir_y_llamar():
+    interp, results = _run(COPIA + "crear x = 5\ncrear y = llamar copia x\nllamar copia 7\ndecir y\n")
+    assert results == ["Misión 'copia' definida", "Variable 'x' definida con valor 5",
+                       "Resultado: 5", "Resultado: 7", "y = 5"]
+    # Las variables de la misión son locales: no aparecen en el script.
+    assert dict(interp.variables) == {"x": 5, "y": 5}
+
+def test_llamada_sin_valor_de_regreso():
+    _, results = _run("mision nada\ncrear z = 1\nfin\nllamar nada\n", "result")
+    assert results[-1].text() == "Misión 'nada' completada"
+    assert results[-1].value is None
+    with pytest.raises(InterpreterError, match="no regresó ningún valor") as exc:
+        _run("mision nada\nfin\ncrear z = llamar nada\n")
+    assert exc.value.line == 3
+
+def test_regresar_dentro_de_un_bucle():
+    source = "mision primero n\nrepetir n\nregresar n\nfin\nregresar 0\nfin\n"
+    _, results = _run(source + "crear a = llamar primero 3\ncrear b = llamar primero 0\n", "result")
+    assert [r.value for r in results[1:]] == [3, 0]
+
+def test_recursion_y_llamadas_anidadas():
+    source = ("mision id v\nregresar v\nfin\n"
+              "mision envolver v\ncrear w = llamar id v\nregresar w\nfin\n"
+              "crear x = llamar envolver 4\ndecir x\n")
+    _, results = _run(source)
+    assert results[-1] == "x = 4"
+
+def test_errores_de_compilacion():
+    with pytest.raises(InterpreterError, match="solo se puede usar dentro de una misión"):
+        Interpreter().compile("regresar 1\n")
+    with pytest.raises(InterpreterError, match="parámetros repetidos"):
+        Interpreter().compile("mision f a a\nfin\n")
+    with pytest.raises(InterpreterError, match="dentro de otro bloque") as exc:
+        Interpreter().compile("repetir 2\nmision f\nfin\nfin\n")
+    assert exc.value.line == 2
+    with pytest.raises(InterpreterError, match="necesita 1 argumentos y recibió 2") as exc:
+        Interpreter().compile(COPIA + "llamar copia 1 2\n")
+    assert exc.value.line == 5
+    # El cuerpo no ve las variables del script.
+    with pytest.raises(InterpreterError, match="'x' no está definida"):
+        Interpreter().compile("crear x = 1\nmision f\ndecir x\nfin\n")
+
+def test_errores_de_ejecucion():
+    with pytest.raises(InterpreterError, match="'nadie' no está definida") as exc:
+        _run("llamar nadie 1\n")
+    assert exc.value.line == 1
+    with pytest.raises(InterpreterError, match="dividir por cero") as exc:
+        _run("mision f a\ndividir a 0\nfin\nllamar f 1\n")
+    assert exc.value.line == 2
+
+def test_profundidad_maxima():
+    source = "mision bucle n\ncrear r = llamar bucle n\nregresar r\nfin\nllamar bucle 1\n"
+    with pytest.raises(ResourceLimitError) as exc:
+        _run(source)
+    assert exc.value.limit == "max_depth"
+    assert str(MAX_CALL_DEPTH) in str(exc.value)
+    with pytest.raises(ResourceLimitError, match="profundidad máxima de 5"):
+        _run(source, limits=Limits(max_depth=5))
+
+def test_limite_de_llamadas_por_ejecucion():
+    source = COPIA + "repetir 4\nllamar copia 1\nfin\n"
+    interp = Interpreter(limits=Limits(max_calls=4))
+    program = interp.compile(source)
+    interp.run(program)
+    interp.run(program)
+    interp.limits = Limits(max_calls=3)
+    with pytest.raises(ResourceLimitError) as exc:
+        interp.run(program)
+    assert exc.value.limit == "max_calls"
+    assert exc.value.line == 6
+
+def test_presupuesto_cuenta_el_cuerpo():
+    source = COPIA + "llamar copia 1\nllamar copia 2\n"
+    # mision + 2 x (llamar + crear + regresar)
+    assert len(_run(source, limits=Limits(max_instructions=7))[1]) == 3
+    with pytest.raises(ResourceLimitError) as exc:
+        _run(source, limits=Limits(max_instructions=6))
+    assert exc.value.line == 3
+
+def test_marcos_reutilizados():
+    interp = Interpreter()
+    program = interp.compile(COPIA + "repetir 50\nllamar copia 1\nfin\n")
+    interp.run(program, "quiet")
+    assert len(interp._frames) == 1
+    assert interp._depth == 0
+
+def test_motor_python_igual_que_referencia():
+    source = COPIA + "crear x = 2\nrepetir 3\ncrear x = llamar copia x\ncurar x 1\nfin\ndecir x\n"
+    expected = _run(source, "text")[1]
+    assert _run(source, "text", backend="python")[1] == expected
+
+def test_reset_borra_las_misiones():
+    interp, _ = _run(COPIA)
+    interp.reset()
+    with pytest.raises(InterpreterError, match="no está definida"):
+        interp.run(interp.compile("llamar copia 1\n"))
+
+def test_cache_conserva_las_misiones(tmp_path):
+    script = tmp_path / "mision.gamer"
+    script.write_text(COPIA + "crear x = 3\ncrear y = llamar copia x\ndecir y\n", encoding="utf-8")
+    expected = Interpreter().run(Interpreter().compile_file(str(script)))
+    interp = Interpreter()
+    interp.define_variable("otro", 1)
+    cached = interp.compile_file(str(script))
+    assert [(i.line, i.command) for i in cached.walk()] == [
+        (1, "mision"), (2, "crear"), (3, "regresar"), (5, "crear"), (6, "llamar"), (7, "decir")]
+    assert interp.run(cached) == expected
+    assert "r" not in interp.symbols.names
+
+def test_run_stream_con_misiones():
+    out, err = io.StringIO(), io.StringIO()
+    lines = COPIA.splitlines() + ["crear y = llamar copia 8", "decir y"]
+    assert run_stream(lines, Interpreter(), out, err) == 0
+    assert out.getvalue() == "Misión 'copia' definida\nResultado: 8\ny = 8\n"
+
+def test_cache_con_mas_variables_locales_que_globales(tmp_path):
+    script = tmp_path / "locales.gamer"
+    script.write_text("mision f a\ncrear b = a\ncrear c = b\ncrear d = c\nregresar d\nfin\n"
+                      "crear x = llamar f 2\n", encoding="utf-8")
+    Interpreter().compile_file(str(script))
+    cached = Interpreter().compile_file(str(script))
+    assert cached.instructions[0].handler.__name__ == "_exec_definir_mision"
+    location = cache.cache_path(str(script))
+    assert cache.load(location, cache.source_key(script.read_bytes())) is not None
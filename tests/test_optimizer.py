@@ -0,0 +1,68 @@
+import pytest
+from benchmarks.generator import generate_program
+from interprete.interpreter import Interpreter, InterpreterError
+from interprete.optimizer import folded, reads, writes
+
+def run_both(source):
+    plain, opt = Interpreter(), Interpreter()
+    expected = plain.run(plain.compile(source, optimize=False))
+    program = opt.compile(source)
+    assert opt.run(program) == expected
+    assert dict(opt.variables) == dict(plain.variables)
+    return program.report
+
+def test_plegado_de_constantes():
+    report = run_both("multiplicar 3 4\npoder 2 10\ndividir 1 4\n")
+    assert [(line, value) for line, _, value in report.folded] == [(1, 12), (2, 1024), (3, 0.25)]
+
+def test_no_pliega_errores_ni_potencias_enormes():
+    interp = Interpreter()
+    program = interp.compile("poder 9 99999999\ndividir 1 0\n")
+    assert program.report.folded == []
+    with pytest.raises(InterpreterError) as exc:
+        interp.run(interp.compile("crear a = 1\ndividir 1 0\n"))
+    assert exc.value.line == 2
+
+def test_asignaciones_muertas():
+    report = run_both("crear x = 1\ncrear x = 2\ncrear y = 5\ncrear x = 3\ndecir x\n")
+    assert [line for line, _ in report.dead_stores] == [1, 2]
+
+def test_asignacion_leida_no_es_muerta():
+    report = run_both("crear x = 1\ncrear y = x\ncrear x = 2\ndecir y\n")
+    assert report.dead_stores == []
+
+def test_asignacion_antes_de_error_no_se_elimina():
+    source = "crear x = 1\ndecir z\ncrear x = 2\n"
+    interp = Interpreter()
+    program = interp.compile(source)
+    assert program.report.dead_stores == []
+    with pytest.raises(InterpreterError):
+        interp.run(program)
+    assert interp.variables == {"x": 1}
+
+def test_reutiliza_calculos_identicos():
+    report = run_both("crear a = 3\ncrear b = 4\npoder a b\njefe a b\npoder a b\n"
+                      "crear b = 5\npoder a b\n")
+    assert [(line, first) for line, _, first in report.reused] == [(5, 3)]
+
+def test_optimizacion_desactivable():
+    interp = Interpreter()
+    program = interp.compile("multiplicar 3 4", optimize=False)
+    assert program.report is None
+
+def test_resumen_del_informe():
+    interp = Interpreter()
+    summary = interp.compile("multiplicar 3 4\n").report.summary()
+    assert "Constantes plegadas: 1" in summary
+    assert "Línea 1" in summary
+
+def test_programas_generados_equivalentes():
+    for seed in range(5):
+        source = "\n".join(generate_program(400, seed=seed, identifiers=8))
+        run_both(source)
+
+def test_lecturas_y_escrituras_de_instrucciones_plegadas():
+    program = Interpreter().compile("crear x = 1\ncrear x = 2\nmultiplicar 3 4\ncrear y = x\n")
+    assert [folded(i) for i in program.instructions] == [True, False, True, False]
+    assert [reads(i) for i in program.instructions[:3]] == [[], [], []]
+    assert [writes(i) for i in program.instructions] == [None, 0, None, 1]
@@ -0,0 +1,122 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from interprete.interpreter import Interpreter, InterpreterError
+from interprete.limits import Limits
+from interprete.parallel import ParallelRunner, plan
+
+SCRIPT = (
+    "crear a = 3\n"
+    "crear b = 5\n"
+    "poder a 300\n"
+    "crear a = 7\n"
+    "poder a 300\n"
+    "multiplicar b b\n"
+    "repetir 2\n"
+    "crear b = a\n"
+    "poder b 200\n"
+    "fin\n"
+    "decir b\n"
+)
+
+def _runner(interp, **kwargs):
+    # heavy_bits bajo: las potencias del script se envían al pool.
+    return ParallelRunner(interp, ThreadPoolExecutor(2), heavy_bits=100, **kwargs)
+
+def _sequential(source, mode="text", optimize=False):
+    interp = Interpreter()
+    return interp, interp.run(interp.compile(source, optimize=optimize), mode)
+
+def test_mismos_resultados_y_estado_que_en_serie():
+    expected_interp, expected = _sequential(SCRIPT)
+    interp = Interpreter()
+    runner = _runner(interp)
+    assert runner.run(interp.compile(SCRIPT, optimize=False)) == expected
+    assert dict(interp.variables) == dict(expected_interp.variables)
+    assert runner.stats["offloaded"] == 2
+
+def test_modos_result_y_quiet():
+    expected = _sequential(SCRIPT, "result")[1]
+    interp = Interpreter()
+    program = interp.compile(SCRIPT)
+    results = _runner(interp).run(program, "result")
+    assert [(r.command, r.value) for r in results] == [(r.command, r.value) for r in expected]
+    assert _runner(interp).run(program, "quiet") is None
+    with pytest.raises(ValueError):
+        _runner(interp).run(program, "nada")
+
+def test_error_en_el_pool_deshace_las_asignaciones_siguientes():
+    # Con un solo hilo, `jefe` espera a la potencia: `crear x = 2` se
+    # ejecuta antes de que falle y hay que deshacerlo.
+    source = "crear x = 3\ncrear y = 2\npoder x 300000\njefe x y s\ncrear x = 2\nmultiplicar x 4\n"
+    expected_interp = Interpreter()
+    expected_interp.define_variable("s", "hola")
+    with pytest.raises(InterpreterError) as expected:
+        expected_interp.run(expected_interp.compile(source, optimize=False))
+    interp = Interpreter()
+    interp.define_variable("s", "hola")
+    runner = ParallelRunner(interp, ThreadPoolExecutor(1), max_pending=4, heavy_bits=100,
+                            heavy_items=2)
+    with pytest.raises(InterpreterError) as exc:
+        runner.run(interp.compile(source, optimize=False))
+    assert (exc.value.line, str(exc.value)) == (expected.value.line, str(expected.value))
+    assert exc.value.line == 4
+    assert dict(interp.variables) == dict(expected_interp.variables) == {"s": "hola", "x": 3, "y": 2}
+    assert runner.stats["offloaded"] == 2
+
+def test_error_en_linea_espera_a_los_anteriores():
+    source = "crear x = 2\njefe x x s\ncrear y = x\ndecir z\n"
+    interp = Interpreter()
+    interp.define_variable("s", "texto")
+    interp.define_variable("z", 1)
+    program = interp.compile(source, optimize=False)
+    interp.variables = {"s": "texto"}
+    runner = ParallelRunner(interp, ThreadPoolExecutor(1), heavy_items=2)
+    with pytest.raises(InterpreterError) as exc:
+        runner.run(program)
+    # El error de la línea 2 (en el pool) ocurre antes que el de la línea 4.
+    assert exc.value.line == 2
+    assert "y" not in interp.variables
+
+def test_plan_de_escrituras():
+    interp = Interpreter()
+    program = interp.compile("mision f a\nregresar a\nfin\ncrear x = 1\npoder x 2\n"
+                             "repetir 2\ncrear y = llamar f x\nfin\ndecir x\n", optimize=False)
+    slots = interp.symbols.slots
+    assert plan(program) == [(False, None), (False, (slots["x"],)), (True, ()),
+                             (False, (slots["y"],)), (False, ())]
+
+def test_reutilizados_por_el_optimizador_en_linea():
+    source = "crear a = 3\npoder a 300\npoder a 300\n"
+    interp = Interpreter()
+    runner = _runner(interp)
+    assert runner.run(interp.compile(source)) == _sequential(source, optimize=True)[1]
+    assert runner.stats["offloaded"] == 0
+
+def test_con_limites_en_serie():
+    interp = Interpreter(limits=Limits(max_instructions=100))
+    runner = _runner(interp)
+    assert runner.run(interp.compile(SCRIPT)) == _sequential(SCRIPT)[1]
+    assert runner.stats["offloaded"] == 0
+
+def test_pool_de_procesos():
+    source = "crear a = 3\npoder a 100000\npoder a 100001\ndecir a\n"
+    interp = Interpreter()
+    with ParallelRunner(interp, heavy_bits=1000) as runner:
+        results = runner.run(interp.compile(source), "result")
+    assert [r.value for r in results[1:3]] == [3 ** 100000, 3 ** 100001]
+    assert runner.stats["offloaded"] == 2
+
+def test_asignacion_muerta_con_pendientes():
+    # El optimizador reemplaza `crear x = 1` por su resultado mientras la
+    # potencia está en el pool.
+    source = "crear a = 3\npoder a 200000\ncrear x = 1\ncrear x = 2\ndecir x\n"
+    interp = Interpreter()
+    program = interp.compile(source)
+    runner = ParallelRunner(interp, ThreadPoolExecutor(1))
+    assert plan(program)[2] == (False, ())
+    results = runner.run(program, "result")
+    expected = _sequential(source, "result", optimize=True)[1]
+    assert [r.value for r in results] == [r.value for r in expected]
+    assert runner.stats["offloaded"] == 1
+    assert interp.variables["x"] == 2
@@ -0,0 +1,82 @@
+import json
+import pytest
+from interprete.interpreter import Interpreter, InterpreterError
+
+SCRIPT = "crear a = 2\ncrear b = 10\npoder a b\npoder a b\ndecir a\n"
+
+def test_stats_sin_perfilado():
+    interp = Interpreter()
+    with pytest.raises(InterpreterError):
+        interp.stats()
+
+def test_perfilado_run_cuenta_comandos_y_lineas():
+    interp = Interpreter()
+    interp.enable_profiling()
+    interp.run(interp.compile(SCRIPT))
+    stats = interp.stats()
+    assert stats["commands"]["poder"]["calls"] == 2
+    assert stats["commands"]["crear"]["calls"] == 2
+    assert stats["lines"] == {1: 1, 2: 1, 3: 1, 4: 1, 5: 1}
+    assert stats["stages"]["lex"]["calls"] == 5
+    assert stats["stages"]["parse"]["calls"] == 5
+    assert stats["stages"]["execute"]["calls"] == 5
+
+def test_perfilado_eval_instruction_por_texto():
+    interp = Interpreter()
+    interp.enable_profiling()
+    interp.eval_instruction("crear a = 1")
+    interp.eval_instruction("crear a = 1")
+    stats = interp.stats()
+    assert stats["lines"] == {"crear a = 1": 2}
+    # La segunda llamada usa la caché: solo se compila una vez.
+    assert stats["stages"]["lex"]["calls"] == 1
+
+def test_desactivar_conserva_contadores():
+    interp = Interpreter()
+    interp.enable_profiling()
+    interp.eval_instruction("crear a = 1")
+    interp.disable_profiling()
+    interp.eval_instruction("decir a")
+    assert "decir" not in interp.stats()["commands"]
+    interp.reset_profiling()
+    assert interp.stats()["commands"] == {}
+
+def test_errores_tambien_se_miden():
+    interp = Interpreter()
+    interp.enable_profiling()
+    with pytest.raises(InterpreterError):
+        interp.eval_instruction("decir x")
+    assert interp.stats()["commands"]["decir"]["calls"] == 1
+
+def test_exportar_json_y_collapsed(tmp_path):
+    interp = Interpreter()
+    profiler = interp.enable_profiling()
+    interp.run(interp.compile(SCRIPT))
+    json_path = tmp_path / "perfil.json"
+    stacks_path = tmp_path / "perfil.folded"
+    profiler.write_json(str(json_path))
+    profiler.write_collapsed(str(stacks_path))
+    data = json.loads(json_path.read_text(encoding="utf-8"))
+    assert data["commands"]["poder"]["calls"] == 2
+    for line in stacks_path.read_text(encoding="utf-8").splitlines():
+        stack, weight = line.rsplit(" ", 1)
+        assert stack.startswith("gamer;")
+        assert int(weight) > 0
+
+def test_instrucciones_anidadas_sin_contar_dos_veces():
+    interp = Interpreter()
+    profiler = interp.enable_profiling()
+    interp.run(interp.compile("crear a = 3\nrepetir 200\npoder a 50\nfin\n"
+                              "mision f x\nregresar x\nfin\ncrear y = llamar f a\n"))
+    stats = interp.stats()
+    execute = stats["stages"]["execute"]
+    assert execute["calls"] == 205
+    assert execute["seconds"] == pytest.approx(sum(stats["stacks"].values()))
+    # El tiempo de `repetir` incluye el de su cuerpo; la etapa no lo suma dos veces.
+    assert execute["seconds"] < (stats["commands"]["repetir"]["seconds"]
+                                 + stats["commands"]["poder"]["seconds"])
+    assert stats["stacks"]["repetir;poder"] == pytest.approx(stats["commands"]["poder"]["seconds"])
+    stacks = {line.rsplit(" ", 1)[0] for line in profiler.collapsed_stacks()}
+    assert "gamer;execute;repetir;poder" in stacks
+    assert "gamer;execute;poder" not in stacks
+    assert "llamar;regresar" in stats["stacks"]
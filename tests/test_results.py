@@ -0,0 +1,45 @@
+import pytest
+from interprete.interpreter import Interpreter
+from interprete.results import Result
+
+def test_evaluate_devuelve_result():
+    interp = Interpreter()
+    interp.eval_instruction("crear a = 2")
+    result = interp.evaluate("poder a 10")
+    assert isinstance(result, Result)
+    assert result.command == "poder"
+    assert result.operands == (2, 10)
+    assert result.value == 1024
+    assert result.text() == "Resultado: 1024"
+
+def test_result_crear_y_decir():
+    interp = Interpreter()
+    created = interp.evaluate("crear vida = 100")
+    assert created.operands == ("vida",)
+    assert str(created) == "Variable 'vida' definida con valor 100"
+    assert str(interp.evaluate("decir vida")) == "vida = 100"
+
+def test_result_formatea_solo_bajo_demanda():
+    result = Result("curar", (1, 2), 3)
+    assert result._text is None
+    assert result.text() == "Resultado: 3"
+    assert result._text == "Resultado: 3"
+
+def test_run_modos():
+    interp = Interpreter()
+    program = interp.compile("crear a = 3\njefe a a")
+    assert interp.run(program) == ["Variable 'a' definida con valor 3", "Resultado: 3"]
+    results = interp.run(program, mode="result")
+    assert [r.value for r in results] == [3, 3]
+    assert all(r._text is None for r in results)
+    assert interp.run(program, mode="quiet") is None
+    with pytest.raises(ValueError):
+        interp.run(program, mode="otro")
+
+def test_run_quiet_no_formatea(monkeypatch):
+    def fail(self):
+        raise AssertionError("no debe formatear")
+    monkeypatch.setattr(Result, "text", fail)
+    interp = Interpreter()
+    interp.run(interp.compile("crear a = 9\npoder a 1000"), mode="quiet")
+    assert interp.variables["a"] == 9
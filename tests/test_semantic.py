@@ -72,3 +72,48 @@ def test_semantic_decir_variable_no_definida():
     semantic = SemanticAnalyzer()
     tokens = lexer.tokenize("decir mana")
     assert semantic.analyze(tokens) is True
+
+def _compile(source):
+    from interprete.compiler import Compiler
+    from interprete.interpreter import HANDLERS
+    return Compiler(HANDLERS).compile(source)
+
+def test_analyze_program_infiere_tipos():
+    program = _compile("crear a = 1\ncrear b = 2.5\ncrear c = a\ncrear n = \"Juan\"\ncurar a c")
+    info = SemanticAnalyzer().analyze_program(program)
+    assert info.types == {0: "int", 1: "float", 2: "int", 3: "str"}
+    assert info.scalar == [False, False, False, False, True]
+    assert info.errors == []
+
+def test_analyze_program_error_probado_con_linea():
+    program = _compile("crear n = \"Juan\"\ncrear m = n\n\ngolpear m 1")
+    info = SemanticAnalyzer().analyze_program(program)
+    assert info.errors == [(4, "Solo se pueden operar números.")]
+
+def test_analyze_program_variable_externa_desconocida():
+    program = _compile("crear a = b\ncurar a 1")
+    info = SemanticAnalyzer().analyze_program(program)
+    assert info.errors == []
+    assert info.scalar == [False, False]
+
+def test_analyze_program_fresh_identificador_como_cadena():
+    program = _compile("crear a = juan\ncurar a 1\ndecir z")
+    info = SemanticAnalyzer().analyze_program(program, fresh=True)
+    assert info.types[0] == "str"
+    assert info.errors == [(2, "Solo se pueden operar números."),
+                           (3, "La variable 'z' no está definida.")]
+
+def test_analyze_program_cuerpo_que_puede_no_ejecutarse():
+    body = "curar a 1\nfin\n"
+    for head in ("repetir 0\n", "crear n = 0\nrepetir n\n", "repetir m\n"):
+        program = _compile('crear a = "x"\n' + head + body)
+        assert SemanticAnalyzer().analyze_program(program).errors == []
+    program = _compile('crear a = "x"\nrepetir 2\n' + body)
+    assert SemanticAnalyzer().analyze_program(program).errors == [
+        (3, "Solo se pueden operar números.")]
+
+def test_compile_acepta_cuerpo_con_cero_vueltas():
+    from interprete.interpreter import Interpreter
+    interp = Interpreter()
+    program = interp.compile('crear a = "x"\nrepetir 0\ncurar a 1\nfin\n')
+    assert interp.run(program)[-1] == "Bloque repetido 0 veces"
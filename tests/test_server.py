@@ -0,0 +1,131 @@
+import asyncio
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from interprete.interpreter import ResourceLimitError
+from interprete.limits import Limits
+from interprete.server import SessionServer, is_heavy, BUSY_MESSAGE
+
+def _with_server(scenario, **options):
+    async def main():
+        server = SessionServer(**options)
+        listener = await server.start_tcp("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            return await scenario(server, port)
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+async def _send(port, lines):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write("".join(line + "\n" for line in lines).encode("utf-8"))
+    replies = [(await reader.readline()).decode("utf-8").rstrip("\n")
+               for line in lines if line.strip()]
+    writer.close()
+    return replies
+
+def test_respuestas_en_orden_con_envio_en_bloque():
+    async def scenario(server, port):
+        return await _send(port, ["crear a = 2", "", "poder a 10", "decir b", "decir a"])
+    assert _with_server(scenario) == [
+        "OK Variable 'a' definida con valor 2",
+        "OK Resultado: 1024",
+        "ERR La variable 'b' no está definida.",
+        "OK a = 2",
+    ]
+
+def test_sesiones_aisladas():
+    async def scenario(server, port):
+        first = await _send(port, ["crear vida = 100"])
+        second = await _send(port, ["decir vida"])
+        return first, second
+    first, second = _with_server(scenario)
+    assert first == ["OK Variable 'vida' definida con valor 100"]
+    assert second == ["ERR La variable 'vida' no está definida."]
+
+def test_sesiones_concurrentes():
+    async def scenario(server, port):
+        return await asyncio.gather(*(
+            _send(port, [f"crear x = {i}", "multiplicar x 2"]) for i in range(20)))
+    results = _with_server(scenario)
+    assert [r[1] for r in results] == [f"OK Resultado: {2 * i}" for i in range(20)]
+
+def test_instrucciones_costosas_al_ejecutor():
+    executor = ThreadPoolExecutor(2)
+    async def scenario(server, port):
+        replies = await _send(port, ["crear a = 3", "poder a 2000", "poder a 100000", "poder a 2"])
+        return replies, dict(server.stats)
+    replies, stats = _with_server(scenario, executor=executor, heavy_bits=1000)
+    executor.shutdown()
+    assert replies[1] == f"OK Resultado: {3 ** 2000}"
+    assert replies[2] == "ERR El resultado es demasiado grande para mostrarse."
+    assert replies[3] == "OK Resultado: 9"
+    assert stats["offloaded"] == 2
+
+def test_errores_de_python_no_cierran_la_sesion():
+    async def scenario(server, port):
+        return await _send(port, ["poder 0 -1", "crear a = 2.5", "poder a 100000", "decir a"])
+    replies = _with_server(scenario)
+    assert replies[0].startswith("ERR Error inesperado: ")
+    assert replies[2].startswith("ERR Error inesperado: ")
+    assert replies[3] == "OK a = 2.5"
+
+def test_limites_en_el_ejecutor():
+    executor = ThreadPoolExecutor(1)
+    async def scenario(server, port):
+        return await _send(port, ["poder 9 99999999"])
+    replies = _with_server(scenario, executor=executor, limits=Limits(max_bits=10_000))
+    executor.shutdown()
+    assert replies == ["ERR El resultado superaría el límite de 10000 bits."]
+
+def test_error_de_limite_se_puede_serializar():
+    error = pickle.loads(pickle.dumps(ResourceLimitError("x", "max_bits", 3)))
+    assert (str(error), error.limit, error.line) == ("x", "max_bits", 3)
+
+def test_is_heavy():
+    assert is_heavy("poder", (9, 99999999))
+    assert not is_heavy("poder", (2, 10))
+    assert not is_heavy("poder", (1, 10 ** 12))
+    assert is_heavy("jefe", tuple(range(20000)))
+    assert not is_heavy("crear", (1, 2))
+
+def test_sesion_inactiva_se_cierra():
+    async def scenario(server, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        reply = await asyncio.wait_for(reader.readline(), 5)
+        eof = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        return reply, eof, server.stats["evicted"], len(server.sessions)
+    reply, eof, evicted, sessions = _with_server(scenario, idle_timeout=0.05)
+    assert reply.decode("utf-8") == "ERR Sesión cerrada por inactividad.\n"
+    assert eof == b""
+    assert evicted == 1
+    assert sessions == 0
+
+def test_maximo_de_sesiones():
+    async def scenario(server, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"crear a = 1\n")
+        await reader.readline()
+        other_reader, other_writer = await asyncio.open_connection("127.0.0.1", port)
+        busy = await other_reader.readline()
+        writer.close()
+        other_writer.close()
+        return busy
+    assert _with_server(scenario, max_sessions=1).decode("utf-8") == BUSY_MESSAGE + "\n"
+
+def test_socket_unix(tmp_path):
+    path = str(tmp_path / "gamer.sock")
+    async def main():
+        server = SessionServer()
+        await server.start_unix(path)
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            writer.write(b"curar 1 2\n")
+            reply = await reader.readline()
+            writer.close()
+            return reply
+        finally:
+            await server.close()
+    assert asyncio.run(main()) == b"OK Resultado: 3\n"
@@ -0,0 +1,165 @@
+import asyncio
+import io
+import pytest
+from interprete import snapshot
+from interprete.cli import main, run_stream
+from interprete.interpreter import Interpreter
+from interprete.server import SessionServer
+from interprete.snapshot import AutoSnapshot
+
+np = pytest.importorskip("numpy")
+
+COPIA = "mision copia a\ncrear r = a\nregresar r\nfin\n"
+
+def _sample():
+    interp = Interpreter()
+    interp.run(interp.compile(COPIA))
+    values = {"a": 1, "b": -2.5, "c": True, "grande": 7 ** 100, "negativo": -(1 << 80),
+              "nombre": "Juan", "enteros": np.array([1, 2, 3]), "decimales": np.array([0.5])}
+    for name, value in values.items():
+        interp.define_variable(name, value)
+    return interp, values
+
+def test_ida_y_vuelta_de_todos_los_tipos():
+    interp, values = _sample()
+    restored = Interpreter()
+    snapshot.loads(restored, snapshot.dumps(interp))
+    state = dict(restored.variables)
+    assert list(state) == list(values)
+    for name, value in values.items():
+        if isinstance(value, np.ndarray):
+            assert state[name].tolist() == value.tolist()
+            assert state[name].dtype == value.dtype
+        else:
+            assert state[name] == value and type(state[name]) is type(value)
+    assert restored.run(restored.compile("crear x = llamar copia a\ndecir x\n")) == [
+        "Resultado: 1", "x = 1"]
+
+def test_restaurar_sobre_una_sesion_usada(tmp_path):
+    interp, _ = _sample()
+    path = str(tmp_path / "s.gms")
+    interp.snapshot(path)
+    other = Interpreter()
+    program = other.compile("crear z = 9\ndecir a\n")
+    other.run(other.compile("crear z = 9\n"))
+    other.restore(path)
+    # Las variables y misiones anteriores se reemplazan; el programa ya
+    # compilado sigue siendo válido con los slots conservados.
+    assert "z" not in other.variables
+    assert other.run(program) == ["Variable 'z' definida con valor 9", "a = 1"]
+
+def test_restaurar_no_afecta_a_los_fork():
+    interp, _ = _sample()
+    data = snapshot.dumps(interp)
+    child = interp.fork()
+    interp.define_variable("a", 50)
+    snapshot.loads(interp, data)
+    assert interp.get_variable("a") == 1
+    assert child.get_variable("a") == 1
+    snapshot.loads(child, data)
+    assert child.variables["nombre"] == "Juan"
+
+def test_muchas_variables_mediante_mmap(tmp_path):
+    interp = Interpreter()
+    interp.variables = {f"v{i}": i * 3 for i in range(5000)}
+    path = str(tmp_path / "muchas.gms")
+    interp.snapshot(path)
+    restored = Interpreter()
+    restored.restore(path)
+    assert dict(restored.variables) == dict(interp.variables)
+
+def test_imagenes_invalidas(tmp_path):
+    data = snapshot.dumps(_sample()[0])
+    with pytest.raises(ValueError, match="No es una instantánea"):
+        snapshot.loads(Interpreter(), b"GMRC" + data[4:])
+    with pytest.raises(ValueError, match="Versión de instantánea no soportada: 99"):
+        snapshot.loads(Interpreter(), data[:4] + (99).to_bytes(2, "little") + data[6:])
+    with pytest.raises(ValueError, match="dañada"):
+        snapshot.loads(Interpreter(), data[:-3])
+    empty = tmp_path / "vacia.gms"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        Interpreter().restore(str(empty))
+    with pytest.raises(OSError):
+        Interpreter().restore(str(tmp_path / "no_existe.gms"))
+
+def test_valor_no_serializable():
+    interp = Interpreter()
+    interp.define_variable("raro", object())
+    with pytest.raises(TypeError, match="'raro'"):
+        snapshot.dumps(interp)
+
+def test_auto_snapshot(tmp_path):
+    path = tmp_path / "auto.gms"
+    interp = Interpreter()
+    saver = AutoSnapshot(interp, str(path), interval=None, every=2)
+    out, err = io.StringIO(), io.StringIO()
+    run_stream(["crear a = 1", "crear b = 2", "crear c = 3"], interp, out, err, tick=saver.tick)
+    assert saver.saves == 1
+    restored = Interpreter()
+    restored.restore(str(path))
+    assert dict(restored.variables) == {"a": 1, "b": 2}
+    saver.save()
+    saver.save()
+    assert saver.saves == 2
+
+def test_main_run_con_instantanea(tmp_path, capsys):
+    first = tmp_path / "uno.gamer"
+    first.write_text(COPIA + "crear x = 4\n", encoding="utf-8")
+    second = tmp_path / "dos.gamer"
+    second.write_text("crear y = llamar copia x\ndecir y\n", encoding="utf-8")
+    image = str(tmp_path / "estado.gms")
+    assert main(["run", str(first), "--snapshot", image]) == 0
+    capsys.readouterr()
+    assert main(["run", str(second), "--restore", image]) == 0
+    assert capsys.readouterr().out.splitlines() == ["Resultado: 4", "y = 4"]
+    assert main(["run", str(second), "--restore", str(tmp_path / "falta.gms")]) == 1
+
+def test_servidor_retoma_sesiones_con_nombre(tmp_path):
+    async def talk(port, lines):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write("".join(line + "\n" for line in lines).encode("utf-8"))
+        replies = [(await reader.readline()).decode("utf-8").rstrip("\n") for _ in lines]
+        writer.close()
+        return replies
+
+    async def scenario():
+        server = SessionServer(snapshot_dir=str(tmp_path), snapshot_interval=0.01)
+        listener = await server.start_tcp("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            first = await talk(port, [":sesion partida", "crear vida = 80", ":sesion mal/nombre"])
+            while not (tmp_path / "partida.gms").exists():
+                await asyncio.sleep(0.01)
+        finally:
+            await server.close()
+        # Un servidor nuevo (como tras un reinicio) retoma la sesión.
+        server = SessionServer(snapshot_dir=str(tmp_path))
+        listener = await server.start_tcp("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            second = await talk(port, [":sesion partida", "decir vida"])
+        finally:
+            await server.close()
+        return first, second, server.stats["restored"]
+
+    first, second, restored = asyncio.run(scenario())
+    assert first[:2] == ["OK Sesión 'partida' nueva", "OK Variable 'vida' definida con valor 80"]
+    assert first[2].startswith("ERR Nombre de sesión no válido")
+    assert second == ["OK Sesión 'partida' restaurada", "OK vida = 80"]
+    assert restored == 1
+
+def test_servidor_sin_directorio_de_instantaneas():
+    async def scenario():
+        server = SessionServer()
+        listener = await server.start_tcp("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b":sesion a\n")
+            reply = (await reader.readline()).decode("utf-8")
+            writer.close()
+            return reply
+        finally:
+            await server.close()
+    assert asyncio.run(scenario()) == "ERR El servidor no guarda sesiones.\n"
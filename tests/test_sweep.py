@@ -0,0 +1,120 @@
+import io
+import json
+import pytest
+from interprete.cli import main
+from interprete.interpreter import Interpreter, InterpreterError
+from interprete.sweep import (SweepBatch, assigned_names, parse_value, read_bindings,
+                              sweep, write_csv, write_jsonl)
+
+SCRIPT = (
+    "crear vida = base\n"
+    "repetir turnos\n"
+    "crear ultimo = vida\n"
+    "fin\n"
+    "decir vida\n"
+)
+
+ROWS = [{"base": 10, "turnos": 2}, {"base": 5.5, "turnos": 0}, {"base": 1}]
+
+def _table(batches):
+    columns, errors = {}, []
+    for batch in batches:
+        for name, values in batch.columns.items():
+            columns.setdefault(name, []).extend(values)
+        errors.extend(batch.errors)
+    return columns, errors
+
+def test_columnas_por_defecto_y_decir():
+    columns, errors = _table(sweep(SCRIPT, ROWS, said=["vida"], workers=1))
+    assert columns == {"vida": [10, 5.5, None], "ultimo": [10, None, None],
+                       "decir:vida": [10, 5.5, None]}
+    assert errors[:2] == [None, None]
+    assert errors[2] == "Línea 2 - La variable 'turnos' no está definida."
+
+def test_cada_fila_empieza_sin_estado():
+    columns, _ = _table(sweep("crear x = y\n", [{"y": 1}, {}], workers=1))
+    # Sin `y`, el identificador se toma como texto.
+    assert columns["x"] == [1, "y"]
+
+def test_lotes_en_orden():
+    rows = [{"base": i, "turnos": 1} for i in range(10)]
+    batches = list(sweep(SCRIPT, rows, variables=["vida"], workers=1, batch_size=3))
+    assert [(b.start, len(b)) for b in batches] == [(0, 3), (3, 3), (6, 3), (9, 1)]
+    assert _table(batches)[0] == {"vida": list(range(10))}
+
+def test_con_procesos_igual_que_en_serie():
+    rows = [{"base": i, "turnos": i % 3} for i in range(40)]
+    expected = _table(sweep(SCRIPT, rows, said=["vida"], workers=1))
+    assert _table(sweep(SCRIPT, iter(rows), said=["vida"], workers=2, batch_size=7)) == expected
+
+def test_script_invalido_falla_antes_de_leer_filas():
+    def rows():
+        raise AssertionError("no se debe leer la entrada")
+        yield {}
+    with pytest.raises(InterpreterError) as exc:
+        list(sweep("curar a\n", rows(), workers=1))
+    assert exc.value.line == 1
+
+def test_read_bindings_formatos():
+    first, second = read_bindings(io.StringIO('a,b,c\n1,2.5,hola\n3,,"[1, 2]"\n'))
+    assert first == {"a": 1, "b": 2.5, "c": "hola"}
+    assert list(second) == ["a", "c"] and second["c"].tolist() == [1, 2]
+    assert list(read_bindings(io.StringIO('[{"a": 1}, {"b": "x"}]'), "json")) == [{"a": 1}, {"b": "x"}]
+    rows = list(read_bindings(io.StringIO('{"a": [1.5, 2]}\n\n{"a": 2}\n'), "jsonl"))
+    assert rows[0]["a"].tolist() == [1.5, 2.0] and rows[1] == {"a": 2}
+    with pytest.raises(ValueError):
+        list(read_bindings(io.StringIO("[1]"), "json"))
+    with pytest.raises(ValueError):
+        list(read_bindings(io.StringIO(""), "xml"))
+
+def test_nombres_en_minusculas():
+    # El lexer pasa los identificadores a minúsculas: `HP` es `hp`.
+    rows = list(read_bindings(io.StringIO("HP\n40\n")))
+    assert rows == [{"hp": 40}]
+    assert list(read_bindings(io.StringIO('{"Vida": 1}'), "jsonl")) == [{"vida": 1}]
+    columns, _ = _table(sweep("crear y = HP\ndecir HP\n", rows, variables=["Y"], said=["HP"], workers=1))
+    assert columns == {"y": [40], "decir:hp": [40]}
+    with pytest.raises(ValueError, match="no válido"):
+        list(read_bindings(io.StringIO("mi vida\n1\n")))
+
+def test_parse_value():
+    assert parse_value(" 7 ") == 7
+    assert parse_value("-1e3") == -1000.0
+    assert parse_value("Juan") == "Juan"
+
+def test_assigned_names():
+    program = Interpreter().compile(
+        "mision f v\ncrear local = v\nregresar local\nfin\n"
+        "crear a = 1\nrepetir 2\ncrear b = a\nfin\ncrear c = llamar f a\ncrear a = 2\n")
+    assert assigned_names(program) == ["a", "b", "c"]
+    # `crear x = 1` es una asignación muerta y el optimizador la reemplaza.
+    assert assigned_names(Interpreter().compile("crear x = 1\ncrear x = hp\n")) == ["x"]
+    columns, _ = _table(sweep("crear x = 1\ncrear x = hp\n", [{}], workers=1))
+    assert columns == {"x": ["hp"]}
+
+def test_escritores():
+    batch = SweepBatch(4, {"x": [1, None]}, [None, "Línea 1 - fallo"])
+    out = io.StringIO()
+    assert write_csv([batch], out) == 1
+    assert out.getvalue().splitlines() == ["fila,x,error", "4,1,", "5,,Línea 1 - fallo"]
+    out = io.StringIO()
+    assert write_jsonl([batch], out) == 1
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == [
+        {"fila": 4, "x": 1, "error": None}, {"fila": 5, "x": None, "error": "Línea 1 - fallo"}]
+
+def test_main_sweep(tmp_path, capsys):
+    script = tmp_path / "s.gamer"
+    inputs = tmp_path / "datos.csv"
+    script.write_text(SCRIPT, encoding="utf-8")
+    inputs.write_text("base,turnos\n3,1\n4,2\n", encoding="utf-8")
+    assert main(["sweep", str(script), str(inputs), "-j", "1", "--var", "vida",
+                 "--decir", "vida"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "fila,vida,decir:vida,error", "0,3,3,", "1,4,4,"]
+    inputs = tmp_path / "datos.jsonl"
+    inputs.write_text('{"base": 1}\n', encoding="utf-8")
+    output = tmp_path / "salida.jsonl"
+    assert main(["sweep", str(script), str(inputs), "-j", "1", "--var", "vida",
+                 "--output-format", "jsonl", "-o", str(output)]) == 1
+    row = json.loads(output.read_text(encoding="utf-8"))
+    assert row["vida"] is None and "turnos" in row["error"]
@@ -0,0 +1,53 @@
+from interprete.interpreter import Interpreter
+from interprete.symbols import SymbolTable, VariablesView, UNDEFINED
+
+def test_symbol_table_intern_estable():
+    table = SymbolTable()
+    assert table.intern("vida") == 0
+    assert table.intern("mana") == 1
+    assert table.intern("vida") == 0
+    assert table.names == ["vida", "mana"]
+    assert table.lookup("oro") is None
+
+def test_variables_view_como_diccionario():
+    table = SymbolTable()
+    values = []
+    view = VariablesView(table, values)
+    view["a"] = 1
+    view["b"] = 2
+    assert view == {"a": 1, "b": 2}
+    del view["a"]
+    assert "a" not in view
+    assert values[0] is UNDEFINED
+    assert list(view) == ["b"]
+
+def test_compile_resuelve_slots():
+    interp = Interpreter()
+    program = interp.compile("crear a = 1\ncurar a b")
+    assert program.instructions[1].operands == ((True, 0), (True, 1))
+
+def test_variables_asignables_por_compatibilidad():
+    interp = Interpreter()
+    interp.variables = {"x": 3}
+    assert interp.eval_instruction("decir x") == "x = 3"
+
+def test_reset_conserva_programas_compilados():
+    interp = Interpreter()
+    program = interp.compile("crear a = 1\ndecir a")
+    interp.run(program)
+    interp.reset()
+    assert interp.variables == {}
+    assert interp.run(program)[-1] == "a = 1"
+
+def test_crear_copia_o_literal():
+    interp = Interpreter()
+    interp.eval_instruction("crear a = 5")
+    assert interp.eval_instruction("crear b = a") == "Variable 'b' definida con valor 5"
+    assert interp.eval_instruction("crear c = juan") == "Variable 'c' definida con valor juan"
+
+def test_intern_all():
+    table = SymbolTable()
+    assert table.intern_all(["a", "b"]) == [0, 1]
+    assert table.lookup("b") == 1
+    assert table.intern_all(["c", "a"]) == [2, 0]
+    assert table.names == ["a", "b", "c"]
@@ -0,0 +1,49 @@
+from interprete.interpreter import Interpreter
+from interprete.lexer import Lexer
+from interprete.tokens import Token, TokenKind, as_tokens, as_tuples
+from interprete.validator import validate
+
+def test_token_compacto():
+    tokens = Lexer().tokenize("CREAR vida = -100")
+    assert [t.kind for t in tokens] == [TokenKind.KEYWORD, TokenKind.IDENTIFICADOR,
+                                        TokenKind.IGUAL, TokenKind.NUMERO]
+    assert [t.column for t in tokens] == [0, 6, 11, 13]
+    assert tokens[3].number == -100 and tokens[3].value == "-100"
+    assert tokens[0].number is None
+    assert not hasattr(tokens[0], "__dict__")
+
+def test_numeros_preconvertidos():
+    decimal, cadena = Lexer().tokenize('3.5 "12"')
+    assert decimal.number == 3.5 and isinstance(decimal.number, float)
+    assert cadena.kind is TokenKind.CADENA and cadena.number is None
+
+def test_identificadores_internados():
+    first = Lexer().tokenize("decir " + "".join(["vi", "da"]))[1]
+    second = Lexer().tokenize("curar vida 1")[1]
+    assert first.value is second.value
+
+def test_compatibilidad_con_tuplas():
+    token = Lexer().tokenize("crear")[0]
+    assert token == ("KEYWORD", "crear")
+    assert ("KEYWORD", "crear") == token
+    assert token != ("IDENTIFICADOR", "crear")
+    kind, value = token
+    assert (kind, value, token[0], token[1], len(token)) == ("KEYWORD", "crear", "KEYWORD", "crear", 2)
+    assert hash(token) == hash(("KEYWORD", "crear"))
+    assert as_tuples([token]) == [("KEYWORD", "crear")]
+
+def test_adaptador_de_tuplas():
+    tokens = as_tokens([("IDENTIFICADOR", "crear"), ("IDENTIFICADOR", "x"),
+                        ("IGUAL", "="), ("DECIMAL", "2.5")])
+    assert all(type(t) is Token for t in tokens)
+    assert tokens[3].number == 2.5
+    assert validate(tokens) == "crear"
+    assert validate([("KEYWORD", "decir"), ("IDENTIFICADOR", "x")]) == "decir"
+
+def test_compile_tokens_con_tuplas():
+    interp = Interpreter()
+    instr = interp.compile_tokens([("KEYWORD", "crear"), ("IDENTIFICADOR", "a"),
+                                   ("IGUAL", "="), ("NUMERO", "7")])
+    assert interp.execute(instr).text() == "Variable 'a' definida con valor 7"
+    assert interp._resolve_value(("NUMERO", "3")) == 3
+    assert interp._resolve_value(("IDENTIFICADOR", "a")) == 7
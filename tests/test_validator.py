@@ -0,0 +1,44 @@
+import pytest
+from interprete.lexer import Lexer
+from interprete.parser import Parser, ParserError
+from interprete.semantic import SemanticAnalyzer, SemanticError
+from interprete.validator import validate, ValidationError
+
+def test_validate_devuelve_comando():
+    lexer = Lexer()
+    assert validate(lexer.tokenize("jefe a b c")) == "jefe"
+
+def test_validate_vacio():
+    with pytest.raises(ValidationError):
+        validate([])
+
+def test_validate_no_reconocida():
+    lexer = Lexer()
+    with pytest.raises(ValidationError):
+        validate(lexer.tokenize("foo bar"))
+
+def test_validate_aridad():
+    lexer = Lexer()
+    with pytest.raises(ValidationError):
+        validate(lexer.tokenize("decir a b"))
+    with pytest.raises(ValidationError):
+        validate(lexer.tokenize("jefe"))
+
+def test_validate_tipo_en_variadico():
+    lexer = Lexer()
+    with pytest.raises(ValidationError):
+        validate(lexer.tokenize("esbirro a 5"))
+
+def test_curar_literal_igual_en_parser_y_semantico():
+    lexer = Lexer()
+    tokens = lexer.tokenize("curar vida 5")
+    assert Parser().parse(tokens) is True
+    assert SemanticAnalyzer().analyze(tokens) is True
+
+def test_errores_iguales_en_parser_y_semantico():
+    lexer = Lexer()
+    tokens = lexer.tokenize("revivir 5")
+    with pytest.raises(ParserError):
+        Parser().parse(tokens)
+    with pytest.raises(SemanticError):
+        SemanticAnalyzer().analyze(tokens)